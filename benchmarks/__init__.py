@@ -0,0 +1 @@
+"""Benchmarks of pykechain, run from the root of the repository, eg. `python -m benchmarks.memory`."""
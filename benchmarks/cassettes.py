@@ -0,0 +1,83 @@
+"""Payloads of KE-chain as recorded in the betamax cassettes of the test suite, to replay in benchmarks offline."""
+
+import base64
+import gzip
+import json
+import os
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pykechain.client_utils import api_resource
+
+CASSETTE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "cassettes"
+)
+API_URL = "<API_URL>/"
+
+
+def _response_json(body: Dict) -> Optional[Dict]:
+    """Decode the json of the body of a recorded response, None if it is not json."""
+    if body.get("base64_string"):
+        content = base64.b64decode(body["base64_string"])
+        if content[:2] == b"\x1f\x8b":
+            content = gzip.decompress(content)
+    else:
+        content = (body.get("string") or "").encode()
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+def iter_responses(directory: str = CASSETTE_DIR) -> Iterator[Tuple[str, Dict]]:
+    """Iterate over the `(resource, json)` of all recorded responses of KE-chain in the cassettes."""
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(directory, filename)) as f:
+            try:
+                cassette = json.load(f)
+            except ValueError:  # empty cassette
+                continue
+        for interaction in cassette.get("http_interactions", []):
+            resource = api_resource(API_URL, interaction["request"]["uri"])
+            if resource is None or interaction["response"]["status"]["code"] >= 300:
+                continue
+            data = _response_json(interaction["response"]["body"])
+            if isinstance(data, dict):
+                yield resource, data
+
+
+def load_payloads(
+    resources: List[str], directory: str = CASSETTE_DIR
+) -> Dict[str, List[Dict]]:
+    """
+    Collect the unique objects retrieved from the list endpoints of the resources in the cassettes.
+
+    :param resources: names of the resources in the `API_PATH`, eg. `parts`
+    :param directory: (optional) directory of the cassettes, defaults to the cassettes of the test suite
+    :return: dictionary with the list of json objects (unique on their id) per resource
+    """
+    payloads = defaultdict(dict)
+    for resource, data in iter_responses(directory):
+        if resource not in resources:
+            continue
+        for result in data.get("results") or []:
+            if isinstance(result, dict) and "id" in result:
+                payloads[resource][result["id"]] = result
+    return {resource: list(payloads[resource].values()) for resource in resources}
+
+
+def last_results(resource: str, directory: str = CASSETTE_DIR) -> Optional[List]:
+    """
+    Retrieve the results of the last recorded response of a resource in the cassettes.
+
+    :param resource: name of the resource in the `API_PATH`, eg. `versions`
+    :param directory: (optional) directory of the cassettes, defaults to the cassettes of the test suite
+    :return: the results of the response, None if the resource is not recorded
+    """
+    results = None
+    for recorded_resource, data in iter_responses(directory):
+        if recorded_resource == resource:
+            results = data.get("results")
+    return results
@@ -0,0 +1,102 @@
+"""
+Import time benchmark of pykechain.
+
+Measures the cumulative import time of pykechain as reported by `python -X importtime`, each in a fresh
+interpreter as is the case for every execution of a KE-chain service script. The heavy dependencies which
+are imported upon first use only (eg. `jsonschema` and the widget machinery) are listed when they are
+imported nonetheless.
+
+Usage::
+
+    python -m benchmarks.import_time --repeat 5 --max-ms 500
+
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict
+
+STATEMENTS = (
+    "import pykechain",
+    "from pykechain import Client",
+    "from pykechain import AsyncClient",
+)
+
+LAZY_MODULES = (
+    "asyncio",
+    "jsonschema",
+    "pytz",
+    "semver",
+    "pykechain.models.widgets.widget_models",
+    "pykechain.models.widgets.widgets_manager",
+)
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Run the statement in a fresh interpreter and return the cumulative import time (in us) per module.
+
+    Only the modules that are imported at the top level (not as a dependency of another module) are returned.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit() and not module.startswith("  "):
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def measure(statement: str, repeat: int) -> Dict:
+    """Return the fastest import time (in ms) of the statement and the lazy modules it imported."""
+    # modules imported during the startup of the interpreter are not part of the measurement
+    startup = import_times("pass")
+    totals = []
+    for _ in range(repeat):
+        times = import_times(statement)
+        totals.append(sum(t for m, t in times.items() if m not in startup))
+
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(' '.join(sys.modules))",
+        ],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    imported = set(process.stdout.split())
+    return {
+        "statement": statement,
+        "milliseconds": round(min(totals) / 1000, 1),
+        "lazy_modules_imported": [m for m in LAZY_MODULES if m in imported],
+    }
+
+
+def main():
+    """Run the benchmark and print the results as json, exits with status 1 when the maximum is exceeded."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    results = [measure(statement, args.repeat) for statement in STATEMENTS]
+    print(json.dumps(results, indent=2))
+
+    if args.max_ms is not None and any(
+        r["milliseconds"] > args.max_ms for r in results
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Materialization benchmark of the pykechain models.
+
+Replays the KE-chain payloads recorded in the cassettes of the test suite offline and measures the
+throughput (objects per second) and the memory allocated to create the models from the json, for:
+
+ * `Part` (including its properties)
+ * `Property.create`
+ * `Activity`
+ * `Widget.create`
+ * `Scope`
+ * `PartSet` of parts
+ * `_populate_cached_children` of parts
+
+The results are printed (or written) as json, such that they can be compared between releases.
+
+Usage::
+
+    python -m benchmarks.materialization --scale 10 --repeat 5 --output materialization.json
+
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.cassettes import last_results, load_payloads
+from pykechain import Client
+from pykechain.models import Activity, Part, PartSet, Property, Scope
+from pykechain.models.widgets import Widget
+
+FAKE_URL = "http://fake.kechain.test/"
+
+
+def measure(name: str, run: Callable[[], int], repeat: int) -> Dict:
+    """
+    Measure the fastest run of a benchmark and the memory it allocated.
+
+    :param name: name of the benchmark
+    :param run: function creating the objects, returning the number of objects created
+    :param repeat: number of times to time the run
+    :return: dictionary with the results of the benchmark
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        number = run()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "benchmark": name,
+        "objects": number,
+        "seconds": round(best, 6),
+        "objects_per_second": round(number / best) if best else None,
+        "peak_bytes": peak,
+    }
+
+
+def benchmarks(payloads: Dict[str, List[Dict]], client: Client) -> Dict[str, Callable]:
+    """Create the benchmarks on the payloads, each returning the number of objects created."""
+    parts_json = payloads["parts"]
+    properties_json = payloads["properties"]
+
+    def parts():
+        created = [Part(p, client=client) for p in parts_json]
+        for part in created:
+            part.properties  # noqa: B018, the properties are created on first access
+        return len(created)
+
+    def properties():
+        return len([Property.create(p, client=client) for p in properties_json])
+
+    def activities():
+        return len([Activity(a, client=client) for a in payloads["activities"]])
+
+    def widgets():
+        return len([Widget.create(w, client=client) for w in payloads["widgets"]])
+
+    def scopes():
+        return len([Scope(s, client=client) for s in payloads["scopes"]])
+
+    def partset():
+        return len(PartSet(Part(p, client=client) for p in parts_json))
+
+    created_parts = [Part(p, client=client) for p in parts_json]
+
+    def populate_cached_children():
+        created_parts[0]._populate_cached_children(created_parts, overwrite=True)
+        return len(created_parts)
+
+    return {
+        "Part": parts,
+        "Property.create": properties,
+        "Activity": activities,
+        "Widget.create": widgets,
+        "Scope": scopes,
+        "PartSet": partset,
+        "_populate_cached_children": populate_cached_children,
+    }
+
+
+def main():
+    """Run the benchmarks and print (or write) the results as json."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scale", type=int, default=10, help="number of copies of the payloads"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="file to write the results to")
+    args = parser.parse_args()
+
+    payloads = load_payloads(["parts", "properties", "activities", "widgets", "scopes"])
+    # the properties retrieved as part of the parts are replayed as well
+    payloads["properties"] += [
+        prop for part in payloads["parts"] for prop in part.get("properties") or []
+    ]
+    payloads = {resource: jsons * args.scale for resource, jsons in payloads.items()}
+
+    # the app versions and widget schemas are replayed as well, such that no request is made
+    client = Client(url=FAKE_URL)
+    client._app_versions = last_results("versions")
+    client._widget_schemas = last_results("widgets_schemas")
+
+    def offline(info):
+        raise RuntimeError(f"The benchmark should not request `{info.resource}`")
+
+    client.add_hook(before_send=offline)
+
+    results = {
+        "scale": args.scale,
+        "payloads": {resource: len(jsons) for resource, jsons in payloads.items()},
+        "benchmarks": [
+            measure(name, run, args.repeat)
+            for name, run in benchmarks(payloads, client).items()
+        ],
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Memory benchmark of the part models.
+
+Measures the memory allocated to create a large set of parts with properties, comparing the full
+:class:`Part` with the compact :class:`LightPart` (as returned by `Client.parts(light=True)`).
+The json retrieved from KE-chain is shared by both and excluded from the measurement.
+
+Usage::
+
+    python -m benchmarks.memory --parts 100000 --properties 5
+
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+import uuid
+from typing import Callable, Dict, List
+
+from pykechain.enums import Category, PropertyType
+from pykechain.models import LightPart, Part
+
+
+def part_json(nr_of_properties: int) -> Dict:
+    """Create the json of a part instance with properties, similar to the KE-chain response."""
+    part_id = str(uuid.uuid4())
+    return dict(
+        id=part_id,
+        name="Wheel",
+        ref="wheel",
+        description="",
+        created_at="2025-01-01T12:00:00.000000Z",
+        updated_at="2025-01-01T12:00:00.000000Z",
+        category=Category.INSTANCE,
+        classification="PRODUCT",
+        parent_id=str(uuid.uuid4()),
+        model_id=str(uuid.uuid4()),
+        scope_id=str(uuid.uuid4()),
+        multiplicity="ZERO_MANY",
+        properties=[
+            dict(
+                id=str(uuid.uuid4()),
+                name=f"Property {order}",
+                ref=f"property-{order}",
+                description="",
+                category=Category.INSTANCE,
+                property_type=PropertyType.CHAR_VALUE,
+                value="value",
+                value_options={},
+                output=False,
+                order=order,
+                part_id=part_id,
+                model_id=str(uuid.uuid4()),
+                unit=None,
+            )
+            for order in range(nr_of_properties)
+        ],
+    )
+
+
+def measure(create: Callable[[Dict], object], payloads: List[Dict]) -> int:
+    """Return the number of bytes allocated by the objects created from the payloads."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [create(payload) for payload in payloads]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    """Run the benchmark and print the results as json."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--parts", type=int, default=10000)
+    parser.add_argument("--properties", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = [part_json(args.properties) for _ in range(args.parts)]
+
+    def full_part(payload):
+        part = Part(payload, client=None)
+        part.properties  # noqa: B018, the properties are created on first access
+        return part
+
+    def light_part(payload):
+        part = LightPart(payload, client=None)
+        part.properties  # noqa: B018
+        return part
+
+    results = {
+        "parts": args.parts,
+        "properties_per_part": args.properties,
+        "part_bytes": measure(full_part, payloads),
+        "light_part_bytes": measure(light_part, payloads),
+    }
+    results["saving"] = round(
+        1 - results["light_part_bytes"] / results["part_bytes"], 3
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,26 @@
-"""A python library to connect and interact with KE-chain."""
+"""A python library to connect and interact with KE-chain.
+
+The clients and helpers are imported upon first access, such that `import pykechain` itself remains cheap.
+"""
+
+import importlib
 import sys
+from typing import TYPE_CHECKING
 
 from .__about__ import version
-from .client import Client
-from .helpers import get_project
 
-__all__ = ("Client", "get_project", "version")
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncClient  # noqa: F401
+    from .client import Client  # noqa: F401
+    from .helpers import get_project  # noqa: F401
+
+__all__ = ("AsyncClient", "Client", "get_project", "version")
+
+_lazy_attributes = {
+    "AsyncClient": ".async_client",
+    "Client": ".client",
+    "get_project": ".helpers",
+}
 
 if sys.version_info.major == 2 or (
     sys.version_info.major == 3 and sys.version_info.minor < 7
@@ -14,3 +29,17 @@ if sys.version_info.major == 2 or (
         "Python version >= `3.7` is required for this version of `pykechain` to operate. "
         "Please use `pykechain` version `3.x.x` for usage in combination with Python `3.6`"
     )
+
+
+def __getattr__(name: str):
+    """Import the clients and helpers of pykechain upon first access."""
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy_attributes[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of this module including the lazily imported ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,194 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from pykechain.client import Client
+from pykechain.defaults import ASYNC_MAX_CONCURRENCY
+from pykechain.models import AnyProperty, Part, PartSet
+from pykechain.models.activity import Activity
+from pykechain.models.input_checks import check_client, check_type
+
+T = TypeVar("T")
+
+
+class AsyncClient:
+    """Asyncio counterpart of the KE-chain :class:`Client`.
+
+    The `AsyncClient` provides the query methods of the :class:`Client` as coroutines, so these can be awaited
+    inside an asyncio application without blocking the event loop. The requests are performed by the
+    (synchronous) :class:`Client` in a pool of worker threads, each sending its requests with a session of its own,
+    while a semaphore bounds the number of requests in flight. The methods return the same pykechain models as the
+    :class:`Client`; the methods on those models are synchronous and use the underlying :class:`Client`.
+
+    .. versionadded:: 4.17
+
+    :ivar client: the :class:`Client` performing the requests
+    :ivar max_concurrency: maximum number of requests in flight at the same time
+
+    Example
+    -------
+    >>> async def retrieve_wheels(part_ids):
+    ...     async with AsyncClient(url='https://default.localhost:9443', max_concurrency=20) as client:
+    ...         client.login(token='<some-super-long-secret-token>')
+    ...         return await asyncio.gather(*(client.part(pk=pk) for pk in part_ids))
+
+    """
+
+    def __init__(
+        self,
+        url: str = "http://localhost:8000/",
+        check_certificates: Optional[bool] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        client: Optional[Client] = None,
+    ) -> None:
+        """Create an asynchronous KE-chain client.
+
+        :param url: the url of the KE-chain instance to connect to (defaults to http://localhost:8000)
+        :type url: basestring
+        :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
+        :type check_certificates: bool
+        :param max_concurrency: (optional) maximum number of requests in flight at the same time, defaults to 10
+        :type max_concurrency: int
+        :param client: (optional) an existing :class:`Client` to perform the requests with, instead of creating
+            a new one using the `url` and `check_certificates`
+        :type client: Client
+        """
+        check_type(max_concurrency, int, "max_concurrency")
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` should be at least 1")
+
+        if client is None:
+            client = Client(url=url, check_certificates=check_certificates)
+        self.client: Client = check_client(client)
+        self.client._mount_adapter(pool_maxsize=max_concurrency)
+
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="pykechain",
+            initializer=self._start_worker,
+        )
+        self._worker_ids: List[int] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke AsyncClient '{self.client.api_root}'>"
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @classmethod
+    def from_env(
+        cls,
+        env_filename: Optional[str] = None,
+        check_certificates: Optional[bool] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> "AsyncClient":
+        """Create an asynchronous client from environment variable settings, see :func:`Client.from_env`.
+
+        :param env_filename: filename of the environment file, defaults to '.env' in the local dir
+                                        (or parent dir)
+        :type env_filename: basestring
+        :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
+        :type check_certificates: bool
+        :param max_concurrency: (optional) maximum number of requests in flight at the same time, defaults to 10
+        :type max_concurrency: int
+        :return: :class:`pykechain.AsyncClient`
+        """
+        client = Client.from_env(
+            env_filename=env_filename, check_certificates=check_certificates
+        )
+        return cls(client=client, max_concurrency=max_concurrency)
+
+    def login(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> None:
+        """Login into KE-chain with either username/password or token, see :func:`Client.login`."""
+        self.client.login(username=username, password=password, token=token)
+
+    def close(self) -> None:
+        """Wait for the pending requests and release the worker threads and their sessions."""
+        self._executor.shutdown(wait=True)
+        # the adapters of the sessions are shared with the client, hence the sessions are not closed
+        for worker_id in self._worker_ids:
+            self.client._worker_sessions.pop(worker_id, None)
+        self._worker_ids.clear()
+
+    def _start_worker(self) -> None:
+        """Give the worker thread a session of its own."""
+        self.client._create_worker_session()
+        self._worker_ids.append(threading.get_ident())
+
+    async def run(self, method: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run any (blocking) pykechain method in a worker thread, bounded by the maximum concurrency.
+
+        Use this to await methods of the :class:`Client` or its models that are not provided as coroutine.
+
+        :param method: the method or function to run
+        :param args: positional arguments for the method
+        :param kwargs: keyword arguments for the method
+        :return: the result of the method
+
+        Example
+        -------
+        >>> bike = await client.part(name='Bike')
+        >>> wheels = await client.run(bike.children, name='Wheel')
+
+        """
+        if self._semaphore is None:
+            # created upon first use, such that the semaphore is bound to the running event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(method, *args, **kwargs)
+            )
+
+    #
+    # Query methods, mirroring the methods of the `Client`
+    #
+
+    async def parts(self, *args, **kwargs) -> PartSet:
+        """Retrieve multiple KE-chain parts, see :func:`Client.parts`."""
+        return await self.run(self.client.parts, *args, **kwargs)
+
+    async def part(self, *args, **kwargs) -> Part:
+        """Retrieve a single KE-chain part, see :func:`Client.part`."""
+        return await self.run(self.client.part, *args, **kwargs)
+
+    async def model(self, *args, **kwargs) -> Part:
+        """Retrieve a single KE-chain part model, see :func:`Client.model`."""
+        return await self.run(self.client.model, *args, **kwargs)
+
+    async def activities(self, *args, **kwargs) -> List[Activity]:
+        """Retrieve multiple KE-chain activities, see :func:`Client.activities`."""
+        return await self.run(self.client.activities, *args, **kwargs)
+
+    async def activity(self, *args, **kwargs) -> Activity:
+        """Retrieve a single KE-chain activity, see :func:`Client.activity`."""
+        return await self.run(self.client.activity, *args, **kwargs)
+
+    async def properties(self, *args, **kwargs) -> List[AnyProperty]:
+        """Retrieve multiple KE-chain properties, see :func:`Client.properties`."""
+        return await self.run(self.client.properties, *args, **kwargs)
+
+    async def property(self, *args, **kwargs) -> AnyProperty:
+        """Retrieve a single KE-chain property, see :func:`Client.property`."""
+        return await self.run(self.client.property, *args, **kwargs)
+
+    async def update_properties(self, properties: List[Dict]) -> List[AnyProperty]:
+        """Update multiple properties simultaneously, see :func:`Client.update_properties`."""
+        return await self.run(self.client.update_properties, properties)
+
+    async def _create_parts_bulk(self, parts: List[Dict], **kwargs) -> Any:
+        """Create multiple part instances simultaneously, see :func:`Client._create_parts_bulk`."""
+        return await self.run(self.client._create_parts_bulk, parts, **kwargs)
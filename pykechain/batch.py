@@ -0,0 +1,226 @@
+import threading
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from pykechain.defaults import API_EXTRA_PARAMS, PROPERTIES_BULK_UPDATE_CHUNK_SIZE
+from pykechain.exceptions import APIError, BulkUpdateError
+from pykechain.utils import get_in_chunks
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pykechain.client import Client
+    from pykechain.models import AnyProperty, Part
+
+# the active batch per client (by id), in the current thread or asyncio task. The batches are not stored on the
+# client itself, as a `ContextVar` cannot be copied along with the client.
+_active_batches: ContextVar[Optional[Dict[int, "Batch"]]] = ContextVar(
+    "pykechain_active_batches", default=None
+)
+
+
+def active_batch(client: "Client") -> Optional["Batch"]:
+    """Return the active batch of the client in the current thread (or asyncio task), None if there is none."""
+    return (_active_batches.get() or dict()).get(id(client))
+
+
+def _activate(batch: "Batch") -> Token:
+    """Make the batch the active batch of its client, returning the token to deactivate it again."""
+    batches = dict(_active_batches.get() or dict())
+    batches[id(batch.client)] = batch
+    return _active_batches.set(batches)
+
+
+class Batch:
+    """
+    Unit of work collecting updates of property values and parts, to send these to KE-chain at once.
+
+    While a batch is active (see `Client.batch()`), setting the value of a property, `Part.update()` and
+    `Part.edit()` do not send a request to KE-chain, but store the update in the batch. Multiple updates of
+    the same object are merged. When the batch is flushed, the parts are updated first, after which the
+    properties are updated using the bulk update of KE-chain, in chunks of `chunk_size` properties.
+
+    The parts and properties as updated in KE-chain are merged back into the objects that were updated.
+
+    .. versionadded:: 4.17
+
+    :ivar client: the client used to send the updates
+    :ivar properties: the pending updates of properties per property id
+    :ivar parts: the pending updates of parts per part id
+    """
+
+    def __init__(self, client: "Client"):
+        """
+        Create an empty batch.
+
+        :param client: the client used to send the updates
+        :type client: Client
+        """
+        self.client = client
+        self.properties: Dict[str, Dict] = dict()
+        self.parts: Dict[str, Dict] = dict()
+        self._instances: Dict[str, List] = dict()
+        self._lock = threading.RLock()
+
+    def __repr__(self):  # pragma: no cover
+        return (
+            f"<pyke {self.__class__.__name__} {len(self.parts)} parts, "
+            f"{len(self.properties)} properties>"
+        )
+
+    def __len__(self):
+        return len(self.parts) + len(self.properties)
+
+    def __getstate__(self):
+        # the lock cannot be copied, eg. along with the client holding the batch
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def _add(self, pending: Dict, pk: str, data: Dict, instance=None) -> None:
+        with self._lock:
+            pending.setdefault(pk, dict()).update(data)
+            if instance is not None:
+                instances = self._instances.setdefault(pk, [])
+                if not any(i is instance for i in instances):
+                    instances.append(instance)
+
+    def update_property(
+        self, pk: str, data: Dict, instance: Optional["AnyProperty"] = None
+    ) -> None:
+        """
+        Store an update of a property, eg. `dict(value=1)`.
+
+        :param pk: id of the property
+        :param data: the fields of the property to update
+        :param instance: (optional) the `Property` to merge the updated property into
+        """
+        self._add(self.properties, pk, data, instance=instance)
+
+    def update_part(
+        self, pk: str, data: Dict, instance: Optional["Part"] = None
+    ) -> None:
+        """
+        Store an update of a part, eg. `dict(name="Wheel")`.
+
+        :param pk: id of the part
+        :param data: the fields of the part to update
+        :param instance: (optional) the `Part` to merge the updated part into
+        """
+        self._add(self.parts, pk, data, instance=instance)
+
+    def clear(self) -> None:
+        """Discard all pending updates."""
+        with self._lock:
+            self.properties = dict()
+            self.parts = dict()
+            self._instances = dict()
+
+    def flush(
+        self,
+        chunk_size: int = PROPERTIES_BULK_UPDATE_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+        include_properties: bool = True,
+    ) -> None:
+        """
+        Send the pending updates to KE-chain.
+
+        The parts are updated one by one, the properties in chunks of `chunk_size` properties. With `max_workers`,
+        the requests are sent concurrently. When updates fail, these remain pending in the batch, such that
+        these can be sent again.
+
+        :param chunk_size: (optional) number of properties to update per request, defaults to 500
+        :type chunk_size: int
+        :param max_workers: (optional) number of requests to send concurrently (defaults to sequential)
+        :type max_workers: int or None
+        :param include_properties: (optional) send the updates of the properties as well, defaults to True.
+            If False, only the updates of the parts are sent and those of the properties remain pending.
+        :type include_properties: bool
+        :raises BulkUpdateError: if updates failed, with the error per id of the failed parts and properties
+        """
+        with self._lock:
+            parts, properties, instances = self.parts, self.properties, self._instances
+            self.clear()
+            if not include_properties:
+                self.properties, properties = properties, dict()
+                self._instances = {
+                    pk: instances[pk] for pk in self.properties if pk in instances
+                }
+
+        failed = dict()
+        for name, pending, chunks, update in (
+            ("parts", parts, [[pk] for pk in parts], self._update_part),
+            (
+                "properties",
+                properties,
+                list(get_in_chunks(list(properties), chunk_size)),
+                self._update_properties,
+            ),
+        ):
+            outcomes = self._send(pending, chunks, update, max_workers=max_workers)
+            for ids, (updated_jsons, error) in zip(chunks, outcomes):
+                if error is not None:
+                    # keep the failed updates pending, to be sent again
+                    for pk in ids:
+                        failed[pk] = error
+                        self._add(getattr(self, name), pk, pending[pk])
+                        self._instances[pk] = instances.get(pk, [])
+                for json in updated_jsons:
+                    for instance in instances.get(json.get("id"), []):
+                        instance.refresh(json=json)
+
+        if failed:
+            raise BulkUpdateError(
+                f"Could not update {len(failed)} of {len(parts) + len(properties)} objects, "
+                f"failed ids: {', '.join(failed)}",
+                response=next(iter(failed.values())).response,
+                failed=failed,
+            )
+
+    def _send(
+        self,
+        pending: Dict[str, Dict],
+        chunks: List[List[str]],
+        update: Callable[[List[Dict]], Tuple[List[Dict], Optional[APIError]]],
+        max_workers: Optional[int] = None,
+    ) -> List[Tuple[List[Dict], Optional[APIError]]]:
+        """Send the pending updates per chunk of ids, concurrently when `max_workers` is provided."""
+
+        def send_chunk(ids: List[str]) -> Tuple[List[Dict], Optional[APIError]]:
+            return update([dict(pending[pk], id=pk) for pk in ids])
+
+        if max_workers and max_workers > 1 and len(chunks) > 1:
+            with self.client._thread_pool(max_workers) as executor:
+                return list(executor.map(send_chunk, chunks))
+        return [send_chunk(ids) for ids in chunks]
+
+    def _update_part(
+        self, updates: List[Dict]
+    ) -> Tuple[List[Dict], Optional[APIError]]:
+        """Update a single part, returning the json of the updated part or the error."""
+        update = updates[0]
+        response = self.client._request(
+            "PUT",
+            self.client._build_url("part", part_id=update["id"]),
+            params=API_EXTRA_PARAMS["part"],
+            json=update,
+        )
+        if response.status_code != requests.codes.ok:
+            return [], APIError(
+                f"Could not update Part {update['id']}", response=response
+            )
+        return response.json()["results"], None
+
+    def _update_properties(
+        self, updates: List[Dict]
+    ) -> Tuple[List[Dict], Optional[APIError]]:
+        """Update a chunk of properties, returning the json of the updated properties or the error."""
+        try:
+            updated = self.client.update_properties(properties=updates)
+        except APIError as e:
+            return [], e
+        return [prop._json_data for prop in updated], None
@@ -1,16 +1,40 @@
 import datetime
+import threading
+import time
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import urljoin, urlparse
 
 import requests
 from envparse import env
-from requests.adapters import HTTPAdapter  # type: ignore
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter  # type: ignore
 
 from pykechain.defaults import (
     API_EXTRA_PARAMS,
     API_PATH,
+    BULK_CREATE_RETRIEVE_CHUNK_SIZE,
+    BULK_CREATE_RETRIEVE_MAX_WORKERS,
+    DISK_CACHE_TTL,
+    OBJECT_CACHE_MAX_SIZE,
+    OBJECT_CACHE_TTL,
     PARTS_BATCH_LIMIT,
+    PROPERTIES_BULK_UPDATE_CHUNK_SIZE,
     RETRY_BACKOFF_FACTOR,
     RETRY_ON_CONNECTION_ERRORS,
     RETRY_ON_READ_ERRORS,
@@ -54,6 +78,7 @@ from pykechain.models import (
     Activity,
     AnyProperty,
     Base,
+    LightPart,
     Part,
     PartSet,
     Property,
@@ -75,7 +100,15 @@ from pykechain.utils import (
     slugify_ref,
 )
 from .__about__ import version as pykechain_version
-from .client_utils import PykeRetry
+from .batch import Batch, _activate, _active_batches, active_batch
+from .client_utils import (
+    DiskCache,
+    ObjectCache,
+    PykeRetry,
+    RequestInfo,
+    api_resource,
+)
+from .jobs import Job
 from .models.banner import Banner
 from .models.context import Context
 from .models.expiring_download import ExpiringDownload
@@ -94,11 +127,15 @@ from .models.input_checks import (
     check_url,
     check_user,
     check_uuid,
+    compile_schema,
 )
 from .models.stored_file import StoredFile
 from .models.workflow import Workflow
 from .typing import ObjectID
 
+# guards growing the connection pools of the clients, see `Client._thread_pool()`
+_pool_lock = threading.Lock()
+
 
 class Client:
     """The KE-chain python client to connect to a KE-chain instance.
@@ -106,6 +143,12 @@ class Client:
     :ivar last_request: last executed request. Which is of type `requests.Request`_
     :ivar last_response: last executed response. Which is of type `requests.Response`_
     :ivar last_url: last called api url
+    :ivar object_cache: identity map of the retrieved objects, if enabled using `enable_object_cache()`
+    :ivar disk_cache: persistent cache of the widget schemas, if enabled using `enable_disk_cache()`
+    :ivar lazy_datetimes: when True, the `created_at` and `updated_at` of retrieved objects are only parsed
+        upon first access, speeding up the retrieval of many objects (defaults to False)
+    :ivar validate_widget_meta: when False, the meta of widgets retrieved from KE-chain is not validated
+        against the widget schema (defaults to True)
 
     .. _requests.Request: http://docs.python-requests.org/en/master/api/#requests.Request
     .. _requests.Response: http://docs.python-requests.org/en/master/api/#requests.Response
@@ -115,6 +158,8 @@ class Client:
         self,
         url: str = "http://localhost:8000/",
         check_certificates: Optional[bool] = None,
+        lazy_datetimes: bool = False,
+        validate_widget_meta: bool = True,
     ) -> None:
         """Create a KE-chain client with given settings.
 
@@ -122,6 +167,12 @@ class Client:
         :type url: basestring
         :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
         :type check_certificates: bool
+        :param lazy_datetimes: (optional) parse the `created_at` and `updated_at` of retrieved objects only
+            upon first access. Defaults to False
+        :type lazy_datetimes: bool
+        :param validate_widget_meta: (optional) validate the meta of widgets retrieved from KE-chain against
+            their widget schema. Defaults to True
+        :type validate_widget_meta: bool
 
         Examples
         --------
@@ -138,6 +189,8 @@ class Client:
             "PyKechain-Version": pykechain_version,
         }
         self.session: requests.Session = requests.Session()
+        # sessions of the worker threads of an `AsyncClient`, by thread identifier
+        self._worker_sessions: Dict[int, requests.Session] = dict()
 
         parsed_url = urlparse(url)
         if not (parsed_url.scheme and parsed_url.netloc):
@@ -154,6 +207,18 @@ class Client:
         self.last_url: Optional[str] = None
         self._app_versions: Optional[List[Dict]] = None
         self._widget_schemas: Optional[List[Dict]] = None
+        self._widget_schemas_by_type: Dict[str, Dict] = {}
+        self._widget_validators: Dict[str, Any] = {}
+        self.object_cache: Optional[ObjectCache] = None
+        self.disk_cache: Optional[DiskCache] = None
+        # the values stored for `Property.update_values()`, see `Property.set_bulk_update()`
+        self._update_batch: Optional[Batch] = None
+        self._before_send_hooks: Tuple[Callable[[RequestInfo], None], ...] = ()
+        self._after_receive_hooks: Tuple[Callable[[RequestInfo], None], ...] = ()
+        self.lazy_datetimes: bool = check_type(lazy_datetimes, bool, "lazy_datetimes")
+        self.validate_widget_meta: bool = check_type(
+            validate_widget_meta, bool, "validate_widget_meta"
+        )
 
         if check_certificates is None:
             check_certificates = env.bool(
@@ -163,19 +228,104 @@ class Client:
         if check_certificates is False:
             self.session.verify = False
 
-        # Retry implementation
+        self._mount_adapter()
+
+    def _mount_adapter(self, pool_maxsize: int = DEFAULT_POOLSIZE) -> None:
+        """
+        Mount the transport adapter with the retry implementation on the session.
+
+        :param pool_maxsize: maximum number of connections kept open per host, increase this when sending
+            many requests concurrently.
+        :type pool_maxsize: int
+        """
         adapter = HTTPAdapter(
+            pool_maxsize=pool_maxsize,
             max_retries=PykeRetry(
                 total=RETRY_TOTAL,
                 connect=RETRY_ON_CONNECTION_ERRORS,
                 read=RETRY_ON_READ_ERRORS,
                 redirect=RETRY_ON_REDIRECT_ERRORS,
                 backoff_factor=RETRY_BACKOFF_FACTOR,
-            )
+            ),
         )
         self.session.mount("https://", adapter=adapter)
         self.session.mount("http://", adapter=adapter)
 
+    def _thread_pool(self, max_workers: int) -> ThreadPoolExecutor:
+        """
+        Create a pool of `max_workers` threads to send requests concurrently.
+
+        The connection pools of the session are grown to `max_workers` connections first, otherwise the connections
+        in excess of the pool size are discarded after every request and connecting again is slow.
+
+        :param max_workers: number of threads
+        :type max_workers: int
+        :return: the thread pool
+        :rtype: ThreadPoolExecutor
+        """
+        with _pool_lock:
+            for adapter in set(self.session.adapters.values()):
+                # other adapters, eg. of tests, have no connection pool
+                if (
+                    isinstance(adapter, HTTPAdapter)
+                    and adapter._pool_maxsize < max_workers
+                ):
+                    # the requests in flight return their connections to the replaced pool, which discards them
+                    adapter.poolmanager.clear()
+                    adapter.init_poolmanager(
+                        adapter._pool_connections,
+                        max_workers,
+                        block=adapter._pool_block,
+                    )
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    def _create_worker_session(self) -> requests.Session:
+        """
+        Create a session of its own for the current thread, configured as the session of the client.
+
+        The requests of the current thread are sent using this session instead of the session of the client, as a
+        `requests.Session` is not thread-safe. The sessions share the transport adapters, whose connection pools are.
+
+        :return: the session of the current thread
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        for attribute in ("verify", "cert", "proxies", "trust_env", "max_redirects"):
+            setattr(session, attribute, getattr(self.session, attribute))
+        session.headers = self.session.headers.copy()
+        session.adapters = self.session.adapters.copy()
+        self._worker_sessions[threading.get_ident()] = session
+        return session
+
+    @contextmanager
+    def _without_retries(self, url: str) -> Iterator[None]:
+        """
+        Send the requests of the current thread to `url` without retrying them.
+
+        A request of which the body is produced while it is sent, such as a generator, can not be sent again by the
+        retry implementation of the transport adapter. Other transport adapters, eg. of tests, are left in place.
+
+        :param url: the url of the requests
+        :type url: str
+        """
+        session = self._thread_session
+        if not isinstance(session.get_adapter(url), HTTPAdapter):
+            yield
+            return
+
+        adapter = HTTPAdapter(max_retries=0)
+        session.mount(url, adapter)
+        try:
+            yield
+        finally:
+            del session.adapters[url]
+            adapter.close()
+
+    @property
+    def _thread_session(self) -> requests.Session:
+        """The session to send the requests of the current thread with."""
+        return self._worker_sessions.get(threading.get_ident(), self.session)
+
     def __del__(self):
         """Destroy the client object."""
         self.session.close()
@@ -223,6 +373,9 @@ class Client:
             KECHAIN_SCOPE=...
             KECHAIN_SCOPE_ID=...
 
+            # optional cache the widget schemas of KE-chain on disk
+            KECHAIN_CACHE_DIR=...
+
         >>> client = Client().from_env()
 
         """
@@ -247,6 +400,9 @@ class Client:
                 password=env(KechainEnv.KECHAIN_PASSWORD),
             )
 
+        if env(KechainEnv.KECHAIN_CACHE_DIR, None):
+            client.enable_disk_cache(directory=env(KechainEnv.KECHAIN_CACHE_DIR))
+
         return client
 
     def login(
@@ -287,6 +443,174 @@ class Client:
             self.headers.pop("Authorization", None)
             self.auth = (username, password)
 
+    @contextmanager
+    def batch(
+        self,
+        chunk_size: int = PROPERTIES_BULK_UPDATE_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Batch]:
+        """
+        Collect the updates of property values and parts, and send these to KE-chain at the end of the block.
+
+        Within the block, setting the value of a property, `Part.update()` and `Part.edit()` of objects retrieved
+        by this client are stored in a :class:`pykechain.batch.Batch` instead of being sent to KE-chain. When the
+        block exits, the parts are updated and the properties are updated using the bulk update of KE-chain in
+        chunks of `chunk_size` properties. The updated parts and properties are merged into the objects.
+
+        The batch is scoped to this client and the current thread (or asyncio task), so concurrent jobs can each
+        use their own batch. A nested block joins the batch of the outer block. When the block raises an
+        exception, the pending updates are discarded.
+
+        .. versionadded:: 4.17
+
+        :param chunk_size: (optional) number of properties to update per request, defaults to 500
+        :type chunk_size: int
+        :param max_workers: (optional) number of requests to send concurrently (defaults to sequential)
+        :type max_workers: int or None
+        :return: the batch, as context manager
+        :raises BulkUpdateError: if updates failed, with the error per id of the failed parts and properties
+
+        Example
+        -------
+        >>> with client.batch():
+        ...     for wheel in client.parts(name="Wheel"):
+        ...         wheel.property("Diameter").value = 60
+        ...         wheel.edit(description="Updated")
+
+        """
+        check_type(chunk_size, int, "chunk_size")
+        outer = active_batch(self)
+        if outer is not None:
+            yield outer
+            return
+
+        batch = Batch(client=self)
+        token = _activate(batch)
+        try:
+            yield batch
+        except BaseException:
+            batch.clear()
+            raise
+        finally:
+            _active_batches.reset(token)
+        batch.flush(chunk_size=chunk_size, max_workers=max_workers)
+
+    @property
+    def current_batch(self) -> Optional[Batch]:
+        """The active batch of this client in the current thread (or asyncio task), None when not in a batch."""
+        return active_batch(self)
+
+    def enable_object_cache(
+        self,
+        max_size: Optional[int] = OBJECT_CACHE_MAX_SIZE,
+        ttl: Optional[float] = OBJECT_CACHE_TTL,
+    ) -> ObjectCache:
+        """
+        Enable the identity map of objects retrieved by this client.
+
+        When enabled, every object retrieved by this client is stored in the `object_cache` on its class and id.
+        The lazy accessors to related objects, such as :func:`Part.model()`, :attr:`Property.part` and
+        :attr:`Base.scope`, look up the related object in the cache before calling the KE-chain API. Objects that are
+        deleted using this client are removed from the cache.
+
+        .. versionadded:: 4.17
+
+        :param max_size: (optional) maximum number of objects in the cache (defaults to 10000), None for unbounded
+        :type max_size: int or None
+        :param ttl: (optional) time-to-live of the objects in seconds (defaults to 300), None to never expire
+        :type ttl: float or None
+        :return: the object cache
+        :rtype: ObjectCache
+
+        Example
+        -------
+        >>> client.enable_object_cache(max_size=50000, ttl=600)
+        >>> models = client.parts(category=Category.MODEL, scope_id=scope.id)
+        >>> for part in client.parts(scope_id=scope.id):
+        ...     model = part.model()  # no additional API call
+
+        """
+        self.object_cache = ObjectCache(max_size=max_size, ttl=ttl)
+        return self.object_cache
+
+    def disable_object_cache(self) -> None:
+        """Disable (and empty) the identity map of objects retrieved by this client."""
+        self.object_cache = None
+
+    def enable_disk_cache(
+        self,
+        directory: Optional[str] = None,
+        ttl: Optional[float] = DISK_CACHE_TTL,
+    ) -> DiskCache:
+        """
+        Enable the persistent cache of the widget schemas of KE-chain.
+
+        When enabled, the :attr:`widget_schemas` are stored on disk on the url of the KE-chain instance and the
+        versions of the backend. A new client for the same KE-chain instance, eg. in a short-lived script, then
+        reuses these instead of retrieving them from KE-chain again. The :attr:`app_versions` are always retrieved
+        from KE-chain, such that an upgrade of KE-chain is noticed right away.
+
+        .. versionadded:: 4.17
+
+        :param directory: (optional) directory to store the cache in. Defaults to the `KECHAIN_CACHE_DIR`
+            environment variable or otherwise `~/.cache/pykechain`
+        :type directory: basestring or None
+        :param ttl: (optional) time-to-live of the cached entries in seconds (defaults to 1 day), None to
+            never expire
+        :type ttl: float or None
+        :return: the disk cache
+        :rtype: DiskCache
+
+        Example
+        -------
+        >>> client = Client.from_env()
+        >>> client.enable_disk_cache(ttl=3600)
+
+        To retrieve the widget schemas anew
+
+        >>> client.invalidate_disk_cache()
+
+        """
+        self.disk_cache = DiskCache(directory=directory, ttl=ttl)
+        return self.disk_cache
+
+    def disable_disk_cache(self) -> None:
+        """Disable the persistent cache of the widget schemas, keeping the stored entries."""
+        self.disk_cache = None
+
+    def invalidate_disk_cache(self) -> None:
+        """Remove the cached widget schemas of this KE-chain instance from disk and memory."""
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(url=self.api_root)
+        self._app_versions = None
+        self._widget_schemas = None
+        self._widget_schemas_by_type = {}
+        self._widget_validators = {}
+
+    def _cached_object(self, cls: type, pk: Optional[ObjectID]) -> Optional[Base]:
+        """
+        Retrieve an object from the object cache, if enabled.
+
+        :param cls: class of the object, eg. `Part`
+        :param pk: id of the object
+        :return: the cached object or None if not found or when the cache is disabled.
+        """
+        if self.object_cache is None or pk is None:
+            return None
+        return self.object_cache.get(cls, pk)
+
+    def _uncache_objects(self, cls: type, pks: Iterable[Optional[ObjectID]]) -> None:
+        """
+        Remove deleted objects from the object cache, if enabled.
+
+        :param cls: class of the objects, eg. `Part`
+        :param pks: ids of the objects
+        """
+        if self.object_cache is None:
+            return
+        for pk in pks:
+            self.object_cache.discard(cls, pk)
+
     def _build_url(self, resource: str, **kwargs) -> str:
         """Build the correct API url.
 
@@ -297,16 +621,75 @@ class Client:
         """
         return urljoin(self.api_root, API_PATH[resource].format(**kwargs))
 
+    def add_hook(
+        self,
+        before_send: Optional[Callable[[RequestInfo], None]] = None,
+        after_receive: Optional[Callable[[RequestInfo], None]] = None,
+    ) -> None:
+        """
+        Register callbacks that are called for every request of this client to KE-chain.
+
+        Both callbacks receive a :class:`pykechain.client_utils.RequestInfo` with the method, url, name of the
+        resource in the `API_PATH`, headers and arguments of the request. The `before_send` callback is called
+        before the request is sent and may alter the request or provide a `response` to skip sending it. The
+        `after_receive` callback is called once the response is received, or the request failed, with the
+        `response`, `status_code`, `duration`, `request_size` and `response_size` of the request.
+
+        Hooks are called in the order they are registered, from the thread performing the request.
+
+        .. versionadded:: 4.17
+
+        :param before_send: (optional) callback called before sending a request
+        :type before_send: callable or None
+        :param after_receive: (optional) callback called after receiving a response
+        :type after_receive: callable or None
+
+        Example
+        -------
+        >>> durations = collections.defaultdict(list)
+        >>> def record(info):
+        ...     durations[info.resource].append(info.duration)
+        >>> client.add_hook(after_receive=record)
+
+        >>> def tag(info):
+        ...     info.headers["X-Request-Tag"] = "nightly-import"
+        >>> client.add_hook(before_send=tag)
+
+        """
+        if before_send is not None:
+            self._before_send_hooks += (before_send,)
+        if after_receive is not None:
+            self._after_receive_hooks += (after_receive,)
+
+    def remove_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        """
+        Remove a callback registered with :func:`add_hook`.
+
+        .. versionadded:: 4.17
+
+        :param hook: the `before_send` or `after_receive` callback to remove
+        :type hook: callable
+        :raises NotFoundError: if the callback is not registered
+        """
+        if hook not in self._before_send_hooks + self._after_receive_hooks:
+            raise NotFoundError(f"Hook '{hook}' is not registered on the client")
+        self._before_send_hooks = tuple(h for h in self._before_send_hooks if h != hook)
+        self._after_receive_hooks = tuple(
+            h for h in self._after_receive_hooks if h != hook
+        )
+
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
         """Perform the request on the API.
 
         It includes a default ForbiddenError check if the response came back as a 403.
         It stores the `last_response`, `last_request` and `last_url` on the Client object for
-        debugging reasons.
+        debugging reasons. When hooks are registered, see :func:`add_hook`, these are called
+        before sending and after receiving the request.
 
         :param method: the HTTP method or GET, POST, PUT, PATCH, DELETE
         :param url: the url to call
-        :param kwargs: additional arguments such as `params` (query params) and `json` data.
+        :param kwargs: additional arguments such as `params` (query params), `json` data and `headers`, which
+            are added to the headers of the client.
         :raises ForbiddenError: If the user is forbidden to perform the URL call.
         :returns: Response
         """
@@ -315,9 +698,13 @@ class Client:
             kwargs[
                 "allow_redirects"
             ] = False  # to prevent redirects on write action. Better check your URL first.
-        self.last_response = self.session.request(
-            method, url, auth=self.auth, headers=self.headers, **kwargs
-        )
+        headers = dict(self.headers, **kwargs.pop("headers", dict()))
+        if self._before_send_hooks or self._after_receive_hooks:
+            self.last_response = self._request_with_hooks(method, url, headers, kwargs)
+        else:
+            self.last_response = self._thread_session.request(
+                method, url, auth=self.auth, headers=headers, **kwargs
+            )
         self.last_request = self.last_response.request
         self.last_url = self.last_response.url
 
@@ -326,6 +713,39 @@ class Client:
 
         return self.last_response
 
+    def _request_with_hooks(
+        self, method: str, url: str, headers: Dict[str, str], kwargs: Dict[str, Any]
+    ) -> requests.Response:
+        """Perform the request on the API, calling the registered hooks before sending and after receiving."""
+        info = RequestInfo(
+            method=method,
+            url=url,
+            resource=api_resource(self.api_root, url),
+            headers=headers,
+            kwargs=kwargs,
+        )
+        for hook in self._before_send_hooks:
+            hook(info)
+
+        start = time.perf_counter()
+        try:
+            if info.response is None:
+                info.response = self._thread_session.request(
+                    info.method,
+                    info.url,
+                    auth=self.auth,
+                    headers=info.headers,
+                    **info.kwargs,
+                )
+            return info.response
+        except Exception as e:
+            info.exception = e
+            raise
+        finally:
+            info.duration = time.perf_counter() - start
+            for hook in self._after_receive_hooks:
+                hook(info)
+
     @property
     def app_versions(self) -> List[Dict]:
         """List of the versions of the internal KE-chain 'app' modules."""
@@ -345,6 +765,13 @@ class Client:
 
         return self._app_versions
 
+    @property
+    def _backend_version(self) -> str:
+        """Versions of all KE-chain apps combined in a single string, to identify the version of the backend."""
+        return ",".join(
+            f"{app.get('app')}={app.get('version')}" for app in self.app_versions
+        )
+
     @property
     def widget_schemas(self) -> Dict:
         """
@@ -365,11 +792,22 @@ class Client:
             raise NotImplementedError(
                 "Widget schemas is not implemented in KE-chain versions lower that 3.0"
             )
+        if not self._widget_schemas and self.disk_cache is not None:
+            self._widget_schemas = self.disk_cache.get(
+                self.api_root, "widget_schemas", version=self._backend_version
+            )
         if not self._widget_schemas:
             response = self._request("GET", self._build_url("widgets_schemas"))
             if response.status_code != requests.codes.ok:  # pragma: no cover
                 raise APIError("Could not retrieve widgets schemas.", response=response)
             self._widget_schemas = response.json().get("results")
+            if self.disk_cache is not None:
+                self.disk_cache.set(
+                    self.api_root,
+                    "widget_schemas",
+                    self._widget_schemas,
+                    version=self._backend_version,
+                )
 
         return self._widget_schemas
 
@@ -385,17 +823,39 @@ class Client:
         :raises APIError: When it could not retrieve the jsonschema from KE-chain
         :raises NotFoundError: When it could not find the correct schema
         """
-        check_enum(widget_type, WidgetTypes, "widget_type")
+        found = self._widget_schemas_by_type.get(widget_type)
+        if found is None:
+            check_enum(widget_type, WidgetTypes, "widget_type")
 
-        found = find(
-            self.widget_schemas, lambda ws: ws.get("widget_type") == widget_type
-        )
-        if not found:
-            raise NotFoundError(
-                f"Could not find a widget_schema for widget_type: `{widget_type}`"
+            found = find(
+                self.widget_schemas, lambda ws: ws.get("widget_type") == widget_type
             )
+            if not found:
+                raise NotFoundError(
+                    f"Could not find a widget_schema for widget_type: `{widget_type}`"
+                )
+            self._widget_schemas_by_type[widget_type] = found
         return found
 
+    def widget_validator(self, widget_type: str) -> Any:
+        """Precompiled jsonschema validator of the widget meta for widget type.
+
+        The validator is created once per widget type and cached in the client.
+
+        ..versionadded:: 4.17
+
+        :param widget_type: Type of the widget to return the validator for.
+        :type widget_type: basestring
+        :returns: jsonschema validator instance to validate the widget meta
+        :raises APIError: When it could not retrieve the jsonschema from KE-chain
+        :raises NotFoundError: When it could not find the correct schema
+        """
+        validator = self._widget_validators.get(widget_type)
+        if validator is None:
+            validator = compile_schema(self.widget_schema(widget_type))
+            self._widget_validators[widget_type] = validator
+        return validator
+
     def match_app_version(
         self,
         app: Optional[str] = None,
@@ -578,11 +1038,137 @@ class Client:
 
         return results[0]
 
+    def _retrieve_pages(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        object_name: str = "objects",
+    ) -> Iterator[List[Dict]]:
+        """
+        Retrieve the results of a paginated list endpoint, page by page.
+
+        This is the paginator used by all the list methods of the client. The first page is always retrieved
+        on its own. The remaining pages are retrieved by following the `next` link of every page, or when
+        `max_workers` is provided, by computing the `offset` of every remaining page from the `count` of the
+        first page and retrieving those pages concurrently using a pool of threads sharing the client session,
+        at most `max_workers` pages ahead of the page yielded. In both cases the pages are yielded in order.
+
+        :param url: url of the list endpoint
+        :type url: basestring
+        :param params: (optional) query parameters of the request
+        :type params: dict or None
+        :param limit: (optional) stop retrieving pages when this number of results is retrieved
+        :type limit: int or None
+        :param batch: (optional) page size, defaults to the page size of KE-chain (or the `limit` if lower)
+        :type batch: int or None
+        :param max_workers: (optional) number of pages to retrieve concurrently (defaults to sequential)
+        :type max_workers: int or None
+        :param object_name: name of the objects to retrieve, used in the error message
+        :type object_name: basestring
+        :return: iterator over the pages, each being a list of json dicts
+        :raises NotFoundError: if a page could not be retrieved
+        """
+        # if limit is provided and the batchsize is bigger than the limit, ensure that the
+        # batch size is maximised
+        if limit and (not batch or limit < batch):
+            batch = limit
+
+        params = dict(params or dict())
+        if batch:
+            params["limit"] = batch
+
+        response = self._request("GET", url, params=params)
+
+        if response.status_code != requests.codes.ok:  # pragma: no cover
+            raise NotFoundError(f"Could not retrieve {object_name}", response=response)
+
+        data = response.json()
+        nr_of_results = len(data["results"])
+        yield data["results"]
+
+        if not data.get("next"):
+            return
+
+        if max_workers and max_workers > 1 and data.get("count") is not None:
+            # the server may enforce a smaller page size than requested
+            page_size = nr_of_results or batch
+            total = min(data["count"], limit) if limit else data["count"]
+            offsets = iter(range(page_size, total, page_size))
+
+            def retrieve_page(offset: int) -> requests.Response:
+                return self._request("GET", url, params=dict(params, offset=offset))
+
+            with self._thread_pool(max_workers) as executor:
+                # at most `max_workers` pages are retrieved ahead, such that none are left to retrieve when the
+                # iteration over the pages is stopped early
+                futures = deque(
+                    executor.submit(retrieve_page, offset)
+                    for offset in islice(offsets, max_workers)
+                )
+                while futures:
+                    response = futures.popleft().result()
+                    for offset in islice(offsets, 1):
+                        futures.append(executor.submit(retrieve_page, offset))
+                    if response.status_code != requests.codes.ok:  # pragma: no cover
+                        raise NotFoundError(
+                            f"Could not retrieve {object_name}", response=response
+                        )
+                    results = response.json()["results"]
+                    if limit:
+                        results = results[: limit - nr_of_results]
+                    nr_of_results += len(results)
+                    yield results
+            return
+
+        while data["next"]:
+            # respect the limit if set to > 0
+            if limit and nr_of_results >= limit:
+                break
+            response = self._request("GET", data["next"])
+
+            if response.status_code != requests.codes.ok:  # pragma: no cover
+                raise NotFoundError(
+                    f"Could not retrieve {object_name}", response=response
+                )
+
+            data = response.json()
+            results = data["results"]
+            if limit:
+                results = results[: limit - nr_of_results]
+            nr_of_results += len(results)
+            yield results
+
+    def _count(self, resource: str, **params) -> int:
+        """
+        Retrieve the number of objects matching the query parameters using a light-weight request.
+
+        :param resource: the list endpoint of the objects, eg. `parts`
+        :type resource: basestring
+        :param params: the query parameters to filter on
+        :return: number of objects
+        :rtype: int
+        :raises NotFoundError: if the objects could not be retrieved
+        """
+        response = self._request(
+            "GET", self._build_url(resource), params=dict(params, limit=1)
+        )
+
+        if response.status_code != requests.codes.ok:  # pragma: no cover
+            raise NotFoundError(f"Could not retrieve {resource}", response=response)
+
+        return response.json()["count"]
+
     def scopes(
         self,
         name: Optional[str] = None,
         pk: Optional[str] = None,
         status: Optional[Union[ScopeStatus, str]] = ScopeStatus.ACTIVE,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
         **kwargs,
     ) -> List[Scope]:
         """Return all scopes visible / accessible for the logged in user.
@@ -596,6 +1182,12 @@ class Client:
         :type pk: basestring or None
         :param status: if provided, filter the search for the status. eg. 'ACTIVE', 'TEMPLATE', 'LIBRARY'
         :type status: basestring or None
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
         :param kwargs: optional additional search arguments
         :return: list of `Scopes`
         :rtype: list(:class:`models.Scope`)
@@ -632,14 +1224,15 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request("GET", url=url, params=request_params)
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Scopes", response=response)
-
-        data = response.json()
-
-        return [Scope(s, client=self) for s in data["results"]]
+        pages = self._retrieve_pages(
+            url,
+            params=request_params,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name="Scopes",
+        )
+        return [Scope(s, client=self) for page in pages for s in page]
 
     def scope(self, *args, **kwargs) -> Scope:
         """Return a single scope based on the provided name.
@@ -658,6 +1251,9 @@ class Client:
         name: Optional[str] = None,
         pk: Optional[str] = None,
         scope: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
         **kwargs,
     ) -> List[Activity]:
         """Search for activities with optional name, pk and scope filter.
@@ -671,29 +1267,86 @@ class Client:
         :type name: basestring or None
         :param scope: filter by scope id
         :type scope: basestring or None
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
         :return: list of :class:`models.Activity`
         :raises NotFoundError: If no `Activities` are found
+        """
+        return list(
+            self.iter_activities(
+                name=name,
+                pk=pk,
+                scope=scope,
+                limit=limit,
+                batch=batch,
+                max_workers=max_workers,
+                **kwargs,
+            )
+        )
+
+    def iter_activities(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        scope: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = PARTS_BATCH_LIMIT,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Activity]:
+        """Iterate over activities, retrieving them batch by batch.
+
+        Uses the same interface as the :func:`activities` method, but the activities are retrieved from
+        KE-chain in batches while iterating. Only a single batch of activities is kept in memory.
+
+        .. versionadded:: 4.17
+
+        :param name: filter the activities by name
+        :type name: basestring or None
+        :param pk: id (primary key) of the activity to retrieve
+        :type pk: basestring or None
+        :param scope: filter by scope id
+        :type scope: basestring or None
+        :param limit: limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: limit the batch size to # items (defaults to 100 items per batch)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads.
+            By default the batches are retrieved one after the other.
+        :type max_workers: int or None
+        :param kwargs: additional `keyword=value` arguments for the api
+        :return: iterator of :class:`models.Activity`
+        :raises NotFoundError: If the `Activities` could not be retrieved
+
+        Example
+        -------
+        >>> for activity in client.iter_activities(scope=scope.id):
+        ...     print(activity.name)
+
         """
         request_params = {
             "id": check_uuid(pk),
             "name": check_text(text=name, key="name"),
             "scope_id": check_base(scope, Scope, "scope"),
         }
-
         request_params.update(API_EXTRA_PARAMS["activity"])
 
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("activities"), params=request_params
+        pages = self._retrieve_pages(
+            self._build_url("activities"),
+            params=request_params,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name="Activities",
         )
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Activities", response=response)
-
-        data = response.json()
-        return [Activity(a, client=self) for a in data["results"]]
+        return (Activity(a, client=self) for page in pages for a in page)
 
     def activity(self, *args, **kwargs) -> Activity:
         """Search for a single activity.
@@ -725,6 +1378,9 @@ class Client:
         widget: Optional[str] = None,
         limit: Optional[int] = None,
         batch: Optional[int] = PARTS_BATCH_LIMIT,
+        max_workers: Optional[int] = None,
+        include_properties: bool = True,
+        light: bool = False,
         **kwargs,
     ) -> PartSet:
         """Retrieve multiple KE-chain parts.
@@ -754,6 +1410,16 @@ class Client:
         :type limit: int or None
         :param batch: limit the batch size to # items (defaults to 100 items per batch)
         :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads.
+            By default the batches are retrieved one after the other.
+        :type max_workers: int or None
+        :param include_properties: (optional) retrieve the properties of the parts as well (defaults to True).
+            When False, the properties are left out of the response and are only retrieved per part when
+            `Part.properties` is accessed. Alternatively, provide the `fields` to retrieve as a keyword argument.
+        :type include_properties: bool
+        :param light: (optional) return read-only, memory-compact :class:`models.LightPart` objects instead of
+            :class:`models.Part` objects (defaults to False). Useful for large sets of parts.
+        :type light: bool
         :param kwargs: additional `keyword=value` arguments for the api
         :return: :class:`models.PartSet` which is an iterator of :class:`models.Part`
         :raises NotFoundError: If no `Part` is found
@@ -777,48 +1443,134 @@ class Client:
         >>> client.parts(limit=5)  # doctest:Ellipsis
         ...
 
+        Return all parts of a scope, retrieving 4 batches of 100 parts at the same time
+
+        >>> client.parts(scope_id=scope.id, max_workers=4)  # doctest:Ellipsis
+        ...
+
+        Return the names of all parts of a scope, without retrieving their properties
+
+        >>> [p.name for p in client.parts(scope_id=scope.id, include_properties=False)]  # doctest:Ellipsis
+        ...
+
         """
-        # if limit is provided and the batchsize is bigger than the limit, ensure that the
-        # batch size is maximised
-        if limit and limit < batch:
-            batch = limit
+        return PartSet(
+            self.iter_parts(
+                name=name,
+                pk=pk,
+                model=model,
+                category=category,
+                scope_id=scope_id,
+                parent=parent,
+                activity=activity,
+                widget=widget,
+                limit=limit,
+                batch=batch,
+                max_workers=max_workers,
+                include_properties=include_properties,
+                light=light,
+                **kwargs,
+            )
+        )
+
+    def iter_parts(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        model: Optional[Part] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+        scope_id: Optional[str] = None,
+        parent: Optional[str] = None,
+        activity: Optional[str] = None,
+        widget: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = PARTS_BATCH_LIMIT,
+        max_workers: Optional[int] = None,
+        include_properties: bool = True,
+        light: bool = False,
+        **kwargs,
+    ) -> Iterator[Part]:
+        """Iterate over KE-chain parts, retrieving them batch by batch.
+
+        Uses the same interface as the :func:`parts` method, but instead of retrieving all parts before
+        returning a :class:`models.PartSet`, the parts are retrieved from KE-chain in batches while
+        iterating. Only a single batch of parts is kept in memory and processing of the parts can start
+        as soon as the first batch is retrieved.
+
+        When `max_workers` is provided up to `max_workers` batches are retrieved ahead concurrently, trading
+        the memory footprint for speed.
+
+        .. versionadded:: 4.17
+
+        :param name: filter on name
+        :type name: basestring or None
+        :param pk: filter on primary key
+        :type pk: basestring or None
+        :param model: filter on model_id
+        :type model: basestring or None
+        :param category: filter on category (INSTANCE, MODEL, None)
+        :type category: basestring or None
+        :param scope_id: filter on scope_id
+        :type scope_id: basestring or None
+        :param parent: filter on the parent_id, returns all children of the parent_id
+        :type parent: basestring or None
+        :param activity: filter on activity_id
+        :type activity: basestring or None
+        :param widget: filter on widget_id
+        :type widget: basestring or None
+        :param limit: limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: limit the batch size to # items (defaults to 100 items per batch)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads.
+            By default the batches are retrieved one after the other.
+        :type max_workers: int or None
+        :param include_properties: (optional) retrieve the properties of the parts as well (defaults to True),
+            see :func:`parts`.
+        :type include_properties: bool
+        :param light: (optional) iterate over read-only, memory-compact :class:`models.LightPart` objects instead
+            of :class:`models.Part` objects (defaults to False).
+        :type light: bool
+        :param kwargs: additional `keyword=value` arguments for the api
+        :return: iterator of :class:`models.Part`
+        :raises NotFoundError: If the `Parts` could not be retrieved
+
+        Example
+        -------
+        >>> for part in client.iter_parts(scope_id=scope.id, batch=500):
+        ...     print(part.name)
 
+        """
         request_params = dict(
             id=check_uuid(pk),
             name=check_text(text=name, key="name"),
             category=check_enum(category, Category, "category"),
             activity_id=check_base(activity, Activity, "activity"),
             widget_id=check_base(widget, Widget, "widget"),
-            limit=batch,
             scope_id=check_uuid(scope_id),
             parent_id=check_base(parent, Part, "parent"),
             model_id=check_base(model, Part, "model"),
         )
         url = self._build_url("parts")
         request_params.update(API_EXTRA_PARAMS["parts"])
+        if not check_type(include_properties, bool, "include_properties"):
+            request_params["fields"] = ",".join(
+                f for f in request_params["fields"].split(",") if f != "properties"
+            )
 
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request("GET", url, params=request_params)
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Parts", response=response)
-
-        data = response.json()
-
-        part_results = data["results"]
-
-        if batch and data.get("next"):
-            while data["next"]:
-                # respect the limit if set to > 0
-                if limit and len(part_results) >= limit:
-                    break
-                response = self._request("GET", data["next"])
-                data = response.json()
-                part_results.extend(data["results"])
-
-        return PartSet(Part(p, client=self) for p in part_results)
+        pages = self._retrieve_pages(
+            url,
+            params=request_params,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name="Parts",
+        )
+        part_class = LightPart if check_type(light, bool, "light") else Part
+        return (part_class(p, client=self) for page in pages for p in page)
 
     def part(self, *args, **kwargs) -> Part:
         """Retrieve single KE-chain part.
@@ -888,6 +1640,9 @@ class Client:
         name: Optional[str] = None,
         pk: Optional[str] = None,
         category: Optional[Union[Category, str]] = Category.INSTANCE,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
         **kwargs,
     ) -> List["AnyProperty"]:
         """Retrieve properties.
@@ -901,10 +1656,62 @@ class Client:
         :type pk: basestring or None
         :param category: filter the properties by category. Defaults to INSTANCE. Other options MODEL or None
         :type category: basestring or None
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
         :param kwargs: (optional) additional search keyword arguments
         :return: list of :class:`models.Property`
         :raises NotFoundError: When no `Property` is found
         """
+        return list(
+            self.iter_properties(
+                name=name,
+                pk=pk,
+                category=category,
+                limit=limit,
+                batch=batch,
+                max_workers=max_workers,
+                **kwargs,
+            )
+        )
+
+    def iter_properties(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+        limit: Optional[int] = None,
+        batch: Optional[int] = PARTS_BATCH_LIMIT,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator["AnyProperty"]:
+        """Iterate over properties, retrieving them batch by batch.
+
+        Uses the same interface as the :func:`properties` method, but the properties are retrieved from
+        KE-chain in batches while iterating. Only a single batch of properties is kept in memory.
+
+        .. versionadded:: 4.17
+
+        :param name: name to limit the search for.
+        :type name: basestring or None
+        :param pk: primary key or id (UUID) of the property to search for
+        :type pk: basestring or None
+        :param category: filter the properties by category. Defaults to INSTANCE. Other options MODEL or None
+        :type category: basestring or None
+        :param limit: limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: limit the batch size to # items (defaults to 100 items per batch)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads.
+            By default the batches are retrieved one after the other.
+        :type max_workers: int or None
+        :param kwargs: additional `keyword=value` arguments for the api
+        :return: iterator of :class:`models.Property`
+        :raises NotFoundError: If the `Properties` could not be retrieved
+        """
         request_params = {
             "name": check_text(text=name, key="name"),
             "id": check_uuid(pk),
@@ -914,14 +1721,16 @@ class Client:
             request_params.update(**kwargs)
 
         request_params.update(API_EXTRA_PARAMS["properties"])
-        response = self._request(
-            "GET", self._build_url("properties"), params=request_params
-        )
 
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Properties", response=response)
-
-        return [Property.create(p, client=self) for p in response.json()["results"]]
+        pages = self._retrieve_pages(
+            self._build_url("properties"),
+            params=request_params,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name="Properties",
+        )
+        return (Property.create(p, client=self) for page in pages for p in page)
 
     def property(self, *args, **kwargs) -> "AnyProperty":  # noqa: F
         """Retrieve single KE-chain Property.
@@ -965,11 +1774,98 @@ class Client:
             return Property.create(property_results, client=self)
         return self._retrieve_singular(self.properties, *args, **kwargs)
 
+    def resolve_models(
+        self,
+        objects: Iterable[Union[Part, "AnyProperty"]],
+        chunk_size: int = PARTS_BATCH_LIMIT,
+    ) -> None:
+        """
+        Retrieve the models of many part and property instances in bulk.
+
+        Instead of retrieving the model of every instance separately when calling :func:`Part.model()` or
+        :func:`Property.model()`, the distinct models are retrieved in chunks of `chunk_size` using `id__in`
+        queries and are stored on the instances. Property models that belong to a retrieved part model are
+        taken from that part model, without an additional request.
+
+        .. versionadded:: 4.17
+
+        :param objects: iterable of :class:`models.Part` and/or :class:`models.Property` objects
+        :type objects: Iterable
+        :param chunk_size: (optional) number of models to retrieve per request (defaults to 100)
+        :type chunk_size: int
+        :return: None
+        :raises IllegalArgumentError: if an object is not a `Part` or `Property`
+        :raises NotFoundError: if the models could not be retrieved
+
+        Example
+        -------
+        >>> wheels = client.parts(name="Wheel")
+        >>> client.resolve_models(wheels)
+        >>> wheel_model = wheels[0].model()  # no additional API call
+
+        """
+        instances = [
+            check_type(obj, (Part, Property), "objects")
+            for obj in objects
+            if obj is not None
+        ]
+        instances = [
+            obj
+            for obj in instances
+            if obj.category == Category.INSTANCE and obj._model is None and obj.model_id
+        ]
+
+        part_instances = [obj for obj in instances if isinstance(obj, Part)]
+        property_instances = [obj for obj in instances if isinstance(obj, Property)]
+
+        part_models = dict()
+        part_model_ids = list({p.model_id: None for p in part_instances})
+        for chunk in get_in_chunks(lst=part_model_ids, chunk_size=chunk_size):
+            part_models.update(
+                {
+                    p.id: p
+                    for p in self.parts(
+                        id__in=",".join(chunk),
+                        category=Category.MODEL,
+                        batch=chunk_size,
+                    )
+                }
+            )
+        for part in part_instances:
+            part._model = part_models.get(part.model_id)
+
+        property_models = {
+            p.id: p for model in part_models.values() for p in model.properties
+        }
+        property_model_ids = list(
+            {
+                p.model_id: None
+                for p in property_instances
+                if p.model_id not in property_models
+            }
+        )
+        for chunk in get_in_chunks(lst=property_model_ids, chunk_size=chunk_size):
+            property_models.update(
+                {
+                    p.id: p
+                    for p in self.properties(
+                        id__in=",".join(chunk),
+                        category=Category.MODEL,
+                        batch=chunk_size,
+                    )
+                }
+            )
+        for prop in property_instances:
+            prop._model = property_models.get(prop.model_id)
+
     def services(
         self,
         name: Optional[str] = None,
         pk: Optional[str] = None,
         scope: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
         **kwargs,
     ) -> List[Service]:
         """
@@ -984,6 +1880,12 @@ class Client:
         :type pk: basestring or None
         :param scope: (optional) id (UUID) of the scope to search in
         :type scope: basestring or None
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
         :param kwargs: (optional) additional search keyword arguments
         :return: list of :class:`models.Service` objects
         :raises NotFoundError: When no `Service` objects are found
@@ -998,14 +1900,15 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request(
-            "GET", self._build_url("services"), params=request_params
+        pages = self._retrieve_pages(
+            self._build_url("services"),
+            params=request_params,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name="Services",
         )
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Services", response=response)
-
-        return [Service(service, client=self) for service in response.json()["results"]]
+        return [Service(service, client=self) for page in pages for service in page]
 
     def service(self, *args, **kwargs):
         """
@@ -1088,7 +1991,13 @@ class Client:
         return self._retrieve_singular(self.service_executions, *args, **kwargs)
 
     def users(
-        self, username: Optional[str] = None, pk: Optional[str] = None, **kwargs
+        self,
+        username: Optional[str] = None,
+        pk: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        **kwargs,
     ) -> List[User]:
         """
         Users of KE-chain.
@@ -1099,6 +2008,12 @@ class Client:
         :type username: basestring or None
         :param pk: (optional) id of the user to filter
         :type pk: basestring or None
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :type limit: int or None
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
         :param kwargs: Additional filtering keyword=value arguments
         :return: List of :class:`Users`
         :raises NotFoundError: when a user could not be found
@@ -1110,12 +2025,15 @@ class Client:
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._request("GET", self._build_url("users"), params=request_params)
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve Users", response=response)
-
-        return [User(user, client=self) for user in response.json()["results"]]
+        pages = self._retrieve_pages(
+            self._build_url("users"),
+            params=request_params,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name="Users",
+        )
+        return [User(user, client=self) for page in pages for user in page]
 
     def user(self, *args, **kwargs) -> User:
         """
@@ -1866,8 +2784,11 @@ class Client:
         parts: List[Dict],
         asynchronous: Optional[bool] = False,
         retrieve_instances: Optional[bool] = True,
+        from_response: Optional[bool] = True,
+        chunk_size: int = BULK_CREATE_RETRIEVE_CHUNK_SIZE,
+        max_workers: Optional[int] = BULK_CREATE_RETRIEVE_MAX_WORKERS,
         **kwargs,
-    ) -> PartSet:
+    ) -> Union[PartSet, List[ObjectID], Job]:
         """
         Create multiple part instances simultaneously.
 
@@ -1887,13 +2808,22 @@ class Client:
                 :type model_id: UUID
             :type properties: list
         :type parts: list
-        :param asynchronous: If true, immediately returns without parts (default = False)
+        :param asynchronous: If true, immediately returns a `Job` providing the parts once these are all created
+            (default = False)
         :type asynchronous: bool
         :param retrieve_instances: If true, will retrieve the created Part Instances in a PartSet
         :type retrieve_instances: bool
+        :param from_response: If true, the Part Instances are built from the response of KE-chain when it contains
+            the created parts in full, without retrieving them again (default = True)
+        :type from_response: bool
+        :param chunk_size: number of Part Instances to retrieve per request (default = 50)
+        :type chunk_size: int
+        :param max_workers: number of requests to retrieve the Part Instances concurrently (default = 4),
+            None or 1 to retrieve them one request after the other
+        :type max_workers: int or None
         :param kwargs:
-        :return: list of Part instances or list of part UUIDs
-        :rtype list
+        :return: list of Part instances or list of part UUIDs, or a `Job` if asynchronous
+        :rtype list or Job
         """
         check_list_of_dicts(
             parts,
@@ -1936,35 +2866,48 @@ class Client:
                 f"Could not create Parts. ({response.status_code})", response=response
             )
 
-        part_ids = response.json()["results"][0]["parts_created"]
-        if retrieve_instances:
-            instances_per_id = dict()
-            for part_ids_chunk in get_in_chunks(lst=part_ids, chunk_size=50):
-                instances_per_id.update(
-                    {
-                        p.id: p for p in self.parts(id__in=",".join(part_ids_chunk))
-                    }  # `id__in` does not guarantee order
+        parts_created = response.json()["results"][0]["parts_created"]
+        part_ids = [p["id"] if isinstance(p, dict) else p for p in parts_created]
+
+        def created_parts() -> Union[PartSet, List[ObjectID]]:
+            if retrieve_instances:
+                part_instances = self._created_objects(
+                    created=parts_created,
+                    cls=Part,
+                    retrieve=self.parts,
+                    fields=API_EXTRA_PARAMS["parts"]["fields"],
+                    # the parts in the response may not be complete until the job is done
+                    from_response=from_response and not asynchronous,
+                    chunk_size=chunk_size,
+                    max_workers=max_workers,
                 )
-            part_instances = [
-                instances_per_id[pk] for pk in part_ids
-            ]  # Ensures order of parts wrt request
-            return PartSet(parts=part_instances)
-        return part_ids
+                return PartSet(parts=part_instances)
+            return part_ids
+
+        if asynchronous:
+            return Job(
+                description=f"Create {len(part_ids)} Parts",
+                check=lambda: self._count_parts(part_ids, chunk_size) == len(part_ids),
+                result=created_parts,
+                response=response,
+            )
+        return created_parts()
 
     def _delete_parts_bulk(
         self,
         parts: List[Union[Part, str]],
         asynchronous: Optional[bool] = False,
         **kwargs,
-    ) -> bool:
+    ) -> Union[bool, Job]:
         """Delete multiple Parts simultaneously.
 
         :param parts: list of Part objects or UUIDs
         :type parts: List[Property] or List[UUID]
-        :param asynchronous: If true, immediately returns (default = False)
+        :param asynchronous: If true, immediately returns a `Job` that is done once the parts are gone
+            (default = False)
         :type asynchronous: bool
         :param kwargs:
-        :return: True if parts are delete successfully
+        :return: True if parts are delete successfully, or a `Job` if asynchronous
         :raises APIError: if the parts could not be deleted
         :raises IllegalArgumentError: if there were neither Parts nor UUIDs in the list of parts
         """
@@ -1999,8 +2942,180 @@ class Client:
             raise APIError(
                 f"Could not delete Parts. ({response.status_code})", response=response
             )
+        self._uncache_objects(Part, list_parts)
+        if asynchronous:
+            return Job(
+                description=f"Delete {len(list_parts)} Parts",
+                check=lambda: self._count_parts(list_parts) == 0,
+                result=lambda: True,
+                response=response,
+            )
         return True
 
+    def _count_parts(
+        self,
+        part_ids: List[ObjectID],
+        chunk_size: int = BULK_CREATE_RETRIEVE_CHUNK_SIZE,
+    ) -> int:
+        """Count how many of the parts exist, using light-weight `id__in` requests of `chunk_size` ids."""
+        return sum(
+            self._count("parts", id__in=",".join(chunk))
+            for chunk in get_in_chunks(lst=part_ids, chunk_size=chunk_size)
+        )
+
+    def _created_objects(
+        self,
+        created: List[Union[Dict, ObjectID]],
+        cls: Type[Base],
+        retrieve: Callable[..., Iterable[Base]],
+        fields: str,
+        from_response: bool,
+        chunk_size: int,
+        max_workers: Optional[int],
+    ) -> List[Base]:
+        """
+        Provide the objects created in bulk, in the order in which these were created.
+
+        When `from_response` is set and the response of KE-chain contains every created object with all requested
+        `fields`, the objects are built from the response. Otherwise, the objects are retrieved on their id using
+        `id__in` requests of `chunk_size` ids, sent concurrently using `max_workers` threads.
+
+        :param created: the created objects as json, or their ids, as provided in the response of KE-chain
+        :param cls: class of the created objects, eg. `Part`
+        :param retrieve: method of the client to retrieve the objects, eg. `Client.parts`
+        :param fields: comma-separated fields requested from KE-chain
+        :param from_response: whether to build the objects from the response if possible
+        :param chunk_size: number of objects to retrieve per request
+        :param max_workers: number of requests to send concurrently (None or 1 to send them one after the other)
+        :return: list of objects
+        """
+        check_type(chunk_size, int, "chunk_size")
+        if from_response and all(
+            isinstance(json, dict) and set(fields.split(",")).issubset(json)
+            for json in created
+        ):
+            return [cls(json, client=self) for json in created]
+
+        ids = [json["id"] if isinstance(json, dict) else json for json in created]
+        chunks = list(get_in_chunks(lst=ids, chunk_size=chunk_size))
+
+        def retrieve_chunk(chunk: List[ObjectID]) -> List[Base]:
+            return list(retrieve(id__in=",".join(chunk)))
+
+        if max_workers and max_workers > 1 and len(chunks) > 1:
+            with self._thread_pool(max_workers) as executor:
+                retrieved = list(executor.map(retrieve_chunk, chunks))
+        else:
+            retrieved = [retrieve_chunk(chunk) for chunk in chunks]
+
+        # `id__in` does not guarantee order
+        objects_per_id = {obj.id: obj for objects in retrieved for obj in objects}
+        return [objects_per_id[pk] for pk in ids]
+
+    def copy_parts(
+        self,
+        parts: List[Part],
+        target_parent: Part,
+        include_children: bool = True,
+        include_instances: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[Part]:
+        """
+        Copy multiple `Parts` to the target parent, optionally concurrently.
+
+        Every part is copied as by :func:`Part.copy()`. The copies each keep their own state, so with `max_workers`
+        the parts are copied in parallel threads, sharing the connection pool of this client. The parts must be
+        independent: none of the parts may be a descendant of another part in the list.
+
+        .. versionadded:: 4.17
+
+        :param parts: the parts to copy, all of the same category as the target parent
+        :type parts: list of :class:`models.Part`
+        :param target_parent: `Part` object under which the parts are copied
+        :type target_parent: :class:`models.Part`
+        :param include_children: True to copy also the descendants of the parts.
+        :type include_children: bool
+        :param include_instances: True to copy also the instances of part models to ALL the instances of
+            target_parent.
+        :type include_instances: bool
+        :param max_workers: (optional) number of parts to copy concurrently (defaults to sequential)
+        :type max_workers: int or None
+        :return: the copied parts, in the order of `parts`
+        :rtype: list
+        :raises IllegalArgumentError: if a part and target_parent have a different `Category`
+        :raises APIError: if a part could not be copied
+
+        Example
+        -------
+        >>> templates = catalog_project.model("Templates").children()
+        >>> copies = client.copy_parts(templates, target_parent=project.model("Product"), max_workers=4)
+
+        """
+        return self._copy_parts(
+            parts=parts,
+            method="copy",
+            max_workers=max_workers,
+            target_parent=target_parent,
+            include_children=include_children,
+            include_instances=include_instances,
+        )
+
+    def move_parts(
+        self,
+        parts: List[Part],
+        target_parent: Part,
+        include_children: bool = True,
+        include_instances: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[Part]:
+        """
+        Move multiple `Parts` to the target parent, optionally concurrently.
+
+        Every part is moved as by :func:`Part.move()`, see :func:`Client.copy_parts()`.
+
+        .. versionadded:: 4.17
+
+        :param parts: the parts to move, all of the same category as the target parent
+        :type parts: list of :class:`models.Part`
+        :param target_parent: `Part` object under which the parts are moved
+        :type target_parent: :class:`models.Part`
+        :param include_children: True to move also the descendants of the parts.
+        :type include_children: bool
+        :param include_instances: True to move also the instances of part models to ALL the instances of
+            target_parent.
+        :type include_instances: bool
+        :param max_workers: (optional) number of parts to move concurrently (defaults to sequential)
+        :type max_workers: int or None
+        :return: the moved parts, in the order of `parts`
+        :rtype: list
+        :raises IllegalArgumentError: if a part and target_parent have a different `Category`
+        :raises APIError: if a part could not be moved
+        """
+        return self._copy_parts(
+            parts=parts,
+            method="move",
+            max_workers=max_workers,
+            target_parent=target_parent,
+            include_children=include_children,
+            include_instances=include_instances,
+        )
+
+    def _copy_parts(
+        self, parts: List[Part], method: str, max_workers: Optional[int], **kwargs
+    ) -> List[Part]:
+        """Copy or move every part using `Part.copy` or `Part.move`, concurrently when `max_workers` is provided."""
+        parts = list(parts)
+        for part in parts:
+            check_type(part, Part, "parts")
+
+        def copy_part(part: Part) -> Part:
+            return getattr(part, method)(**kwargs)
+
+        if max_workers and max_workers > 1 and len(parts) > 1:
+            with self._thread_pool(max_workers) as executor:
+                return list(executor.map(copy_part, parts))
+        return [copy_part(part) for part in parts]
+
     def create_property(
         self,
         model: Part,
@@ -2237,7 +3352,9 @@ class Client:
 
         return Scope(response.json()["results"][0], client=self)
 
-    def delete_scope(self, scope: Scope, asynchronous: Optional[bool] = True) -> bool:
+    def delete_scope(
+        self, scope: Scope, asynchronous: Optional[bool] = True
+    ) -> Union[bool, Job]:
         """
         Delete a scope.
 
@@ -2249,7 +3366,7 @@ class Client:
         :type scope: :class: `models.Scope`
         :param asynchronous: (optional) if the scope deletion should be performed asynchronous (default True)
         :type asynchronous: bool
-        :return: True when the delete is a success.
+        :return: True when the delete is a success, or a `Job` that is done once the scope is gone if asynchronous
         :raises APIError: in case of failure in the deletion of the scope
         """
         check_type(scope, Scope, "scope")
@@ -2266,7 +3383,15 @@ class Client:
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(f"Could not delete Scope {scope}", response=response)
-
+        self._uncache_objects(Scope, [scope.id])
+
+        if asynchronous:
+            return Job(
+                description=f"Delete Scope {scope}",
+                check=lambda: self._count("scopes", id=scope.id, status=None) == 0,
+                result=lambda: True,
+                response=response,
+            )
         return True
 
     def clone_scope(
@@ -2723,6 +3848,7 @@ class Client:
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(f"Could not delete Widget {widget}", response=response)
+        self._uncache_objects(Widget, [widget])
 
     def delete_widgets(self, widgets: List[Union[Widget, str]]) -> None:
         """
@@ -2743,6 +3869,7 @@ class Client:
 
         if response.status_code != requests.codes.no_content:
             raise APIError("Could not delete Widgets", response=response)
+        self._uncache_objects(Widget, widget_ids)
 
     @staticmethod
     def _validate_associations(
@@ -2776,6 +3903,8 @@ class Client:
         property: Optional[AnyProperty] = None,
         scope: Optional[Scope] = None,
         limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> List[Association]:
         """
         Retrieve a list of associations.
@@ -2792,6 +3921,10 @@ class Client:
         :type scope: Scope
         :param limit: maximum number of associations to retrieve
         :type limit: int
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :type batch: int or None
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
         :return: list of association objects
         :rtype List[Association]
         """
@@ -2834,17 +3967,15 @@ class Client:
             "model_property": property_model,
         }
 
-        url = self._build_url("associations")
-        response = self._request("GET", url, params=request_params)
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise APIError("Could not retrieve Associations", response=response)
-
-        associations = [
-            Association(json=r, client=self) for r in response.json()["results"]
-        ]
-
-        return associations
+        pages = self._retrieve_pages(
+            self._build_url("associations"),
+            params=request_params,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name="Associations",
+        )
+        return [Association(json=r, client=self) for page in pages for r in page]
 
     def update_widget_associations(
         self,
@@ -3392,6 +4523,7 @@ class Client:
             raise APIError(
                 f"Could not delete Notification {notification}", response=response
             )
+        self._uncache_objects(Notification, [notification])
 
     def banners(
         self,
@@ -3681,6 +4813,7 @@ class Client:
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError("Could not delete Contexts", response=response)
+        self._uncache_objects(Context, [context.id])
 
     def context(self, *args, **kwargs) -> Context:
         """
@@ -3804,6 +4937,9 @@ class Client:
         forms: List[Dict],
         asynchronous: Optional[bool] = False,
         retrieve_instances: Optional[bool] = True,
+        from_response: Optional[bool] = True,
+        chunk_size: int = BULK_CREATE_RETRIEVE_CHUNK_SIZE,
+        max_workers: Optional[int] = BULK_CREATE_RETRIEVE_MAX_WORKERS,
         **kwargs,
     ) -> List:
         """
@@ -3826,6 +4962,14 @@ class Client:
         :type asynchronous: bool
         :param retrieve_instances: If true, will retrieve the created Form Instances in a List
         :type retrieve_instances: bool
+        :param from_response: If true, the Form Instances are built from the response of KE-chain when it contains
+            the created forms in full, without retrieving them again (default = True)
+        :type from_response: bool
+        :param chunk_size: number of Form Instances to retrieve per request (default = 50)
+        :type chunk_size: int
+        :param max_workers: number of requests to retrieve the Form Instances concurrently (default = 4),
+            None or 1 to retrieve them one request after the other
+        :type max_workers: int or None
         :param kwargs:
         :return: list of Form instances or list of form UUIDs
         :rtype list
@@ -3862,20 +5006,18 @@ class Client:
             raise APIError(
                 f"Could not create Forms. ({response.status_code})", response=response
             )
-        form_ids = [form.get("id") for form in response.json()["results"]]
+        forms_created = response.json()["results"]
         if retrieve_instances:
-            instances_per_id = dict()
-            for forms_ids_chunk in get_in_chunks(lst=form_ids, chunk_size=50):
-                instances_per_id.update(
-                    {
-                        p.id: p for p in self.forms(id__in=",".join(forms_ids_chunk))
-                    }  # `id__in` does not guarantee order
-                )
-            form_instances = [
-                instances_per_id[pk] for pk in form_ids
-            ]  # Ensures order of parts wrt request
-            return form_instances
-        return form_ids
+            return self._created_objects(
+                created=forms_created,
+                cls=Form,
+                retrieve=self.forms,
+                fields=API_EXTRA_PARAMS["forms"]["fields"],
+                from_response=from_response,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+            )
+        return [form.get("id") for form in forms_created]
 
     def _delete_forms_bulk(
         self,
@@ -3925,6 +5067,7 @@ class Client:
             raise APIError(
                 f"Could not delete Forms. ({response.status_code})", response=response
             )
+        self._uncache_objects(Form, list_forms)
         return True
 
     def workflow(
@@ -4014,7 +5157,7 @@ class Client:
 
     def import_parts(
         self,
-        file,
+        file: Union[str, bytes, BinaryIO],
         model: Part,
         parent: Part,
         activity: Optional[Activity] = None,
@@ -4022,12 +5165,18 @@ class Client:
     ) -> None:
         """Import parts from an Excel file.
 
-        :param file: the Excel file to be used
+        KE-chain does not report the progress of an asynchronous import. Use `async_mode=False` to wait for the
+        import.
+
+        :param file: path of the Excel file, or its content as bytes or as binary file object
+        :type file: basestring or bytes or file object
         :param model: model of the Part
         :param parent: Parent Part instance
         :param activity: Optional
         :param async_mode: (boolean) if the call should be made asynchronously
-        :return:
+        :return: None
+        :raises IllegalArgumentError: if the file is neither a path, bytes nor a binary file object
+        :raises APIError: if the parts could not be imported
         """
         if model.category != Category.MODEL:
             raise IllegalArgumentError(f"Part {model.name} should be of category MODEL")
@@ -4035,26 +5184,36 @@ class Client:
             raise IllegalArgumentError(
                 f"Part {parent.name} should be of category INSTANCE"
             )
+        if not isinstance(file, (str, bytes)) and not hasattr(file, "read"):
+            raise IllegalArgumentError(
+                f"`file` should be a path, bytes or a binary file object, got: '{file}'"
+            )
 
         json = dict(
             model_id=model.id,
             parent_id=parent.id,
-            activity_id=activity.id,
+            activity_id=activity.id if activity else None,
         )
         params = dict(async_mode=async_mode)
+        url = self._build_url("parts_import")
+
         if isinstance(file, str):
             with open(file, "rb") as fp:
-                url = self._build_url("parts_import")
                 response = self._request(
                     "POST", url, data=json, params=params, files={"attachment": fp}
                 )
-                if response.status_code not in (
-                    requests.codes.accepted,
-                    requests.codes.ok,
-                ):
-                    raise APIError(
-                        f"Could not import parts {str(response)}: {response.content}"
-                    )
+        else:
+            response = self._request(
+                "POST", url, data=json, params=params, files={"attachment": file}
+            )
+
+        if response.status_code not in (
+            requests.codes.accepted,
+            requests.codes.ok,
+        ):
+            raise APIError(
+                f"Could not import parts {str(response)}: {response.content}"
+            )
 
     def create_stored_file(self, **kwargs) -> StoredFile:
         """Create a new Stored File object in a scope.
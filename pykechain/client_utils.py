@@ -1,8 +1,40 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from ssl import SSLError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+)
+from urllib.parse import urlparse
 
 from urllib3 import Retry
 from urllib3.exceptions import MaxRetryError
 
+from pykechain.defaults import (
+    API_PATH,
+    DISK_CACHE_TTL,
+    OBJECT_CACHE_MAX_SIZE,
+    OBJECT_CACHE_TTL,
+)
+from pykechain.enums import KechainEnv
+
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+
 
 class PykeRetry(Retry):
     """
@@ -35,3 +67,353 @@ class PykeRetry(Retry):
 
     def _is_ssl_error(self, error):
         return error and isinstance(error, SSLError)
+
+
+class ObjectCache:
+    """
+    Identity map of the KE-chain objects retrieved by a `Client`.
+
+    The objects are stored on their class and id, eg. `(Part, "<uuid>")`. All subclasses of a model share
+    the same key, so a `SelectListProperty` is stored and retrieved as a `Property`. Only the most recently
+    retrieved object for an id is kept.
+
+    The cache is bounded in time and size: objects expire `ttl` seconds after being stored and when more
+    than `max_size` objects are stored, the least recently used object is evicted.
+
+    :ivar hits: number of times an object was found in the cache
+    :ivar misses: number of times an object was not found (or expired) in the cache
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = OBJECT_CACHE_MAX_SIZE,
+        ttl: Optional[float] = OBJECT_CACHE_TTL,
+    ):
+        """
+        Create an object cache.
+
+        :param max_size: (optional) maximum number of objects in the cache, None for unbounded
+        :type max_size: int or None
+        :param ttl: (optional) time-to-live of the objects in seconds, None to never expire
+        :type ttl: float or None
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._objects: "OrderedDict[Tuple[Type, Hashable], Tuple[float, object]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke {self.__class__.__name__} {len(self)} objects>"
+
+    def __len__(self):
+        return len(self._objects)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def identity_class(cls: Type) -> Optional[Type]:
+        """
+        Determine the class on which objects of the provided class are stored.
+
+        This is the most generic model class of the provided class, eg. `Property` for a `SelectListProperty`
+        and `Part` for a `Part2`.
+
+        :param cls: class of the object
+        :return: class on which to store the object, None if the class should not be stored
+        """
+        from pykechain.models import Base, BaseInScope
+        from pykechain.models.tree_traversal import TreeObject
+
+        for klass in reversed(cls.__mro__):
+            if issubclass(klass, Base) and klass not in (Base, BaseInScope, TreeObject):
+                return klass
+        return None
+
+    def add(self, obj: "Base") -> None:
+        """
+        Store an object in the cache, replacing any object of the same class and id.
+
+        :param obj: the object to store
+        """
+        identity_class = self.identity_class(obj.__class__)
+        if identity_class is None or obj.id is None:
+            return
+
+        key = (identity_class, obj.id)
+        with self._lock:
+            self._objects[key] = (time.monotonic(), obj)
+            self._objects.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._objects) > self.max_size:
+                    self._objects.popitem(last=False)
+
+    def get(self, cls: Type, pk: Hashable) -> Optional["Base"]:
+        """
+        Retrieve an object from the cache.
+
+        :param cls: class of the object to retrieve, eg. `Part`
+        :param pk: id of the object to retrieve
+        :return: the object if found and not expired, otherwise None
+        """
+        identity_class = self.identity_class(cls)
+        key = (identity_class, pk)
+        with self._lock:
+            entry = self._objects.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[0] > self.ttl:
+                    del self._objects[key]
+                    entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._objects.move_to_end(key)
+            return entry[1]
+
+    def remove(self, obj: "Base") -> None:
+        """
+        Remove an object from the cache, eg. when it is deleted in KE-chain.
+
+        :param obj: the object to remove
+        """
+        self.discard(obj.__class__, obj.id)
+
+    def discard(self, cls: Type, pk: Hashable) -> None:
+        """
+        Remove an object from the cache on its class and id, if it is stored.
+
+        :param cls: class of the object to remove, eg. `Part`
+        :param pk: id of the object to remove
+        """
+        with self._lock:
+            self._objects.pop((self.identity_class(cls), pk), None)
+
+    def clear(self) -> None:
+        """Remove all objects from the cache."""
+        with self._lock:
+            self._objects.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class DiskCache:
+    """
+    Persistent cache of KE-chain responses that rarely change, stored as json files in a directory.
+
+    Every entry is stored on the url of the KE-chain instance, a name (eg. `widget_schemas`) and an optional
+    version (eg. the versions of the backend), so a new version of KE-chain never reuses outdated entries.
+    Entries expire `ttl` seconds after being stored and can be invalidated explicitly.
+
+    The cache is best effort: unreadable entries are ignored and failures to write are silently skipped.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: Optional[float] = DISK_CACHE_TTL,
+    ):
+        """
+        Create a disk cache.
+
+        :param directory: (optional) directory to store the entries in. Defaults to the `KECHAIN_CACHE_DIR`
+            environment variable or otherwise a `pykechain` directory in the user cache directory.
+        :type directory: basestring or None
+        :param ttl: (optional) time-to-live of the entries in seconds, None to never expire
+        :type ttl: float or None
+        """
+        if directory is None:
+            directory = os.environ.get(KechainEnv.KECHAIN_CACHE_DIR) or os.path.join(
+                os.environ.get("XDG_CACHE_HOME")
+                or os.path.join(os.path.expanduser("~"), ".cache"),
+                "pykechain",
+            )
+        self.directory = directory
+        self.ttl = ttl
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke {self.__class__.__name__} '{self.directory}'>"
+
+    def _path(self, url: str, name: str, version: Optional[str] = None) -> str:
+        key = hashlib.sha256(f"{url}|{name}|{version}".encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}-{key}.json")
+
+    def get(self, url: str, name: str, version: Optional[str] = None) -> Optional[Any]:
+        """
+        Retrieve an entry from the cache.
+
+        :param url: url of the KE-chain instance
+        :param name: name of the entry
+        :param version: (optional) version of the entry
+        :return: the data of the entry if found and not expired, otherwise None
+        """
+        path = self._path(url=url, name=name, version=version)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl is not None and time.time() - entry.get("created", 0) > self.ttl:
+            self._remove(path)
+            return None
+        return entry.get("data")
+
+    def set(
+        self, url: str, name: str, data: Any, version: Optional[str] = None
+    ) -> None:
+        """
+        Store an entry in the cache, replacing any entry with the same url, name and version.
+
+        :param url: url of the KE-chain instance
+        :param name: name of the entry
+        :param data: json serializable data to store
+        :param version: (optional) version of the entry
+        """
+        entry = dict(
+            url=url, name=name, version=version, created=time.time(), data=data
+        )
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temporary file first, so concurrent processes never read a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, self._path(url=url, name=name, version=version))
+        except (OSError, TypeError, ValueError):  # pragma: no cover
+            pass
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Remove the entries from the cache.
+
+        :param url: (optional) only remove the entries of the KE-chain instance with this url
+        """
+        try:
+            filenames = os.listdir(self.directory)
+        except OSError:
+            return
+
+        for filename in filenames:
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, filename)
+            if url is not None:
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        if json.load(f).get("url") != url:
+                            continue
+                except (OSError, ValueError):
+                    continue
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:  # pragma: no cover
+            pass
+
+
+class RequestInfo:
+    """
+    Information on a single request of a `Client` to KE-chain, provided to the request hooks of the client.
+
+    The `before_send` hooks receive the request info before the request is sent. They may alter the `method`,
+    `url`, `headers` and `kwargs` (eg. `params` or `json`) of the request, or set a `response` to skip sending
+    the request altogether. The `after_receive` hooks receive the same request info once the response is
+    received (or the request failed), including the `duration` of the request.
+
+    :ivar method: the HTTP method, eg. GET or POST
+    :ivar url: the url of the request
+    :ivar resource: name of the resource in the `API_PATH` that matches the url, None if not found
+    :ivar headers: the headers of the request
+    :ivar kwargs: the additional arguments of the request, eg. `params` and `json`
+    :ivar response: the response, None when not (yet) received
+    :ivar exception: the exception raised while sending the request, if any
+    :ivar duration: duration in seconds of sending the request and receiving the response
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        resource: Optional[str],
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+    ):
+        """Create the information of a request."""
+        self.method = method
+        self.url = url
+        self.resource = resource
+        self.headers = headers
+        self.kwargs = kwargs
+        self.response: Optional["requests.Response"] = None
+        self.exception: Optional[Exception] = None
+        self.duration: Optional[float] = None
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke {self.__class__.__name__} {self.method} '{self.resource}'>"
+
+    @property
+    def status_code(self) -> Optional[int]:
+        """Status code of the response, None when no response is received."""
+        return self.response.status_code if self.response is not None else None
+
+    @property
+    def request_size(self) -> int:
+        """Number of bytes in the body of the request, 0 when no response is received."""
+        if self.response is None or self.response.request is None:
+            return 0
+        body = self.response.request.body
+        return len(body) if body else 0
+
+    @property
+    def response_size(self) -> Optional[int]:
+        """Number of bytes in the body of the response.
+
+        The body of a streamed response is not read, its size is taken from the `Content-Length` header.
+        None when not known.
+        """
+        if self.response is None:
+            return None
+        if self.kwargs.get("stream"):
+            length = self.response.headers.get("Content-Length")
+            return int(length) if length and length.isdigit() else None
+        return len(self.response.content)
+
+
+@lru_cache(maxsize=None)
+def _api_path_patterns() -> List[Tuple[Pattern, str]]:
+    """Compile the paths of the `API_PATH` into regular expressions, the paths without arguments first."""
+    patterns = []
+    for resource, path in API_PATH.items():
+        regex = re.sub(r"\\\{[^}]*\\\}", "[^/]+", re.escape(path.lstrip("/")))
+        patterns.append((path.count("{"), re.compile(f"{regex}$"), resource))
+    return [
+        (pattern, resource)
+        for _, pattern, resource in sorted(patterns, key=lambda p: p[0])
+    ]
+
+
+def api_resource(api_root: str, url: str) -> Optional[str]:
+    """
+    Determine the name of the resource in the `API_PATH` of an url of KE-chain.
+
+    :param api_root: url of the KE-chain instance
+    :param url: url of the request, eg. as created by `Client._build_url()`
+    :return: name of the resource, eg. `parts`, or None when the url does not match any resource
+    """
+    path = urlparse(url).path
+    root = urlparse(api_root).path.rstrip("/")
+    if not path.startswith(root):
+        return None
+    path = path.replace(root, "", 1).lstrip("/")
+    for pattern, resource in _api_path_patterns():
+        if pattern.match(path):
+            return resource
+    return None
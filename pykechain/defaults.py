@@ -1,10 +1,18 @@
 """All pykechain configuration constants will be listed here."""
+
 #
 # Configuration of async download of activity pdf exports
 #
 ASYNC_REFRESH_INTERVAL = 2  # seconds
 ASYNC_TIMEOUT_LIMIT = 180  # seconds
 
+#
+# Configuration of the polling of asynchronous operations by a `Job`, with an interval growing by `JOB_POLL_BACKOFF`
+#
+JOB_POLL_INTERVAL = 0.5  # seconds
+JOB_POLL_MAX_INTERVAL = 10  # seconds
+JOB_POLL_BACKOFF = 1.5  # factor
+
 #
 # Configuration of the retry options for the client requests based on `urlib3.utils.Retry`.
 #
@@ -34,6 +42,44 @@ RETRY_BACKOFF_FACTOR = 0.8
 # Batching of parts when a large number of parts are requested at once
 PARTS_BATCH_LIMIT = 100  # number of parts
 
+#
+# Configuration of the (opt-in) object cache of the client, see `Client.enable_object_cache()`
+#
+OBJECT_CACHE_MAX_SIZE = 10000  # number of objects
+OBJECT_CACHE_TTL = 300  # seconds
+
+#
+# Configuration of the (opt-in) disk cache of the client, see `Client.enable_disk_cache()`
+#
+DISK_CACHE_TTL = 24 * 60 * 60  # seconds
+
+#
+# Precompiled jsonschema validators, see `input_checks.schema_validator()`
+#
+SCHEMA_VALIDATORS_CACHE_SIZE = 256  # number of schemas
+
+#
+# Configuration of the `AsyncClient`
+#
+ASYNC_MAX_CONCURRENCY = 10  # number of requests in flight at the same time
+
+#
+# Configuration of the bulk update of property values, see `Property.update_values()`
+#
+PROPERTIES_BULK_UPDATE_CHUNK_SIZE = 500  # number of properties per request
+
+#
+# Retrieval of the parts and forms created in bulk, see `Client._create_parts_bulk()`
+#
+BULK_CREATE_RETRIEVE_CHUNK_SIZE = 50  # number of objects retrieved per `id__in` request
+BULK_CREATE_RETRIEVE_MAX_WORKERS = 4  # number of `id__in` requests sent concurrently
+
+#
+# Transfer of attachments when copying or moving parts, see `extra_utils.transfer_attachments()`
+#
+ATTACHMENTS_TRANSFER_MAX_WORKERS = 4  # number of attachments transferred concurrently
+ATTACHMENTS_TRANSFER_CHUNK_SIZE = 1024 * 1024  # bytes streamed from the download into the upload at once
+
 #
 # API Paths and API Extra Parameters
 #
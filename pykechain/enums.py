@@ -1,3 +1,5 @@
+from typing import Any, FrozenSet, Tuple
+
 from pykechain.utils import __dict__inherited__
 
 
@@ -13,18 +15,39 @@ class Enum:
 
     """
 
+    # the options and values are computed once, when the (sub)class is created
+    __options__: Tuple[Tuple[Any, str], ...] = ()
+    __values__: Tuple[Any, ...] = ()
+    __value_set__: FrozenSet[Any] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__options__ = tuple(
+            sorted(
+                (value, name)
+                for (name, value) in __dict__inherited__(cls=cls, stop=Enum).items()
+            )
+        )
+        cls.__values__ = tuple(value for (value, name) in cls.__options__)
+        cls.__value_set__ = frozenset(cls.__values__)
+
     @classmethod
     def options(cls):
         """Provide a sorted list of options."""
-        return sorted(
-            (value, name)
-            for (name, value) in __dict__inherited__(cls=cls, stop=Enum).items()
-        )
+        return list(cls.__options__)
 
     @classmethod
     def values(cls):
         """Provide a (sorted) list of values."""
-        return [value for (value, name) in cls.options()]
+        return list(cls.__values__)
+
+    @classmethod
+    def has_value(cls, value) -> bool:
+        """Check whether the value is one of the values of the enumeration, in constant time."""
+        try:
+            return value in cls.__value_set__
+        except TypeError:  # unhashable values are never an option
+            return False
 
 
 class Multiplicity(Enum):
@@ -583,6 +606,7 @@ class KechainEnv(Enum):
     :cvar KECHAIN_SCOPE_STATUS: the status of the Scope to retrieve, defaults to None to retrieve
         all scopes
     :cvar KECHAIN_CHECK_CERTIFICATES: if the certificates of the URL should be checked.
+    :cvar KECHAIN_CACHE_DIR: the directory of the disk cache of the client, see `Client.enable_disk_cache()`.
     """
 
     KECHAIN_FORCE_ENV_USE = "KECHAIN_FORCE_ENV_USE"
@@ -594,6 +618,7 @@ class KechainEnv(Enum):
     KECHAIN_SCOPE_ID = "KECHAIN_SCOPE_ID"
     KECHAIN_SCOPE_STATUS = "KECHAIN_SCOPE_STATUS"
     KECHAIN_CHECK_CERTIFICATES = "KECHAIN_CHECK_CERTIFICATES"
+    KECHAIN_CACHE_DIR = "KECHAIN_CACHE_DIR"
 
 
 class SortTable(Enum):
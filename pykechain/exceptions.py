@@ -124,6 +124,18 @@ class ClientError(APIError):
     pass
 
 
+class BulkUpdateError(APIError):
+    """One or more chunks of a bulk update failed.
+
+    :ivar failed: the error of the failed chunk per id of the objects in that chunk
+    """
+
+    def __init__(self, *args, failed: dict = None, **kwargs):
+        """Initialise the `BulkUpdateError` with the errors per id of the objects that failed to update."""
+        self.failed = failed or dict()
+        super().__init__(*args, **kwargs)
+
+
 class IllegalArgumentError(ValueError):
     """Illegal arguments where provided."""
 
@@ -142,6 +154,18 @@ class PDFDownloadTimeoutError(APIError):
     pass
 
 
+class JobTimeoutError(APIError):
+    """One or more asynchronous operations are not done within the timeout.
+
+    :ivar jobs: the jobs of the operations that are not done
+    """
+
+    def __init__(self, *args, jobs: list = None, **kwargs):
+        """Initialise the `JobTimeoutError` with the jobs that are not done."""
+        self.jobs = jobs or list()
+        super().__init__(*args, **kwargs)
+
+
 class _DeprecationMixin:
     __notified = False
 
@@ -1,20 +1,74 @@
-import os
-import tempfile
 import warnings
 from collections import namedtuple
-from typing import Optional, List, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Any, Dict, Iterable, Iterator, Tuple
 
 from pykechain import Client
+from pykechain.batch import Batch
+from pykechain.defaults import ATTACHMENTS_TRANSFER_MAX_WORKERS
 from pykechain.enums import PropertyType, Multiplicity, Category
 from pykechain.exceptions import IllegalArgumentError, NotFoundError, MultipleFoundError
-from pykechain.models import Part, AnyProperty, Property, PropertyValueFilter
-from pykechain.utils import temp_chdir
+from pykechain.models import (
+    Part,
+    AnyProperty,
+    AttachmentProperty,
+    Property,
+    PropertyValueFilter,
+)
+from pykechain.utils import get_in_chunks
+
+
+class CopySession:
+    """
+    State of a single copy (or move) of parts.
+
+    The session maps the ids of the original parts and properties to the new objects, and keeps the reference
+    and attachment properties of which the values are set after all parts are created.
+
+    Every copy uses its own session, activated for the current thread (or asyncio task) using
+    :func:`CopySession.activate()`, such that independent copies can run concurrently. Outside an active session,
+    the helper functions of this module share a module-level session.
+
+    .. versionadded:: 4.17
+
+    :ivar mapping: new object per id of the original part or property
+    :ivar edited_one_many: ids of the new models with multiplicity ONE_MANY of which the first instance is used
+    :ivar references: ids of the referenced objects per original reference property
+    :ivar attachments: original attachment properties
+    """
+
+    def __init__(self):
+        """Create an empty copy session."""
+        self.mapping: Dict[str, Any] = dict()
+        self.edited_one_many: List[str] = list()
+        self.references: Dict[AnyProperty, List] = dict()
+        self.attachments: List[AttachmentProperty] = list()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke {self.__class__.__name__} {len(self.mapping)} mapped objects>"
+
+    @contextmanager
+    def activate(self) -> Iterator["CopySession"]:
+        """Make this the session used by the helper functions in the current thread, within the block."""
+        token = _active_copy_session.set(self)
+        try:
+            yield self
+        finally:
+            _active_copy_session.reset(token)
+
+
+# the copy session of the current thread or asyncio task, see `CopySession.activate()`
+_active_copy_session: ContextVar[Optional[CopySession]] = ContextVar(
+    "pykechain_active_copy_session", default=None
+)
+_module_copy_session = CopySession()
+
+
+def current_copy_session() -> CopySession:
+    """Return the active copy session of the current thread, or the module-level session if there is none."""
+    return _active_copy_session.get() or _module_copy_session
 
-# global variable
-__mapping_dictionary = None
-__edited_one_many: list = list()
-__references = dict()
-__attachments = list()
 
 _InstanceCopy = namedtuple(
     "InstanceCopyAttributes",
@@ -36,12 +90,12 @@ def get_mapping_dictionary(clean=False) -> dict:
 
     :param clean: (optional) boolean flag to reset the mapping dictionary
     :type clean: bool
-    :return: singleton dictionary (persistent in the script) for mapping use.
+    :return: dictionary of the current copy session (see `current_copy_session()`) for mapping use.
     """
-    global __mapping_dictionary
-    if not __mapping_dictionary or clean:
-        __mapping_dictionary = dict()
-    return __mapping_dictionary
+    session = current_copy_session()
+    if clean:
+        session.mapping = dict()
+    return session.mapping
 
 
 def get_edited_one_many(clean=False) -> list:
@@ -52,12 +106,12 @@ def get_edited_one_many(clean=False) -> list:
 
     :param clean: (optional) boolean flag to reset the list of Parts
     :type clean: bool
-    :return: singleton list (persistent in the script) for tracking purposes
+    :return: list of the current copy session (see `current_copy_session()`) for tracking purposes
     """
-    global __edited_one_many
-    if not __edited_one_many or clean:
-        __edited_one_many = list()
-    return __edited_one_many
+    session = current_copy_session()
+    if clean:
+        session.edited_one_many = list()
+    return session.edited_one_many
 
 
 def get_references(clean=False) -> dict:
@@ -66,12 +120,12 @@ def get_references(clean=False) -> dict:
 
     :param clean: (optional) boolean flag to reset the list of references
     :type clean: bool
-    :return: singleton dictionary (persistent in the script) for tracking purposes
+    :return: dictionary of the current copy session (see `current_copy_session()`) for tracking purposes
     """
-    global __references
-    if not __references or clean:
-        __references = dict()
-    return __references
+    session = current_copy_session()
+    if clean:
+        session.references = dict()
+    return session.references
 
 
 def get_attachments(clean=False) -> list:
@@ -80,12 +134,44 @@ def get_attachments(clean=False) -> list:
 
     :param clean: (optional) boolean flag to reset the list
     :type clean: bool
-    :return: singleton list (persistent in the script) for tracking purposes
+    :return: list of the current copy session (see `current_copy_session()`) for tracking purposes
+    """
+    session = current_copy_session()
+    if clean:
+        session.attachments = list()
+    return session.attachments
+
+
+def transfer_attachments(
+    transfers: Iterable[Tuple[AttachmentProperty, AttachmentProperty]],
+    max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
+) -> None:
+    """
+    Copy the attachments of the original attachment properties to the new attachment properties.
+
+    Every attachment is streamed from its download into its upload, see `AttachmentProperty.copy_to()`, without
+    being saved to disk. The attachments are transferred concurrently using `max_workers` threads.
+
+    :param transfers: pairs of the original and the new attachment property
+    :type transfers: iterable of tuples
+    :param max_workers: (optional) number of attachments to transfer concurrently, defaults to 4.
+        None or 1 to transfer the attachments one by one.
+    :type max_workers: int or None
+    :raises APIError: When unable to download or upload an attachment
     """
-    global __attachments
-    if not __attachments or clean:
-        __attachments = list()
-    return __attachments
+
+    def transfer(original_and_new: Tuple[AttachmentProperty, AttachmentProperty]):
+        prop_original, prop_new = original_and_new
+        prop_original.copy_to(prop_new)
+
+    transfers = list(transfers)
+    if max_workers and max_workers > 1 and len(transfers) > 1:
+        client = transfers[0][0]._client
+        with client._thread_pool(max_workers) as executor:
+            list(executor.map(transfer, transfers))
+    else:
+        for original_and_new in transfers:
+            transfer(original_and_new)
 
 
 def get_illegal_targets(part: Part, include: set):
@@ -296,6 +382,7 @@ def relocate_instance(
     target_parent: Part,
     name: Optional[str] = None,
     include_children: Optional[bool] = True,
+    max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
 ) -> Part:
     """
     Move the `Part` instance under a target parent `Part` instance.
@@ -310,6 +397,8 @@ def relocate_instance(
     :type name: basestring
     :param include_children: True to move also the descendants of `Part`. If False, the children will be lost.
     :type include_children: bool
+    :param max_workers: (optional) number of attachments to transfer concurrently, defaults to 4
+    :type max_workers: int or None
     :return: moved :class: `Part` instance
     """
     warnings.warn(
@@ -344,6 +433,7 @@ def relocate_instance(
         part_model=part_model,
         name=name,
         include_children=include_children,
+        max_workers=max_workers,
     )
 
     # Try to update references to parts by updating the UUID via the mapping dictionary
@@ -369,6 +459,7 @@ def move_part_instance(
     part_model: Part,
     name: Optional[str] = None,
     include_children: Optional[bool] = True,
+    max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
 ) -> Part:
     """
     Copy the `Part` instance to target parent and updates the properties based on the original part instance.
@@ -385,6 +476,8 @@ def move_part_instance(
     :type name: basestring
     :param include_children: True to move also the descendants of `Part`. If False, the children will be lost.
     :type include_children: bool
+    :param max_workers: (optional) number of attachments to transfer concurrently, defaults to 4
+    :type max_workers: int or None
     :return: moved :class: `Part` instance
     """
     warnings.warn(
@@ -422,7 +515,9 @@ def move_part_instance(
 
     # Update properties of the instance
     map_property_instances(original_part=part_instance, new_part=moved_instance)
-    update_part_with_properties(part_instance, moved_instance, name=str(name))
+    update_part_with_properties(
+        part_instance, moved_instance, name=str(name), max_workers=max_workers
+    )
 
     if include_children:
         sub_models = {child.id: child for child in part_model.children()}
@@ -435,6 +530,7 @@ def move_part_instance(
                 part_model=sub_models.get(sub_instance.model_id, sub_instance.model()),
                 name=sub_instance.name,
                 include_children=True,
+                max_workers=max_workers,
             )
 
     return moved_instance
@@ -444,6 +540,7 @@ def update_part_with_properties(
     part_instance: Part,
     moved_instance: Part,
     name: Optional[str] = None,
+    max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
 ) -> Part:
     """
     Update the properties of the `moved_instance` based on the original `part_instance`.
@@ -454,6 +551,8 @@ def update_part_with_properties(
     :type moved_instance: :class:`Part`
     :param name: Name of the updated part
     :type name: basestring
+    :param max_workers: (optional) number of attachments to transfer concurrently, defaults to 4
+    :type max_workers: int or None
     :return: moved :class: `Part` instance
     """
     warnings.warn(
@@ -463,18 +562,14 @@ def update_part_with_properties(
 
     # Instantiate an empty dictionary used to collect all property values in order to update the part in one go.
     properties_id_dict = dict()
+    attachment_transfers = list()
     for prop_instance in part_instance.properties:  # type: AnyProperty
         moved_prop_instance = get_mapping_dictionary()[prop_instance.id]
 
         # Do different magic if there is an attachment property and it has a value
         if prop_instance.type == PropertyType.ATTACHMENT_VALUE:
             if prop_instance.has_value():
-                with temp_chdir() as target_dir:
-                    full_path = os.path.join(
-                        target_dir or os.getcwd(), prop_instance.filename
-                    )
-                    prop_instance.save_as(filename=full_path)
-                    moved_prop_instance.upload(full_path)
+                attachment_transfers.append((prop_instance, moved_prop_instance))
             else:
                 moved_prop_instance.clear()
 
@@ -500,6 +595,8 @@ def update_part_with_properties(
         else:
             properties_id_dict[moved_prop_instance.id] = prop_instance.value
 
+    transfer_attachments(attachment_transfers, max_workers=max_workers)
+
     # Update the name and property values in one go.
     moved_instance.update(
         name=str(name), update_dict=properties_id_dict, bulk=True, suppress_kevents=True
@@ -514,6 +611,8 @@ def _copy_part(
     name: Optional[str] = None,
     include_children: Optional[bool] = True,
     include_instances: Optional[bool] = True,
+    max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
+    per_level: Optional[bool] = False,
 ) -> Part:
     """
     Copy `part` below `target_parent`, optionally including all child Parts.
@@ -528,14 +627,47 @@ def _copy_part(
     :param include_children: (O) include the descendants of `part`, defaults to True
     :param include_instances: (O) In case of `part` being of category MODEL, include the instance Parts of that model.
         WARNING: By default, every instance is created per instance of the `target_parent`.
+    :param max_workers: (O) number of attachments to transfer concurrently, defaults to 4
+    :param per_level: (O) copy the part instances level by level, see `_copy_instances()`, defaults to False
     :return: copy of `part`
     :rtype Part
     """
-    get_mapping_dictionary(clean=True)
-    get_edited_one_many(clean=True)
-    get_references(clean=True)
-    get_attachments(clean=True)
+    # Every copy keeps its own state and batch of updates, so independent copies can run in parallel threads.
+    with CopySession().activate(), part._client.batch() as batch:
+        return _copy_part_in_session(
+            part=part,
+            target_parent=target_parent,
+            batch=batch,
+            name=name,
+            include_children=include_children,
+            include_instances=include_instances,
+            max_workers=max_workers,
+            per_level=per_level,
+        )
+
+
+def _copy_part_in_session(
+    part: Part,
+    target_parent: Part,
+    batch: Batch,
+    name: Optional[str] = None,
+    include_children: Optional[bool] = True,
+    include_instances: Optional[bool] = True,
+    max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
+    per_level: Optional[bool] = False,
+) -> Part:
+    """
+    Copy `part` below `target_parent` using the active copy session, see `_copy_part()`.
+
+    The property values and part edits are collected in the `batch`, which is sent once the part models
+    are copied. The remaining updates are sent when the batch exits.
 
+    :param part: Part to copy
+    :param target_parent: Part to copy below
+    :param batch: the active batch of the client
+    :return: copy of `part`
+    :rtype Part
+    """
     if part.category == Category.INSTANCE:
         model = part.model()
         target_parent_model = target_parent.model()
@@ -600,28 +732,29 @@ def _copy_part(
         include_children=include_children,
     )
 
-    Property.set_bulk_update(True)
     _update_references()
-    Property.update_values(client=copied_model._client, use_bulk_update=True)
+    batch.flush()
 
-    copied_instances = _copy_instances_recursive(
+    copy_instances = _copy_instances if per_level else _copy_instances_recursive
+    copied_instances = copy_instances(
         client=copied_model._client,
         instances=instances,
         include_children=include_children,
     )
+    # the parts merged back into the copies after their edits are sent must not overwrite the uploaded attachments
+    batch.flush(include_properties=False)
 
     mapping = get_mapping_dictionary()
-    attachment_properties = get_attachments()
-    for prop_original in attachment_properties:
-        prop_new = mapping[prop_original.id]
-        if prop_original.has_value():
-            with tempfile.TemporaryDirectory() as target_dir:
-                full_path = os.path.join(target_dir, prop_original.filename)
-                prop_original.save_as(filename=full_path)
-                prop_new.upload(full_path)
+    transfer_attachments(
+        (
+            (prop_original, mapping[prop_original.id])
+            for prop_original in get_attachments()
+            if prop_original.has_value()
+        ),
+        max_workers=max_workers,
+    )
 
     _update_references()
-    Property.update_values(client=copied_model._client)
 
     return copied_model if part.category == Category.MODEL else copied_instances[0]
 
@@ -751,6 +884,271 @@ def _copy_instances_recursive(
     return new_instances
 
 
+def _copy_instances(
+    client: Client,
+    instances: List[_InstanceCopy],
+    include_children: bool,
+) -> List[Part]:
+    """
+    Create new Part instances in bulk, level by level.
+
+    Every level of the trees is copied using one request to retrieve the children of the original instances, one
+    request to retrieve the instances that were automatically created with their parent and one bulk create of the
+    remaining instances, such that the number of requests depends on the depth of the trees rather than on the
+    number of instances. The renames of the automatically created instances are collected in a batch of the client,
+    see `Client.batch()`.
+
+    This is opt-in (`Part.copy(per_level=True)`): the recorded copy and move tests cover the request sequence of
+    `_copy_instances_recursive()`, which remains the default.
+
+    Reference and Attachment properties have to be updated outside this function.
+
+    :param client: Client object
+    :param instances: list of _Instance instances.
+    :param include_children: whether to create instance parts
+    :return: list of new Part instances of the top level
+    :rtype list
+    """
+    with client.batch():
+        new_instances = level_new_instances = _copy_instances_level(
+            client=client, instances=instances
+        )
+
+        level_instances = instances
+        while include_children and level_instances:
+            _prefetch_children(client=client, instances=level_instances)
+            level_instances = _child_instance_copies(
+                instances=level_instances, new_instances=level_new_instances
+            )
+            level_new_instances = _copy_instances_level(
+                client=client, instances=level_instances
+            )
+
+    return new_instances
+
+
+def _prefetch_children(client: Client, instances: List[_InstanceCopy]) -> None:
+    """
+    Populate the children of a level of original instances at once, so these are provided without requests.
+
+    Only the instances of which the model has children are populated. The part models are expected to be
+    populated already.
+
+    :param client: Client object
+    :param instances: list of _Instance instances of the current level.
+    """
+    parents = {
+        i.instance_original.id: i.instance_original
+        for i in instances
+        if i.instance_original._cached_children is None and i.model_original.children()
+    }
+    if not parents:
+        return
+
+    children_per_parent = _retrieve_children_per_parent(
+        client=client, parent_ids=list(parents)
+    )
+    for parent_id, parent in parents.items():
+        children = children_per_parent.get(parent_id, [])
+        for child in children:
+            child._parent = parent
+        parent._cached_children = children
+
+
+def _child_instance_copies(
+    instances: List[_InstanceCopy],
+    new_instances: List[Part],
+) -> List[_InstanceCopy]:
+    """
+    Plan the copies of the children of a level of instances.
+
+    :param instances: list of _Instance instances of the current level.
+    :param new_instances: list of the new Part instances of the current level, in the same order.
+    :return: list of _Instance instances of the next level.
+    """
+    child_instances = []
+    for i, new_instance in zip(instances, new_instances):
+        child_models = {c.id: c for c in i.model_original.children()}
+        if not child_models:
+            # an instance cannot have children without its model having children
+            continue
+
+        for child_instance in i.instance_original.children():
+            child_instances.append(
+                _InstanceCopy(
+                    instance_original=child_instance,
+                    model_original=child_models[child_instance.model_id],
+                    target_parent_instance=new_instance,
+                    name=child_instance.name,
+                )
+            )
+    return child_instances
+
+
+def _retrieve_children_per_parent(
+    client: Client, parent_ids: List[str]
+) -> Dict[str, List[Part]]:
+    """
+    Retrieve the child instances of the parent instances, grouped per parent id.
+
+    :param client: Client object
+    :param parent_ids: list of UUIDs of the parent instances
+    :return: dictionary with a list of Part instances per parent id
+    """
+    children_per_parent = dict()
+    for parent_ids_chunk in get_in_chunks(lst=parent_ids, chunk_size=50):
+        for part in client.parts(
+            parent_id__in=",".join(parent_ids_chunk), category=Category.INSTANCE
+        ):
+            children_per_parent.setdefault(part.parent_id, []).append(part)
+    return children_per_parent
+
+
+def _retrieve_instances_per_parent(
+    client: Client, parent_ids: List[str]
+) -> Dict[Tuple[str, str], List[Part]]:
+    """
+    Retrieve the child instances of the parent instances, grouped per parent id and model id.
+
+    :param client: Client object
+    :param parent_ids: list of UUIDs of the parent instances
+    :return: dictionary with a list of Part instances per (parent id, model id) tuple
+    """
+    instances_per_parent = dict()
+    for children in _retrieve_children_per_parent(
+        client=client, parent_ids=parent_ids
+    ).values():
+        for part in children:
+            instances_per_parent.setdefault((part.parent_id, part.model_id), []).append(
+                part
+            )
+    return instances_per_parent
+
+
+def _copy_instances_level(
+    client: Client,
+    instances: List[_InstanceCopy],
+) -> List[Part]:
+    """
+    Copy a single level of Part instances, using the instances created automatically where applicable.
+
+    :param client: Client object
+    :param instances: list of _Instance instances.
+    :return: list of new Part instances, in the same order
+    :rtype list
+    """
+    if not instances:
+        return []
+
+    mapping = get_mapping_dictionary()
+
+    # Plan which instances were automatically created together with their (new) parent.
+    use_existing = []
+    for i in instances:
+        model_new = mapping[i.model_original.id]
+
+        if model_new.multiplicity == Multiplicity.ONE:
+            # If multiplicity is 'Exactly 1', that means the instance was automatically created with the model.
+            use_existing.append(True)
+
+        elif model_new.multiplicity == Multiplicity.ONE_MANY:
+            # If multiplicity is '1 or more', that means one instance has automatically been created with the model.
+            # This first instance has to be used, but only once. Therefore, store the model in a global list after
+            # doing so.
+            if model_new.id not in get_edited_one_many():
+                get_edited_one_many().append(model_new.id)
+                use_existing.append(True)
+            else:
+                use_existing.append(False)
+        else:
+            # If multiplicity is '0 or more' or '0 or 1', no instance has been created automatically with the model.
+            use_existing.append(False)
+
+    # Retrieve the automatically created instances of the whole level at once.
+    parent_ids = sorted(
+        {
+            i.target_parent_instance.id
+            for i, existing in zip(instances, use_existing)
+            if existing
+        }
+    )
+    instances_per_parent = (
+        _retrieve_instances_per_parent(client=client, parent_ids=parent_ids)
+        if parent_ids
+        else dict()
+    )
+
+    create_request = []  # request for the bulk create
+    created_instances_indices = []  # indices in a list
+    original_instances = []  # part instances that require a copy
+    new_instances = []  # all new Part objects
+
+    for index, (i, existing) in enumerate(zip(instances, use_existing)):
+        model_new = mapping[i.model_original.id]
+        existing_instance = None
+        if existing:
+            candidates = instances_per_parent.get(
+                (i.target_parent_instance.id, model_new.id)
+            )
+            if candidates:
+                existing_instance = candidates[0]
+
+        if existing_instance:
+            new_instances.append(existing_instance)
+            map_property_instances(
+                original_part=i.instance_original, new_part=existing_instance
+            )
+
+            if i.name != existing_instance.name:
+                existing_instance.edit(name=i.name)
+
+            # part already exists, but properties need to be updated
+            for prop_original in i.instance_original.properties:
+                prop = mapping.get(prop_original.id)
+                prop.value = _get_property_value(prop_original)
+        else:
+            new_instances.append(None)
+            created_instances_indices.append(index)
+            original_instances.append(i)
+
+            properties = []
+            for prop in i.instance_original.properties:  # type: AnyProperty
+                prop_value = _get_property_value(prop)
+                if prop_value is not None:
+                    properties.append(
+                        dict(
+                            name=prop.name,
+                            value=prop_value,
+                            model_id=mapping[prop.model_id].id,
+                        )
+                    )
+
+            create_request.append(
+                dict(
+                    name=i.name,
+                    parent_id=i.target_parent_instance.id,
+                    model_id=model_new.id,
+                    properties=properties,
+                )
+            )
+
+    if create_request:
+        created_instances = client._create_parts_bulk(
+            parts=create_request,
+            asynchronous=False,
+            retrieve_instances=True,
+        )
+        for index, new_instance, i in zip(
+            created_instances_indices, created_instances, original_instances
+        ):  # type: int, Part, _InstanceCopy
+            new_instances[index] = new_instance
+            map_property_instances(
+                original_part=i.instance_original, new_part=new_instance
+            )
+
+    return new_instances
+
+
 def _update_references() -> None:
     """
     Set part reference values found when copying the Part(s).
@@ -0,0 +1,181 @@
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+
+from pykechain.defaults import (
+    ASYNC_TIMEOUT_LIMIT,
+    JOB_POLL_BACKOFF,
+    JOB_POLL_INTERVAL,
+    JOB_POLL_MAX_INTERVAL,
+)
+from pykechain.exceptions import JobTimeoutError
+
+
+class Job:
+    """
+    Handle of an operation that KE-chain performs asynchronously, eg. `Client.delete_scope(asynchronous=True)`.
+
+    KE-chain does not report the progress of its asynchronous operations, so a job checks whether the operation is
+    done by looking at its outcome, eg. whether the deleted parts are gone. `Job.wait()` repeats this check with an
+    adaptive backoff: the interval between checks starts at `interval` and grows by a factor `backoff` up to
+    `max_interval`, such that short operations are noticed quickly while long operations are not polled heavily.
+    Use `wait_all()` to wait for multiple jobs together.
+
+    .. versionadded:: 4.17
+
+    :ivar description: description of the operation
+    :ivar response: the response of KE-chain on the request that started the operation
+    :ivar polls: the number of times the job checked whether the operation is done
+    """
+
+    def __init__(
+        self,
+        description: str,
+        check: Callable[[], bool],
+        result: Optional[Callable[[], Any]] = None,
+        response=None,
+    ):
+        """
+        Create a job for an operation that has been started.
+
+        :param description: description of the operation
+        :type description: basestring
+        :param check: function returning whether the operation is done
+        :type check: callable
+        :param result: (optional) function providing the result once the operation is done
+        :type result: callable or None
+        :param response: (optional) the response of KE-chain on the request that started the operation
+        :type response: requests.Response or None
+        """
+        self.description = description
+        self.response = response
+        self.polls = 0
+        self._check = check
+        self._result_function = result
+        self._result = None
+        self._done = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):  # pragma: no cover
+        return (
+            f"<pyke {self.__class__.__name__} '{self.description}' "
+            f"{'done' if self._done else 'pending'}>"
+        )
+
+    @property
+    def done(self) -> bool:
+        """Whether the operation was found to be done, without checking KE-chain again."""
+        return self._done
+
+    @property
+    def result(self) -> Any:
+        """The result of the operation, eg. the created parts, None as long as the operation is not done."""
+        return self._result
+
+    def poll(self) -> bool:
+        """
+        Check once whether the operation is done, without waiting.
+
+        :return: whether the operation is done
+        :rtype: bool
+        """
+        with self._lock:
+            if not self._done:
+                self.polls += 1
+                if self._check():
+                    if self._result_function is not None:
+                        self._result = self._result_function()
+                    self._done = True
+            return self._done
+
+    def wait(
+        self,
+        timeout: Optional[float] = ASYNC_TIMEOUT_LIMIT,
+        interval: float = JOB_POLL_INTERVAL,
+        max_interval: float = JOB_POLL_MAX_INTERVAL,
+        backoff: float = JOB_POLL_BACKOFF,
+    ) -> Any:
+        """
+        Wait until the operation is done.
+
+        :param timeout: (optional) number of seconds to wait at most (default 180), None to wait indefinitely
+        :type timeout: float or None
+        :param interval: number of seconds between the first checks (default 0.5)
+        :type interval: float
+        :param max_interval: maximum number of seconds between checks (default 10)
+        :type max_interval: float
+        :param backoff: factor by which the interval grows after every check (default 1.5)
+        :type backoff: float
+        :return: the result of the operation
+        :raises JobTimeoutError: if the operation is not done within the timeout
+        """
+        return wait_all(
+            [self],
+            timeout=timeout,
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+        )[0]
+
+
+def wait_all(
+    jobs: Iterable[Job],
+    timeout: Optional[float] = ASYNC_TIMEOUT_LIMIT,
+    interval: float = JOB_POLL_INTERVAL,
+    max_interval: float = JOB_POLL_MAX_INTERVAL,
+    backoff: float = JOB_POLL_BACKOFF,
+) -> List[Any]:
+    """
+    Wait until all operations are done, such that multiple operations can run in KE-chain at the same time.
+
+    Every round, the jobs that are not yet done are checked once, after which the interval grows as in `Job.wait()`.
+
+    .. versionadded:: 4.17
+
+    :param jobs: the jobs to wait for
+    :type jobs: list of Job
+    :param timeout: (optional) number of seconds to wait at most (default 180), None to wait indefinitely
+    :type timeout: float or None
+    :param interval: number of seconds between the first checks (default 0.5)
+    :type interval: float
+    :param max_interval: maximum number of seconds between checks (default 10)
+    :type max_interval: float
+    :param backoff: factor by which the interval grows after every check (default 1.5)
+    :type backoff: float
+    :return: the results of the operations, in the order of the jobs
+    :rtype: list
+    :raises JobTimeoutError: if any operation is not done within the timeout
+
+    Example
+    -------
+    >>> jobs = [client.delete_scope(scope, asynchronous=True) for scope in old_scopes]
+    >>> wait_all(jobs, timeout=600)
+
+    """
+    jobs = list(jobs)
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    pending = [job for job in jobs if not job.done]
+    while pending:
+        pending = [job for job in pending if not job.poll()]
+        if not pending:
+            break
+
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise JobTimeoutError(
+                    "{} of {} asynchronous operations not done within {} seconds:\n{}".format(
+                        len(pending),
+                        len(jobs),
+                        timeout,
+                        "\n".join(job.description for job in pending),
+                    ),
+                    jobs=pending,
+                )
+            time.sleep(min(interval, remaining))
+        else:
+            time.sleep(interval)
+        interval = min(interval * backoff, max_interval)
+
+    return [job.result for job in jobs]
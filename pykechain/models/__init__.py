@@ -32,6 +32,8 @@ from .property_reference import (
     SignatureProperty,
 )
 from .partset import PartSet
+from .snapshot import ScopeSnapshot
+from .light import LightBase, LightPart, LightProperty
 from .service import Service, ServiceExecution
 from .team import Team
 from .user import User
@@ -88,6 +90,10 @@ __all__ = (
     "Part",
     "Part2",
     "PartSet",
+    "ScopeSnapshot",
+    "LightBase",
+    "LightPart",
+    "LightProperty",
     "Service",
     "ServiceExecution",
     "User",
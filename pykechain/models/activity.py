@@ -1,7 +1,7 @@
 import datetime
 import os
 import time
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 from urllib.parse import urljoin
 
 import requests
@@ -10,6 +10,7 @@ from pykechain.defaults import (
     API_EXTRA_PARAMS,
     ASYNC_REFRESH_INTERVAL,
     ASYNC_TIMEOUT_LIMIT,
+    PARTS_BATCH_LIMIT,
 )
 from pykechain.enums import (
     ActivityClassification,
@@ -40,7 +41,6 @@ from pykechain.models.representations.component import RepresentationsComponent
 from pykechain.models.tags import TagsMixin
 from pykechain.models.tree_traversal import TreeObject
 from pykechain.models.user import User
-from pykechain.models.widgets.widgets_manager import WidgetsManager
 from pykechain.utils import (
     Empty,
     clean_empty_values,
@@ -51,6 +51,9 @@ from pykechain.utils import (
     parse_datetime,
 )
 
+if TYPE_CHECKING:
+    from pykechain.models.widgets.widgets_manager import WidgetsManager
+
 
 class Activity(TreeObject, TagsMixin):
     """A virtual object representing a KE-chain activity.
@@ -100,7 +103,7 @@ class Activity(TreeObject, TagsMixin):
             self._options.get("representations", {}),
             self._save_representations,
         )
-        self._widgets_manager: Optional[WidgetsManager] = None
+        self._widgets_manager: Optional["WidgetsManager"] = None
 
     def __call__(self, *args, **kwargs) -> "Activity":
         """Short-hand version of the `child` method."""
@@ -199,7 +202,7 @@ class Activity(TreeObject, TagsMixin):
         if not parent_dict:
             parent_name = self._client.activity(id=self.parent_id).name
 
-        return parent_name in ActivityRootNames.values()
+        return ActivityRootNames.has_value(parent_name)
 
     def is_task(self) -> bool:
         """
@@ -274,7 +277,7 @@ class Activity(TreeObject, TagsMixin):
 
         :return: Return True if it is a root object, otherwise return False
         """
-        return self.name in ActivityRootNames.values() and self.parent_id is None
+        return ActivityRootNames.has_value(self.name) and self.parent_id is None
 
     def is_configured(self) -> bool:
         """
@@ -335,7 +338,9 @@ class Activity(TreeObject, TagsMixin):
                 f"Cannot find parent for task '{self}', as this task exist on top level."
             )
         elif self._parent is None:
-            self._parent = self._client.activity(pk=self.parent_id, scope=self.scope_id)
+            self._parent = self._client._cached_object(
+                Activity, self.parent_id
+            ) or self._client.activity(pk=self.parent_id, scope=self.scope_id)
         return self._parent
 
     def children(self, **kwargs) -> List["Activity"]:
@@ -455,6 +460,50 @@ class Activity(TreeObject, TagsMixin):
             parent_id=self.parent_id, scope=self.scope_id, **kwargs
         )
 
+    def populate_descendants(
+        self, batch: int = PARTS_BATCH_LIMIT, max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Retrieve the descendants of this activity and populate the :func:`Activity.children()` method.
+
+        The activities of the scope are retrieved in batches, after which the children and the children's
+        children of this activity are prepopulated, making the traversal through the activity tree (eg. using
+        :func:`Activity.all_children()`) possible without additional requests.
+
+        .. versionadded:: 4.17
+
+        :param batch: Number of Activities to be retrieved in a batch
+        :type batch: int (defaults to 100)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
+        :returns: None
+        :raises APIError: if the activities could not be retrieved.
+
+        Example
+        -------
+        >>> subprocess = project.activity('Subprocess')
+        >>> subprocess.populate_descendants()
+        >>> tasks = subprocess.all_children()
+
+        """
+        activities = self._client.activities(
+            scope=self.scope_id, batch=batch, max_workers=max_workers
+        )
+        children_by_parent_id = dict()
+        for activity in activities:
+            children_by_parent_id.setdefault(activity.parent_id, []).append(activity)
+
+        # only the activities in the subtree of this activity are its descendants
+        all_descendants = []
+        level = children_by_parent_id.get(self.id, [])
+        while level:
+            all_descendants.extend(level)
+            level = [c for a in level for c in children_by_parent_id.get(a.id, [])]
+
+        self._populate_cached_children(all_descendants=all_descendants, overwrite=True)
+
+        return None
+
     def all_children(self) -> List["Activity"]:
         """
         Retrieve a flat list of all descendants, sorted depth-first.
@@ -777,6 +826,7 @@ class Activity(TreeObject, TagsMixin):
 
         if response.status_code != requests.codes.no_content:
             raise APIError(f"Could not delete Activity {self}.", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
         return True
 
     #
@@ -898,6 +948,8 @@ class Activity(TreeObject, TagsMixin):
         :raises APIError: when the API does not support the widgets, or when API gives an error.
         """
         if self._widgets_manager is None:
+            from pykechain.models.widgets.widgets_manager import WidgetsManager
+
             widgets = self._client.widgets(activity=self.id, **kwargs)
             self._widgets_manager = WidgetsManager(widgets=widgets, activity=self)
         return self._widgets_manager
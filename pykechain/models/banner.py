@@ -104,4 +104,5 @@ class Banner(Base):
 
         if response.status_code != requests.codes.no_content:
             raise APIError(f"Could not delete Banner: {self}", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
         return True
@@ -16,6 +16,40 @@ class TooManyArgumentsWarning(UserWarning):
     pass
 
 
+class LazyDatetime:
+    """
+    Datetime attribute of a :class:`Base` object which can be parsed from the json upon first access.
+
+    Set the attribute to `LazyDatetime.UNPARSED` to postpone the parsing of the datetime string in the json.
+    """
+
+    UNPARSED = object()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if value is self.UNPARSED:
+            value = parse_datetime(instance._json_data.get(self.name))
+            instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+
 class Base:
     """Base model connecting retrieved data to a KE-chain client.
 
@@ -29,6 +63,9 @@ class Base:
     :type updated_at: datetime or None
     """
 
+    created_at = LazyDatetime()
+    updated_at = LazyDatetime()
+
     def __init__(self, json: Dict, client: "Client"):
         """Construct a model from provided json data."""
         self._json_data = json
@@ -37,8 +74,14 @@ class Base:
         self.id = json.get("id")
         self.name = json.get("name")
         self.ref = json.get("ref")
-        self.created_at = parse_datetime(json.get("created_at"))
-        self.updated_at = parse_datetime(json.get("updated_at"))
+        if self._client is not None and self._client.lazy_datetimes:
+            self.created_at = self.updated_at = LazyDatetime.UNPARSED
+        else:
+            self.created_at = parse_datetime(json.get("created_at"))
+            self.updated_at = parse_datetime(json.get("updated_at"))
+
+        if self._client is not None and self._client.object_cache is not None:
+            self._client.object_cache.add(self)
 
     def __repr__(self):  # pragma: no cover
         return f"<pyke {self.__class__.__name__} '{self.name}' id {self.id[-8:]}>"
@@ -78,6 +121,9 @@ class Base:
         else:
             src = self._client.reload(self, url=url, extra_params=extra_params)
             self.__dict__.update(src.__dict__)
+            # the object cache holds the reloaded object, which is replaced by this object
+            if self._client.object_cache is not None:
+                self._client.object_cache.add(self)
 
 
 class CrudActionsMixin:
@@ -95,8 +141,22 @@ class CrudActionsMixin:
     url_pk_name: str = None
 
     @classmethod
-    def list(cls, client: "Client", **kwargs) -> List["self"]:
-        """Retrieve a list of objects through the client."""
+    def list(
+        cls,
+        client: "Client",
+        limit: Optional[int] = None,
+        batch: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> List["self"]:
+        """Retrieve a list of objects through the client.
+
+        :param client: the client to retrieve the objects with
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :param kwargs: additional query parameters for the request
+        """
         if not cls.url_list_name:
             raise NotImplementedError(
                 "This object type does not implement the list and get function on the object "
@@ -107,14 +167,15 @@ class CrudActionsMixin:
             )
 
         kwargs.update(API_EXTRA_PARAMS[cls.url_list_name])
-        response = client._request(
-            "GET", client._build_url(cls.url_list_name), params=kwargs
+        pages = client._retrieve_pages(
+            client._build_url(cls.url_list_name),
+            params=kwargs,
+            limit=limit,
+            batch=batch,
+            max_workers=max_workers,
+            object_name=cls.__name__,
         )
-
-        if response.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError(f"Could not retrieve {cls.__name__}", response=response)
-
-        return [cls(json=j, client=client) for j in response.json()["results"]]
+        return [cls(json=j, client=client) for page in pages for j in page]
 
     @classmethod
     def get(cls, client: "Client", **kwargs) -> "self":
@@ -182,6 +243,7 @@ class CrudActionsMixin:
         response = self._client._request("DELETE", url)
         if response.status_code != requests.codes.no_content:
             raise NotFoundError("Could not delete object", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
         # reset the id to None to feedback that the object is deleted in KE-chain
         self.id = None
         return None
@@ -209,14 +271,19 @@ class BaseInScope(Base):
         """
         Scope this object belongs to.
 
-        This property will return a `Scope` object. It will make an additional call to the KE-chain API.
+        This property will return a `Scope` object. It will make an additional call to the KE-chain API,
+        unless the scope is found in the object cache of the client.
 
         :return: the scope
         :type: :class:`pykechain.models.Scope`
         :raises NotFoundError: if the scope could not be found
         """
         if not self._scope and self.scope_id:
-            self._scope = self._client.scope(pk=self.scope_id, status=None)
+            from pykechain.models import Scope
+
+            self._scope = self._client._cached_object(
+                Scope, self.scope_id
+            ) or self._client.scope(pk=self.scope_id, status=None)
         return self._scope
 
 
@@ -63,6 +63,7 @@ class ExpiringDownload(Base):
             raise APIError(
                 f"Could not delete Expiring Download {self}", response=response
             )
+        self._client._uncache_objects(self.__class__, [self.id])
 
     def edit(
         self,
@@ -246,6 +246,7 @@ class Form(BaseInScope, CrudActionsMixin, TagsMixin, NameDescriptionTranslationM
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(f"Could not delete Form {self}", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
 
     def instantiate(self, name: Optional[str], **kwargs) -> "Form":
         """Create a new Form instance based on a model."""
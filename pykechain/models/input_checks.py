@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import threading
 import warnings
+from collections import OrderedDict
 from datetime import date, datetime, time
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, List, Optional, Union
-
-import jsonschema
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from pykechain.defaults import SCHEMA_VALIDATORS_CACHE_SIZE
 from pykechain.exceptions import IllegalArgumentError
 from pykechain.utils import (
     Empty,
@@ -150,7 +151,7 @@ def check_list_of_dicts(
 def check_enum(value: Optional[Any], enum: type(Enum), key: str) -> Optional[Any]:
     """Validate input to be an option from an enum class."""
     if value is not None and value is not empty:
-        if value not in enum.values():
+        if not enum.has_value(value):
             raise IllegalArgumentError(
                 '`{}` must be an option from enum {}, "{}" ({}) is not.\n'
                 "Choose from: {}".format(
@@ -343,10 +344,81 @@ def check_json(
     :raises jsonschema.SchemaError: When the schema is incorrect.
     """
     if not isinstance(value, (type(None), Empty)):
-        jsonschema.validate(value, schema)
+        validate_json(value, schema)
     return value
 
 
+# precompiled validators by the identity of their schema, see `schema_validator()`
+_schema_validators: "OrderedDict[int, Tuple[Dict, Any]]" = OrderedDict()
+_schema_validators_lock = threading.Lock()
+
+
+def schema_validator(schema: Dict) -> Any:
+    """
+    Retrieve a precompiled jsonschema validator for a schema.
+
+    The validators are cached on the identity of their schema, such as the schemas defined in pykechain, so a
+    schema must not be altered once it is used. The least recently used validators are discarded once the
+    validators of 256 schemas are cached. Use `Client.widget_validator()` for the schemas of widgets.
+
+    :param schema: the jsonschema in a jsonschema format
+    :return: the jsonschema validator instance
+    :raises jsonschema.SchemaError: When the schema is incorrect.
+    """
+    key = id(schema)
+    with _schema_validators_lock:
+        # the cached schema is kept alive with its validator, so its id is not reused by another schema
+        cached = _schema_validators.get(key)
+        if cached is not None and cached[0] is schema:
+            _schema_validators.move_to_end(key)
+            return cached[1]
+
+    validator = compile_schema(schema)
+    with _schema_validators_lock:
+        _schema_validators[key] = (schema, validator)
+        _schema_validators.move_to_end(key)
+        while len(_schema_validators) > SCHEMA_VALIDATORS_CACHE_SIZE:
+            _schema_validators.popitem(last=False)
+    return validator
+
+
+def compile_schema(schema: Dict) -> Any:
+    """
+    Check the jsonschema and create a validator instance for it.
+
+    :param schema: the jsonschema in a jsonschema format
+    :return: the jsonschema validator instance
+    :raises jsonschema.SchemaError: When the schema is incorrect.
+    """
+    from jsonschema.validators import validator_for
+
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def validate_json(
+    value: Any, schema: Optional[Dict] = None, validator: Any = None
+) -> None:
+    """
+    Validate a value against a jsonschema, similar to `jsonschema.validate` using a precompiled validator.
+
+    :param value: the value to validate
+    :param schema: (optional) the jsonschema to validate against
+    :param validator: (optional) a precompiled validator to use instead of the schema
+    :return: None when the value is valid
+    :raise jsonschema.ValidationError: When the value is not conforming the jsonschema
+    :raises jsonschema.SchemaError: When the schema is incorrect.
+    """
+    from jsonschema.exceptions import best_match
+
+    if validator is None:
+        validator = schema_validator(schema)
+    error = best_match(validator.iter_errors(value))
+    if error is not None:
+        raise error
+
+
 def check_empty(value: Optional[Any]):
     """Validate whether the value provided is of class `Empty`."""
     if isinstance(value, Empty):
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List, Optional
+
+from pykechain.utils import IndexedList, find_obj_in_list, parse_datetime
+
+
+class JsonField:
+    """Read-only attribute that is looked up in the json of the object upon access."""
+
+    __slots__ = ("key", "default")
+
+    def __init__(self, key: str, default: Any = None):
+        """Construct the field reading the `key` from the json, returning the `default` when absent."""
+        self.key = key
+        self.default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance._json_data.get(self.key, self.default)
+
+    def __set__(self, instance, value):
+        raise AttributeError(
+            f"`{self.key}` of a {instance.__class__.__name__} is read-only"
+        )
+
+
+class LightBase:
+    """Read-only and memory-compact representation of a KE-chain object.
+
+    Light objects only hold a reference to the json as retrieved from KE-chain; every attribute is read from
+    the json upon access. Use these for large result sets of which only a few attributes are needed. To edit
+    the object or use its other methods, convert it with :func:`full`.
+
+    .. versionadded:: 4.17
+    """
+
+    __slots__ = ("_json_data", "_client")
+
+    id = JsonField("id")
+    name = JsonField("name")
+    ref = JsonField("ref")
+
+    def __init__(self, json: Dict, client: "Client"):
+        """Construct a light object from provided json data."""
+        self._json_data = json
+        self._client = client
+
+    def __repr__(self):  # pragma: no cover
+        return f"<pyke {self.__class__.__name__} '{self.name}' id {self.id[-8:]}>"
+
+    def __eq__(self, other):
+        if hasattr(other, "id"):
+            return self.id == other.id
+        return NotImplemented  # pragma: no cover
+
+    def __hash__(self):
+        return hash(self.id)
+
+    @property
+    def created_at(self):
+        """Datetime when the object was created if available (otherwise None)."""
+        return parse_datetime(self._json_data.get("created_at"))
+
+    @property
+    def updated_at(self):
+        """Datetime when the object was last updated if available (otherwise None)."""
+        return parse_datetime(self._json_data.get("updated_at"))
+
+    def full(self):
+        """Create the full pykechain model of this object."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class LightProperty(LightBase):
+    """Read-only and memory-compact representation of a KE-chain property.
+
+    .. versionadded:: 4.17
+    """
+
+    __slots__ = ()
+
+    category = JsonField("category")
+    description = JsonField("description")
+    model_id = JsonField("model_id")
+    part_id = JsonField("part_id")
+    type = JsonField("property_type")
+    value = JsonField("value")
+    output = JsonField("output")
+    order = JsonField("order")
+    unit = JsonField("unit")
+
+    def full(self) -> "AnyProperty":
+        """Create the full :class:`Property` of this light property."""
+        from pykechain.models import Property
+
+        return Property.create(self._json_data, client=self._client)
+
+
+class LightPart(LightBase):
+    """Read-only and memory-compact representation of a KE-chain part.
+
+    Returned by `Client.parts(light=True)`.
+
+    .. versionadded:: 4.17
+    """
+
+    __slots__ = ("_properties",)
+
+    category = JsonField("category")
+    classification = JsonField("classification")
+    description = JsonField("description")
+    model_id = JsonField("model_id")
+    multiplicity = JsonField("multiplicity")
+    parent_id = JsonField("parent_id")
+    scope_id = JsonField("scope_id")
+
+    def __init__(self, json: Dict, client: "Client"):
+        """Construct a light part from provided json data."""
+        super().__init__(json, client)
+        self._properties: Optional[List[LightProperty]] = None
+
+    @property
+    def properties(self) -> List[LightProperty]:
+        """List of the :class:`LightProperty` objects of this part, ordered by their `order`."""
+        if self._properties is None:
+            sorted_properties = sorted(
+                self._json_data.get("properties") or [],
+                key=lambda p: p.get("order", 0),
+            )
+            self._properties = IndexedList(
+                LightProperty(p, client=self._client) for p in sorted_properties
+            )
+        return self._properties
+
+    def property(self, name: str) -> LightProperty:
+        """Retrieve the light property of this part based on its name, ref or uuid.
+
+        :param name: property name, ref or UUID to search for
+        :return: a single :class:`LightProperty`
+        :raises NotFoundError: if the property is not part of the part
+        :raises MultipleFoundError: if multiple properties match
+        """
+        return find_obj_in_list(name, iterable=self.properties)
+
+    def full(self) -> "Part":
+        """Create the full :class:`Part` of this light part."""
+        from pykechain.models import Part
+
+        return Part(self._json_data, client=self._client)
@@ -2,7 +2,12 @@ from typing import Any, Dict, List, Optional, Tuple, Union  # noqa: F401
 
 import requests
 
-from pykechain.defaults import API_EXTRA_PARAMS, PARTS_BATCH_LIMIT
+from pykechain.batch import active_batch
+from pykechain.defaults import (
+    API_EXTRA_PARAMS,
+    ATTACHMENTS_TRANSFER_MAX_WORKERS,
+    PARTS_BATCH_LIMIT,
+)
 from pykechain.enums import Category, Classification, Multiplicity, PropertyType
 from pykechain.exceptions import (
     APIError,
@@ -18,7 +23,14 @@ from pykechain.models.input_checks import (
 )
 from pykechain.models.property import Property
 from pykechain.models.tree_traversal import TreeObject
-from pykechain.utils import Empty, clean_empty_values, empty, find, find_obj_in_list
+from pykechain.utils import (
+    Empty,
+    IndexedList,
+    clean_empty_values,
+    empty,
+    find,
+    find_obj_in_list,
+)
 
 
 class Part(TreeObject):
@@ -95,12 +107,10 @@ class Part(TreeObject):
         self.multiplicity: str = json.get("multiplicity")
         self.classification: Classification = json.get("classification")
 
-        sorted_properties: List[Dict] = sorted(
-            json["properties"], key=lambda p: p.get("order", 0)
-        )
-        self.properties: List[Property] = [
-            Property.create(p, client=self._client) for p in sorted_properties
-        ]
+        # the properties are only created when `Part.properties` is accessed for the first time
+        self._properties: Optional[List[Property]] = None
+
+        self._model: Optional["Part"] = None
 
         proxy_data: Optional[Dict] = json.get("proxy_source_id_name", dict())
         self._proxy_model_id: Optional[str] = (
@@ -121,7 +131,15 @@ class Part(TreeObject):
         if extra_params is None:
             extra_params = {}
         extra_params.update(API_EXTRA_PARAMS["part"])
-        existing_properties = {p.id: p for p in self.properties}
+        if self._properties is None:
+            # no property objects were handed out yet, so these can be created lazily from the new json
+            super().refresh(
+                json=json,
+                url=self._client._build_url("part", part_id=self.id),
+                extra_params=extra_params,
+            )
+            return
+        existing_properties = {p.id: p for p in self._properties}
 
         super().refresh(
             json=json,
@@ -140,6 +158,33 @@ class Part(TreeObject):
                 prop = new_prop
             self.properties.append(prop)
 
+    @property
+    def properties(self) -> List["AnyProperty"]:
+        """
+        Retrieve the list of properties of this part, ordered by their `order`.
+
+        The :class:`Property` objects are created from the json of the part upon first access. When the part
+        was retrieved without its properties (eg. `client.parts(include_properties=False)`), the part is
+        refreshed to retrieve them.
+
+        :return: list of :class:`Property`
+        """
+        if self._properties is None:
+            if "properties" not in self._json_data and self._client is not None:
+                self.refresh()
+            sorted_properties: List[Dict] = sorted(
+                self._json_data.get("properties") or [],
+                key=lambda p: p.get("order", 0),
+            )
+            self._properties = IndexedList(
+                Property.create(p, client=self._client) for p in sorted_properties
+            )
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: List["AnyProperty"]) -> None:
+        self._properties = IndexedList(value)
+
     #
     # Family and structure methods
     #
@@ -369,6 +414,9 @@ class Part(TreeObject):
         For instance, you can get the part model of a part instance. But trying to get the model of a part that
         has no model, like a part model, will raise a :exc:`NotFoundError`.
 
+        Will cache the model object in order to not generate too many API calls. To retrieve the models of many
+        parts at once, use :func:`Client.resolve_models()`.
+
         .. versionadded:: 1.8
 
         :return: the model of this part instance as :class:`Part` with category `MODEL`
@@ -381,7 +429,11 @@ class Part(TreeObject):
 
         """
         if self.category == Category.INSTANCE:
-            return self._client.model(pk=self.model_id)
+            if self._model is None:
+                self._model = self._client._cached_object(
+                    Part, self.model_id
+                ) or self._client.model(pk=self.model_id)
+            return self._model
         else:
             raise NotFoundError(f'Part "{self}" already is a model')
 
@@ -536,6 +588,14 @@ class Part(TreeObject):
 
         update_dict = clean_empty_values(update_dict=update_dict)
 
+        batch = active_batch(self._client)
+        if batch is not None:
+            # Store the edit in the active batch of the client, to be sent when the batch exits
+            batch.update_part(self.id, update_dict, instance=self)
+            self.name = update_dict.get("name", self.name)
+            self.description = update_dict.get("description", self.description)
+            return
+
         response = self._client._request(
             "PUT",
             self._client._build_url("part", part_id=self.id),
@@ -911,6 +971,8 @@ class Part(TreeObject):
         name: Optional[str] = None,
         include_children: bool = True,
         include_instances: bool = True,
+        max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
+        per_level: bool = False,
     ) -> "Part":
         """
         Copy the `Part` to target parent, both of them having the same category.
@@ -925,6 +987,11 @@ class Part(TreeObject):
         :type include_children: bool
         :param include_instances: True to copy also the instances of `Part` to ALL the instances of target_parent.
         :type include_instances: bool
+        :param max_workers: (optional) number of attachments to transfer concurrently, defaults to 4
+        :type max_workers: int or None
+        :param per_level: (optional) copy the instances level by level, creating the instances of a level in one
+            request instead of per parent, defaults to False
+        :type per_level: bool
         :returns: copied :class:`Part` model.
         :raises IllegalArgumentError: if part and target_parent have different `Category`
         :raises IllegalArgumentError: if part and target_parent are identical
@@ -961,6 +1028,8 @@ class Part(TreeObject):
             name=name,
             include_children=include_children,
             include_instances=include_instances,
+            max_workers=max_workers,
+            per_level=per_level,
         )
 
         return copied_part
@@ -971,6 +1040,8 @@ class Part(TreeObject):
         name: Optional[str] = None,
         include_children: bool = True,
         include_instances: bool = True,
+        max_workers: Optional[int] = ATTACHMENTS_TRANSFER_MAX_WORKERS,
+        per_level: bool = False,
     ) -> "Part":
         """
         Move the `Part` to target parent, both of them the same category.
@@ -985,6 +1056,10 @@ class Part(TreeObject):
         :type include_children: bool
         :param include_instances: True to move also the instances of `Part` to ALL the instances of target_parent.
         :type include_instances: bool
+        :param max_workers: (optional) number of attachments to transfer concurrently, defaults to 4
+        :type max_workers: int or None
+        :param per_level: (optional) move the instances level by level, see `Part.copy()`, defaults to False
+        :type per_level: bool
         :returns: moved :class:`Part` model.
         :raises IllegalArgumentError: if part and target_parent have different `Category`
         :raises IllegalArgumentError: if target_parent is descendant of part
@@ -1003,6 +1078,8 @@ class Part(TreeObject):
             name=name,
             include_children=include_children,
             include_instances=include_instances,
+            max_workers=max_workers,
+            per_level=per_level,
         )
 
         try:
@@ -1078,7 +1155,22 @@ class Part(TreeObject):
         if name:
             payload_json.update(name=name)
 
-        if Property._USE_BULK_UPDATE and not (name or kwargs):
+        batch = active_batch(self._client)
+        if batch is not None:
+            # Store the updates in the active batch of the client, to be sent when the batch exits
+            properties_by_id = {p.id: p for p in self.properties}
+            for fvalue in properties_fvalues:
+                fvalue = dict(fvalue)
+                pk = fvalue.pop("id")
+                prop = properties_by_id.get(pk)
+                if prop is not None and "value" in fvalue:
+                    prop._value = fvalue["value"]
+                batch.update_property(pk, fvalue, instance=prop)
+            if name or kwargs:
+                part_update = dict(name=name, **kwargs) if name else dict(kwargs)
+                batch.update_part(self.id, part_update, instance=self)
+                self.name = name or self.name
+        elif Property._USE_BULK_UPDATE and not (name or kwargs):
             # Send updates to the property value in case of bulk updates while no part update is required
             for prop in self.properties:
                 if prop.id in update_dict:
@@ -1113,6 +1205,10 @@ class Part(TreeObject):
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(f"Could not delete Part {self}", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
+        self._client._uncache_objects(
+            Property, [p["id"] for p in self._json_data.get("properties") or []]
+        )
 
     def order_properties(
         self, property_list: Optional[List[Union["AnyProperty", str]]] = None
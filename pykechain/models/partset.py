@@ -1,6 +1,7 @@
-from typing import Iterable, Text  # noqa: F401
+from typing import Iterable, Text, Union  # noqa: F401
 
 from pykechain.models.part import Part  # noqa: F401
+from pykechain.utils import IndexedList, find_obj_in_list
 
 
 class PartSet(Iterable):
@@ -9,13 +10,13 @@ class PartSet(Iterable):
     Adding set-like methods on a list of parts:
      * iterable
      * len()
-     * get()
+     * access by index, uuid, name or ref
      * iPython notebook support for HTML table
     """
 
     def __init__(self, parts: Iterable[Part]):
         """Construct a PartSet from a part iterable."""
-        self._parts = list(parts)
+        self._parts = IndexedList(parts)
 
     def __repr__(self):  # pragma: no cover
         return f"<pyke {self.__class__.__name__} object {self.__len__()} parts>"
@@ -26,9 +27,20 @@ class PartSet(Iterable):
     def __len__(self):
         return len(self._parts)
 
-    def __getitem__(self, k: int) -> Part:
+    def __getitem__(self, k: Union[int, str]) -> Part:
+        """
+        Part from the set based on its index, uuid, name or ref.
+
+        :param k: index, uuid, name or ref of the part
+        :type k: int or basestring
+        :return: the part
+        :raises NotFoundError: if no part matches the uuid, name or ref
+        :raises MultipleFoundError: if multiple parts match the uuid, name or ref
+        """
         if isinstance(k, int):
             return self._parts[k]
+        elif isinstance(k, str):
+            return find_obj_in_list(k, iterable=self._parts)
 
         raise NotImplementedError
 
@@ -1,17 +1,17 @@
+import threading
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 import requests
-from jsonschema import validate
-
-from pykechain.defaults import API_EXTRA_PARAMS
+from pykechain.batch import Batch, active_batch
+from pykechain.defaults import API_EXTRA_PARAMS, PROPERTIES_BULK_UPDATE_CHUNK_SIZE
 from pykechain.enums import Category
 from pykechain.exceptions import APIError, IllegalArgumentError
 from pykechain.models import Base, BaseInScope
-from pykechain.models.input_checks import check_text, check_type
+from pykechain.models.input_checks import check_text, check_type, validate_json
 from pykechain.models.representations.component import RepresentationsComponent
 from pykechain.models.validators import PropertyValidator
 from pykechain.models.validators.validator_schemas import options_json_schema
-from pykechain.utils import clean_empty_values, empty
+from pykechain.utils import clean_empty_values, empty, find
 
 T = TypeVar("T")
 
@@ -49,7 +49,8 @@ class Property(BaseInScope):
     """
 
     _USE_BULK_UPDATE = False
-    _update_package = dict()
+    # guards the batches of the values stored for `update_values`, kept on their client as `Client._update_batch`
+    _update_batches_lock = threading.Lock()
 
     def __init__(self, json, **kwargs):
         """Construct a Property from a json object."""
@@ -92,7 +93,7 @@ class Property(BaseInScope):
         :raises jsonschema.exceptions.SchemaError: if the JSON schema of the options is invalid
         :returns: Boolean True if valid
         """
-        validate(self._options, options_json_schema)
+        validate_json(self._options, options_json_schema)
         return True
 
     def refresh(
@@ -127,9 +128,12 @@ class Property(BaseInScope):
 
     @property
     def use_bulk_update(self):
-        """Set or get the toggle to asynchronously update property values."""
+        """Set or get the toggle to asynchronously update property values.
+
+        Values are updated asynchronously as well while a `Client.batch()` of the client is active.
+        """
         # set the class attribute to make this value a singleton
-        return self.__class__._USE_BULK_UPDATE
+        return self.__class__._USE_BULK_UPDATE or self._client_batch() is not None
 
     @use_bulk_update.setter
     def use_bulk_update(self, value):
@@ -167,31 +171,63 @@ class Property(BaseInScope):
             self._put_value(value)
 
     @classmethod
-    def update_values(cls, client: "Client", use_bulk_update: bool = False) -> None:
+    def update_values(
+        cls,
+        client: "Client",
+        use_bulk_update: bool = False,
+        chunk_size: int = PROPERTIES_BULK_UPDATE_CHUNK_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> None:
         """
         Perform the bulk update of property values using the stored values in the `Property` class.
 
+        The values are stored per client and shared by all threads, the values stored for `client` are sent. Use
+        :func:`Client.batch()` instead to collect the updates of a single thread.
+
+        The stored values are sent in chunks of `chunk_size` properties, optionally concurrently. The properties
+        as updated in KE-chain are merged back into the `Property` objects of which the values were stored.
+
+        When chunks fail to update, the values of these chunks remain stored and the bulk update remains enabled,
+        such that these can be sent again using `update_values`.
+
         :param client: Client object
         :type client: Client
         :param use_bulk_update: set the class attribute, defaults to False.
         :type use_bulk_update: bool
+        :param chunk_size: (optional) number of properties to update per request, defaults to 500
+        :type chunk_size: int
+        :param max_workers: (optional) number of chunks to send concurrently (defaults to sequential)
+        :type max_workers: int or None
         :return: None
+        :raises BulkUpdateError: if chunks failed to update, with the error per id of the failed properties
         """
-        if cls._USE_BULK_UPDATE:
-            properties = [
-                dict(id=key, **values) for key, values in cls._update_package.items()
-            ]
-            client.update_properties(properties=properties)
-            cls._update_package = dict()
+        check_type(chunk_size, int, "chunk_size")
+        with Property._update_batches_lock:
+            batch = client._update_batch
+        if cls._USE_BULK_UPDATE and batch is not None:
+            batch.flush(chunk_size=chunk_size, max_workers=max_workers)
+            with Property._update_batches_lock:
+                if not batch and client._update_batch is batch:
+                    client._update_batch = None
         cls.set_bulk_update(use_bulk_update)
 
+    def _client_batch(self) -> Optional[Batch]:
+        """Active batch of the client of this property, see `Client.batch()`."""
+        return active_batch(self._client)
+
     def _pend_update(self, data):
-        """Store the value to be send at a later point in time using `update_values`."""
-        existing_data = self.__class__._update_package.get(self.id, None)
-        if existing_data:
-            existing_data.update(data)
-        else:
-            self.__class__._update_package[self.id] = data
+        """Store the value to be send at a later point in time, in the active batch or using `update_values`."""
+        batch = self._client_batch()
+        if batch is not None:
+            batch.update_property(self.id, data, instance=self)
+            return
+
+        # the value is stored while holding the lock, such that an emptied batch is not discarded meanwhile
+        with Property._update_batches_lock:
+            batch = self._client._update_batch
+            if batch is None:
+                batch = self._client._update_batch = Batch(client=self._client)
+            batch.update_property(self.id, data, instance=self)
 
     def _put_value(self, value):
         """Send the value to KE-chain."""
@@ -225,7 +261,11 @@ class Property(BaseInScope):
         :raises APIError: if the `Part` is not found
         """
         if self._part is None:
-            self._part = self._client.part(pk=self.part_id, category=self.category)
+            from pykechain.models import Part
+
+            self._part = self._client._cached_object(
+                Part, self.part_id
+            ) or self._client.part(pk=self.part_id, category=self.category)
         return self._part
 
     def model(self) -> "AnyProperty":
@@ -241,11 +281,25 @@ class Property(BaseInScope):
         if self.category == Category.MODEL:
             return self
         elif self._model is None:
-            self._model = self._client.property(
-                pk=self.model_id, category=Category.MODEL
+            self._model = (
+                self._client._cached_object(Property, self.model_id)
+                or self._model_from_part_model()
+                or self._client.property(pk=self.model_id, category=Category.MODEL)
             )
         return self._model
 
+    def _model_from_part_model(self) -> Optional["AnyProperty"]:
+        """Find the model of this property among the properties of an already retrieved part model, if any."""
+        from pykechain.models import Part
+
+        part = self._part or self._client._cached_object(Part, self.part_id)
+        if part is None:
+            return None
+        part_model = part._model or self._client._cached_object(Part, part.model_id)
+        if part_model is None:
+            return None
+        return find(part_model.properties, lambda p: p.id == self.model_id)
+
     @property
     def validators(self):
         """Provide list of Validator objects.
@@ -304,7 +358,7 @@ class Property(BaseInScope):
         else:
             new_options = self._options.copy()  # make a copy
             new_options.update({"validators": validators_json})
-            validate(new_options, options_json_schema)
+            validate_json(new_options, options_json_schema)
             self._options = new_options
 
     @property
@@ -510,6 +564,7 @@ class Property(BaseInScope):
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(f"Could not delete Property {self}", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
 
     def copy(self, target_part: "Part", name: Optional[str] = None) -> "Property":
         """Copy a property model or instance.
@@ -1,10 +1,13 @@
 import io
 import json
 import os
-from typing import Any, Optional
+import uuid
+from typing import Any, Iterable, Optional
 
 import requests
+from urllib3.fields import RequestField
 
+from pykechain.defaults import ATTACHMENTS_TRANSFER_CHUNK_SIZE
 from pykechain.exceptions import APIError
 from pykechain.models.property import Property
 
@@ -119,6 +122,39 @@ class AttachmentProperty(Property):
             for chunk in self._download(**kwargs):
                 f.write(chunk)
 
+    def copy_to(self, target: "AttachmentProperty") -> None:
+        """Copy the attachment to another attachment property.
+
+        The attachment is streamed from the download into the upload to the target in chunks, such that it is
+        neither saved to disk nor held in memory as a whole. When this property has no attachment, the attachment
+        of the target is cleared.
+
+        .. versionadded:: 4.17
+
+        :param target: the attachment property to copy the attachment to
+        :type target: AttachmentProperty
+        :raises APIError: When unable to download or upload the attachment
+
+        Example
+        -------
+        >>> drawing = project.part('Bike').property('Drawing')
+        >>> drawing.copy_to(project.part('Bike copy').property('Drawing'))
+
+        """
+        if not self.has_value():
+            target.clear()
+            return
+
+        with self._download(stream=True) as response:
+            target._upload_stream(
+                filename=self.filename,
+                chunks=response.iter_content(ATTACHMENTS_TRANSFER_CHUNK_SIZE),
+                content_type=response.headers.get(
+                    "Content-Type", "application/octet-stream"
+                ),
+            )
+        target._value = self.filename
+
     def _upload_json(self, content, name="data.json"):
         data = (name, json.dumps(content), "application/json")
 
@@ -137,10 +173,13 @@ class AttachmentProperty(Property):
     def _download(self, **kwargs):
         url = self._client._build_url("property_download", property_id=self.id)
         request_params = dict()
+        do_stream = kwargs.pop("stream", False)
         if kwargs:
             request_params.update(**kwargs)
 
-        response = self._client._request("GET", url, params=request_params)
+        response = self._client._request(
+            "GET", url, params=request_params, stream=do_stream
+        )
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError("Could not download property value.", response=response)
@@ -159,3 +198,37 @@ class AttachmentProperty(Property):
 
         if response.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError("Could not upload attachment", response=response)
+
+    def _upload_stream(
+        self, filename: str, chunks: Iterable[bytes], content_type: str
+    ) -> None:
+        """
+        Upload the attachment as a multipart body that is sent while its chunks are produced.
+
+        The body can not be produced again, so the upload is not retried when sending it fails.
+        """
+        url = self._client._build_url("property_upload", property_id=self.id)
+        boundary = uuid.uuid4().hex
+
+        part_field = RequestField(name="part", data=self._json_data["part_id"])
+        part_field.make_multipart()
+        attachment_field = RequestField(name="attachment", data=b"", filename=filename)
+        attachment_field.make_multipart(content_type=content_type)
+
+        def body():
+            yield f"--{boundary}\r\n{part_field.render_headers()}".encode()
+            yield f"{part_field.data}\r\n".encode()
+            yield f"--{boundary}\r\n{attachment_field.render_headers()}".encode()
+            yield from chunks
+            yield f"\r\n--{boundary}--\r\n".encode()
+
+        with self._client._without_retries(url):
+            response = self._client._request(
+                "POST",
+                url,
+                data=body(),
+                headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            )
+
+        if response.status_code != requests.codes.ok:  # pragma: no cover
+            raise APIError("Could not upload attachment", response=response)
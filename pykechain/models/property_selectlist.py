@@ -2,10 +2,9 @@ from abc import abstractmethod
 from copy import deepcopy
 from typing import Any, Iterable
 
-from jsonschema import validate
-
 from pykechain.enums import Category
 from pykechain.exceptions import APIError, IllegalArgumentError
+from pykechain.models.input_checks import validate_json
 from pykechain.models.property import Property
 from pykechain.models.validators.validator_schemas import options_json_schema
 
@@ -127,7 +126,7 @@ class _SelectListProperty(Property):
         :param new_options: list of options to set.
         :raises APIError: when unable to update the options
         """
-        validate(new_options, options_json_schema)
+        validate_json(new_options, options_json_schema)
 
         url = self._client._build_url("property", property_id=self.id)
         response = self._client._request(
@@ -1,9 +1,8 @@
 from typing import Any, Callable, Dict, List
 
-from jsonschema import validate
-
 from pykechain.enums import PropertyType, _AllRepresentations
 from pykechain.exceptions import IllegalArgumentError
+from pykechain.models.input_checks import validate_json
 from pykechain.models.representations.representation_base import BaseRepresentation
 from pykechain.models.validators.validator_schemas import representation_jsonschema_stub
 
@@ -91,7 +90,7 @@ class RepresentationsComponent:
         representations_json = []
         for r in self._representations:
             json_format = r.as_json()
-            validate(json_format, representation_jsonschema_stub)
+            validate_json(json_format, representation_jsonschema_stub)
             representations_json.append(json_format)
 
         self._repr_options = representations_json
@@ -2,8 +2,7 @@ import warnings
 from abc import abstractmethod
 from typing import Any, Dict
 
-from jsonschema import validate
-
+from pykechain.models.input_checks import validate_json
 from pykechain.models.validators.validator_schemas import representation_jsonschema_stub
 
 
@@ -61,7 +60,7 @@ class BaseRepresentation:
 
     def validate_json(self) -> Any:
         """Validate the json representation of the validator against the validator jsonschema."""
-        return validate(self._json, self.jsonschema)
+        return validate_json(self._json, self.jsonschema)
 
     @classmethod
     def parse(cls, obj: Any, json: Dict) -> "BaseRepresentation":
@@ -77,7 +77,7 @@ class LinkTarget(BaseRepresentation):
         :type value: LinkTargets
         :return: None
         """
-        if value not in LinkTargets.values():
+        if not LinkTargets.has_value(value):
             raise IllegalArgumentError(
                 '{} value "{}" is not correct: Not a CardWidgetLinkTarget option.'.format(
                     self.__class__.__name__, value
@@ -99,7 +99,7 @@ class ButtonRepresentation(BaseRepresentation):
         :type value: SelectListRepresentations
         :return: None
         """
-        if value not in SelectListRepresentations.values():
+        if not SelectListRepresentations.has_value(value):
             raise IllegalArgumentError(
                 '{} value "{}" is not correct: Not a SelectListRepresentations option.'.format(
                     self.__class__.__name__, value
@@ -169,7 +169,7 @@ class CustomIconRepresentation(BaseRepresentation):
         :param mode: FontAwesome display mode
         :type mode: FontAwesomeMode
         """
-        if mode not in set(FontAwesomeMode.values()):
+        if not FontAwesomeMode.has_value(mode):
             raise IllegalArgumentError(
                 '{} mode "{}" is not a FontAwesomeMode option.'.format(
                     self.__class__.__name__, mode
@@ -206,7 +206,7 @@ class GeoCoordinateRepresentation(BaseRepresentation):
         :type value: one of GeoCoordinateConfig
         :return: None
         """
-        if value not in GeoCoordinateConfig.values():
+        if not GeoCoordinateConfig.has_value(value):
             raise IllegalArgumentError(
                 "{} value '{}' is not correct: Not a GeoCoordinateConfig option: {}".format(
                     self.__class__.__name__, value, GeoCoordinateConfig.values()
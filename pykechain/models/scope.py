@@ -5,7 +5,7 @@ from typing import Dict, List, Optional, Union  # noqa: F401
 
 import requests
 
-from pykechain.defaults import API_EXTRA_PARAMS
+from pykechain.defaults import API_EXTRA_PARAMS, PARTS_BATCH_LIMIT
 from pykechain.enums import (
     KEChainPages,
     Multiplicity,
@@ -15,7 +15,7 @@ from pykechain.enums import (
     ScopeStatus,
     SubprocessDisplayMode,
 )
-from pykechain.exceptions import APIError, IllegalArgumentError
+from pykechain.exceptions import APIError, IllegalArgumentError, NotFoundError
 from pykechain.models.activity import Activity
 from pykechain.models.base import Base
 from pykechain.models.context import Context
@@ -34,6 +34,7 @@ from pykechain.models.representations import BaseRepresentation
 from pykechain.models.representations.component import RepresentationsComponent
 from pykechain.models.service import Service, ServiceExecution
 from pykechain.models.sidebar.sidebar_manager import SideBarManager
+from pykechain.models.snapshot import ScopeSnapshot
 from pykechain.models.tags import TagsMixin
 from pykechain.models.team import Team
 from pykechain.models.user import User
@@ -473,6 +474,34 @@ class Scope(Base, TagsMixin):
         """
         return self._client.model(*args, scope_id=self.id, **kwargs)
 
+    def snapshot(
+        self, batch: int = PARTS_BATCH_LIMIT, max_workers: Optional[int] = None
+    ) -> ScopeSnapshot:
+        """
+        Retrieve all part models, part instances and their properties of this scope in an indexed snapshot.
+
+        The parts are retrieved in batches, after which the parts and properties can be looked up on their id,
+        name and ref, and the children, instances and property instances can be retrieved without requests.
+
+        .. versionadded:: 4.17
+
+        :param batch: Number of Parts to be retrieved in a batch
+        :type batch: int (defaults to 100)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
+        :return: the :class:`ScopeSnapshot` of the parts and properties of this scope
+        :raises APIError: if the parts could not be retrieved.
+
+        Example
+        -------
+        >>> snapshot = project.snapshot()
+        >>> bike = snapshot.part("Bike")
+        >>> wheels = snapshot.children(bike)
+
+        """
+        parts = self.parts(category=None, batch=batch, max_workers=max_workers)
+        return ScopeSnapshot(parts, scope=self)
+
     def create_model(self, parent, name, multiplicity=Multiplicity.ZERO_MANY) -> "Part":
         """Create a single part model in this scope.
 
@@ -518,6 +547,52 @@ class Scope(Base, TagsMixin):
         """
         return self._client.activity(*args, scope=self.id, **kwargs)
 
+    def activity_tree(
+        self, batch: int = PARTS_BATCH_LIMIT, max_workers: Optional[int] = None
+    ) -> "Activity":
+        """
+        Retrieve all activities of this scope at once and return the workflow root with the tree populated.
+
+        The activities are retrieved in batches, after which the children and parent of every activity are
+        populated. Traversing the activity tree (eg. using :func:`Activity.children()`, :func:`Activity.parent()`
+        or :func:`Activity.all_children()`) does not require additional requests.
+
+        .. versionadded:: 4.17
+
+        :param batch: Number of Activities to be retrieved in a batch
+        :type batch: int (defaults to 100)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :type max_workers: int or None
+        :return: the workflow root :class:`Activity` of this scope
+        :raises NotFoundError: if the workflow root of this scope is not found
+        :raises APIError: if the activities could not be retrieved.
+
+        Example
+        -------
+        >>> workflow_root = project.activity_tree()
+        >>> for task in workflow_root.all_children():
+        ...     print(task.name, task.parent().name)
+
+        """
+        activities = self.activities(batch=batch, max_workers=max_workers)
+        activity_by_id = {activity.id: activity for activity in activities}
+
+        workflow_root = activity_by_id.get(self._json_data.get("workflow_root_id"))
+        if workflow_root is None:
+            raise NotFoundError(f"Could not find the workflow root of {self}")
+
+        # the other roots (eg. of the app and catalog) are populated as well, as these are among the descendants
+        workflow_root._populate_cached_children(
+            all_descendants=[a for a in activities if a is not workflow_root],
+            overwrite=True,
+        )
+        self._workflow_root_process = workflow_root
+        self._app_root_process = activity_by_id.get(self._json_data.get("app_root_id"))
+        self._catalog_root_process = activity_by_id.get(
+            self._json_data.get("catalog_root_id")
+        )
+        return workflow_root
+
     def create_activity(self, *args, **kwargs) -> "Activity":
         """Create a new activity belonging to this scope.
 
@@ -548,7 +623,7 @@ class Scope(Base, TagsMixin):
         """
         from pykechain.models import Activity
 
-        if not (isinstance(activity, Activity) or activity in KEChainPages.values()):
+        if not (isinstance(activity, Activity) or KEChainPages.has_value(activity)):
             raise IllegalArgumentError(
                 'activity must be of class Activity or a KEChainPages option, "{}" is not.'.format(
                     activity
@@ -189,6 +189,7 @@ class Service(BaseInScope):
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(f"Could not delete Service {self}", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
 
     def upload(self, pkg_path):
         """
@@ -313,7 +314,9 @@ class ServiceExecution(Base):
     def service(self) -> Service:
         """Retrieve the `Service` object to which this execution is associated."""
         if not self._service:
-            self._service = self._client.service(id=self.service_id)
+            self._service = self._client._cached_object(
+                Service, self.service_id
+            ) or self._client.service(id=self.service_id)
         return self._service
 
     def terminate(self):
@@ -80,11 +80,11 @@ class SideBarButton(SideBarItem):
             raise IllegalArgumentError(f'icon must be a string, "{icon}" is not.')
         if not isinstance(uri, str):
             raise IllegalArgumentError(f'uri must be a string, "{uri}" is not.')
-        if uri_target not in URITarget.values():
+        if not URITarget.has_value(uri_target):
             raise IllegalArgumentError(
                 f'uri_target must be a URITarget option, "{uri_target}" is not.'
             )
-        if icon_mode not in FontAwesomeMode.values():
+        if not FontAwesomeMode.has_value(icon_mode):
             raise IllegalArgumentError(
                 f'icon_mode must be a FontAwesomeMode option, "{icon_mode}" is not.'
             )
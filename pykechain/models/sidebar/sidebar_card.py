@@ -92,12 +92,12 @@ class SideBarCard(SideBarItem):
 
         if (
             self.action_button_uri_target is not None
-            and self.action_button_uri_target not in URITarget.values()
+            and not URITarget.has_value(self.action_button_uri_target)
         ):
             raise IllegalArgumentError(
                 f'uri_target must be a URITarget option, "{self.action_button_uri_target}" is not.'
             )
-        if self.align not in SidebarItemAlignment.values():
+        if not SidebarItemAlignment.has_value(self.align):
             raise IllegalArgumentError(
                 f"alignment must be a proper `SidebarButtonAlgment` type, '{self.align} is not.'"
             )
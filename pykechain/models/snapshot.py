@@ -0,0 +1,237 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from pykechain.enums import Category
+from pykechain.exceptions import MultipleFoundError, NotFoundError
+from pykechain.models.input_checks import check_base, check_enum, check_text
+from pykechain.models.part import Part
+from pykechain.models.property import Property
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pykechain.models import AnyProperty, Scope
+
+
+class ScopeSnapshot:
+    """
+    In-memory graph of the parts and properties of a scope, indexed to look these up without requests.
+
+    The snapshot is created from the parts (models and instances) of a scope, including their properties,
+    see :func:`Scope.snapshot()`. The parts and properties are indexed on their id, name and ref, and the
+    instances on their model and the children on their parent. The parts are linked in place as well, such that
+    :func:`Part.children()`, :func:`Part.parent()`, :func:`Part.model()` and :func:`Property.model()` of the
+    parts and properties in the snapshot do not require requests either.
+
+    The snapshot is not updated when parts or properties are created, changed or deleted in KE-chain.
+
+    .. versionadded:: 4.17
+
+    Example
+    -------
+    >>> snapshot = project.snapshot()
+    >>> wheel_model = snapshot.model("Wheel")
+    >>> for wheel in snapshot.instances(wheel_model):
+    ...     print(wheel.name, snapshot.property_instances(wheel_model.property("Diameter")))
+
+    """
+
+    def __init__(self, parts: Iterable[Part], scope: Optional["Scope"] = None):
+        """
+        Index the parts and their properties.
+
+        :param parts: the parts, models and instances, including their properties
+        :type parts: iterable of :class:`Part`
+        :param scope: (optional) the scope of the parts
+        :type scope: Scope
+        """
+        self.scope = scope
+        self._parts_by_id: Dict[str, Part] = dict()
+        self._parts_by_name: Dict[Tuple[str, str], List[Part]] = dict()
+        self._parts_by_ref: Dict[Tuple[str, str], List[Part]] = dict()
+        self._children_by_parent_id: Dict[str, List[Part]] = dict()
+        self._instances_by_model_id: Dict[str, List[Part]] = dict()
+        self._properties_by_id: Dict[str, "AnyProperty"] = dict()
+        self._property_instances_by_model_id: Dict[str, List["AnyProperty"]] = dict()
+
+        for part in parts:
+            self._parts_by_id[part.id] = part
+            self._parts_by_name.setdefault((part.category, part.name), []).append(part)
+            self._parts_by_ref.setdefault((part.category, part.ref), []).append(part)
+            self._children_by_parent_id.setdefault(part.parent_id, []).append(part)
+            if part.category == Category.INSTANCE:
+                self._instances_by_model_id.setdefault(part.model_id, []).append(part)
+
+            for prop in part.properties:
+                self._properties_by_id[prop.id] = prop
+                if prop.category == Category.INSTANCE:
+                    self._property_instances_by_model_id.setdefault(
+                        prop.model_id, []
+                    ).append(prop)
+
+        self._link()
+
+    def __repr__(self):  # pragma: no cover
+        return (
+            f"<pyke {self.__class__.__name__} {len(self._parts_by_id)} parts, "
+            f"{len(self._properties_by_id)} properties>"
+        )
+
+    def __len__(self):
+        return len(self._parts_by_id)
+
+    def __contains__(self, item: Union[Part, Property, str]) -> bool:
+        pk = getattr(item, "id", item)
+        return pk in self._parts_by_id or pk in self._properties_by_id
+
+    def _link(self) -> None:
+        """Link the parents, children and models of the parts and properties in place."""
+        for part in self._parts_by_id.values():
+            part._cached_children = list(self._children_by_parent_id.get(part.id, []))
+            part._parent = self._parts_by_id.get(part.parent_id)
+            if part.category == Category.INSTANCE:
+                part._model = self._parts_by_id.get(part.model_id) or part._model
+
+        for prop in self._properties_by_id.values():
+            if prop.category == Category.INSTANCE:
+                prop._model = self._properties_by_id.get(prop.model_id) or prop._model
+
+    def parts(
+        self,
+        name: Optional[str] = None,
+        ref: Optional[str] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+    ) -> List[Part]:
+        """
+        Retrieve the parts in the snapshot, filtered on name and ref.
+
+        :param name: (optional) name of the parts
+        :type name: basestring or None
+        :param ref: (optional) ref of the parts
+        :type ref: basestring or None
+        :param category: (optional) category of the parts, defaults to INSTANCE. None for both categories.
+        :type category: Category or None
+        :return: list of :class:`Part`
+        """
+        name = check_text(name, "name")
+        ref = check_text(ref, "ref")
+        categories = (
+            [check_enum(category, Category, "category")]
+            if category is not None
+            else Category.values()
+        )
+
+        if name is not None:
+            found = [
+                p for c in categories for p in self._parts_by_name.get((c, name), [])
+            ]
+            if ref is not None:
+                found = [p for p in found if p.ref == ref]
+        elif ref is not None:
+            found = [
+                p for c in categories for p in self._parts_by_ref.get((c, ref), [])
+            ]
+        else:
+            found = [p for p in self._parts_by_id.values() if p.category in categories]
+        return found
+
+    def part(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        ref: Optional[str] = None,
+        category: Optional[Union[Category, str]] = Category.INSTANCE,
+    ) -> Part:
+        """
+        Retrieve a single part from the snapshot, on its id, name or ref.
+
+        :param name: (optional) name of the part
+        :type name: basestring or None
+        :param pk: (optional) id of the part
+        :type pk: basestring or None
+        :param ref: (optional) ref of the part
+        :type ref: basestring or None
+        :param category: (optional) category of the part, defaults to INSTANCE. None for both categories.
+        :type category: Category or None
+        :return: a single :class:`Part`
+        :raises NotFoundError: When no `Part` is found
+        :raises MultipleFoundError: When more than a single `Part` is found
+        """
+        if pk is not None:
+            part = self._parts_by_id.get(check_base(pk, Part, "pk"))
+            found = [part] if part is not None else []
+            if category is not None:
+                found = [p for p in found if p.category == category]
+        else:
+            found = self.parts(name=name, ref=ref, category=category)
+
+        criteria = f"\nname: {name}\npk: {pk}\nref: {ref}\ncategory: {category}"
+        if not found:
+            raise NotFoundError(f"No part in the snapshot fits criteria:{criteria}")
+        elif len(found) > 1:
+            raise MultipleFoundError(
+                f"Multiple parts in the snapshot fit criteria:{criteria}"
+            )
+        return found[0]
+
+    def model(
+        self,
+        name: Optional[str] = None,
+        pk: Optional[str] = None,
+        ref: Optional[str] = None,
+    ) -> Part:
+        """
+        Retrieve a single part model from the snapshot, on its id, name or ref.
+
+        See :func:`ScopeSnapshot.part()` for the available parameters.
+
+        :return: a single :class:`Part` of category MODEL
+        """
+        return self.part(name=name, pk=pk, ref=ref, category=Category.MODEL)
+
+    def children(self, part: Union[Part, str]) -> List[Part]:
+        """
+        Retrieve the children of a part in the snapshot.
+
+        :param part: the part or its id
+        :type part: Part or basestring
+        :return: list of :class:`Part`
+        """
+        return list(self._children_by_parent_id.get(check_base(part, Part, "part"), []))
+
+    def instances(self, model: Union[Part, str]) -> List[Part]:
+        """
+        Retrieve the instances of a part model in the snapshot.
+
+        :param model: the part model or its id
+        :type model: Part or basestring
+        :return: list of :class:`Part` of category INSTANCE
+        """
+        return list(
+            self._instances_by_model_id.get(check_base(model, Part, "model"), [])
+        )
+
+    def property(self, pk: str) -> "AnyProperty":
+        """
+        Retrieve a model or instance property from the snapshot on its id.
+
+        :param pk: id of the property
+        :type pk: basestring
+        :return: a single :class:`Property`
+        :raises NotFoundError: When the `Property` is not in the snapshot
+        """
+        prop = self._properties_by_id.get(check_base(pk, Property, "pk"))
+        if prop is None:
+            raise NotFoundError(f"No property with id `{pk}` in the snapshot")
+        return prop
+
+    def property_instances(self, model: Union[Property, str]) -> List["AnyProperty"]:
+        """
+        Retrieve the instances of a property model in the snapshot.
+
+        :param model: the property model or its id
+        :type model: Property or basestring
+        :return: list of :class:`Property` of category INSTANCE
+        """
+        return list(
+            self._property_instances_by_model_id.get(
+                check_base(model, Property, "model"), []
+            )
+        )
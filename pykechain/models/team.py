@@ -87,6 +87,7 @@ class Team(Base):
 
         if response.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError(f"Could not delete Team {self}", response=response)
+        self._client._uncache_objects(self.__class__, [self.id])
 
     def members(self, role: Optional[Union[TeamRoles, str]] = None) -> List[Dict]:
         """Members of the team.
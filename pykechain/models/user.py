@@ -1,12 +1,15 @@
 import datetime
+from typing import TYPE_CHECKING
 
-import pytz
 import requests
 
 from ..enums import LanguageCodes
 from ..exceptions import APIError
 from .base import Base
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pytz
+
 
 class User(Base):
     """A virtual object representing a KE-chain user.
@@ -46,7 +49,7 @@ class User(Base):
         return self.username if self.username else self.name
 
     @property
-    def timezone(self) -> pytz.BaseTzInfo:
+    def timezone(self) -> "pytz.BaseTzInfo":
         """
         Timezone of the user.
 
@@ -56,6 +59,8 @@ class User(Base):
         :return: timezone object (compatible with datetime)
         :rtype: TzInfo
         """
+        import pytz
+
         return pytz.timezone(zone=self._json_data.get("timezone", "UTC"))
 
     @property
@@ -105,6 +110,8 @@ class User(Base):
         :return: Current datetime
         :rtype datetime.datetime
         """
+        import pytz
+
         timezone_definition = self._json_data["timezone"]
         if timezone_definition:
             timezone = pytz.timezone(timezone_definition)
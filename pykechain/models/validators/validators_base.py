@@ -7,9 +7,8 @@ from typing import (  # noqa: F401 # pylint: disable=unused-import
     Union,
 )
 
-from jsonschema import validate
-
 from pykechain.enums import PropertyVTypes, ValidatorEffectTypes
+from pykechain.models.input_checks import validate_json
 from pykechain.models.validators.validator_schemas import (
     effects_jsonschema_stub,
     validator_jsonschema_stub,
@@ -43,7 +42,7 @@ class BaseValidator:
 
     def validate_json(self) -> Any:
         """Validate the json representation of the validator against the validator jsonschema."""
-        return validate(self._json, self.jsonschema)
+        return validate_json(self._json, self.jsonschema)
 
     @classmethod
     def parse(cls, json: Dict) -> Any:
@@ -112,7 +111,7 @@ class PropertyValidator(BaseValidator):
         """
         if "vtype" in json:
             vtype = json.get("vtype")
-            if vtype not in PropertyVTypes.values():
+            if not PropertyVTypes.has_value(vtype):
                 raise Exception(f"Validator unknown, incorrect json: '{json}'")
 
             from pykechain.models.validators import validators
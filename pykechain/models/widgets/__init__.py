@@ -1,30 +1,39 @@
-"""Widgets for KE-chain 3."""
-from .widget import Widget  # noqa: F403,F401,D104
-from .widget_models import (
-    AttachmentviewerWidget,
-    CardWidget,
-    DashboardWidget,
-    FilteredgridWidget,
-    HtmlWidget,
-    JsonWidget,
-    MetapanelWidget,
-    MulticolumnWidget,
-    NotebookWidget,
-    ProgressWidget,
-    PropertygridWidget,
-    ScopemembersWidget,
-    ScopeWidget,
-    ServicecardWidget,
-    ServiceWidget,
-    SignatureWidget,
-    SupergridWidget,
-    TasknavigationbarWidget,
-    TasksWidget,
-    ThirdpartyWidget,
-    UndefinedWidget,
-    WeatherWidget,
-)
-from .widgets_manager import WidgetsManager
+"""Widgets for KE-chain 3.
+
+The widget classes and the :class:`WidgetsManager` are imported upon first access, such that the widget
+machinery is only loaded when widgets are actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .widget import Widget  # noqa: F401
+    from .widget_models import (  # noqa: F401
+        AttachmentviewerWidget,
+        CardWidget,
+        DashboardWidget,
+        FilteredgridWidget,
+        HtmlWidget,
+        JsonWidget,
+        MetapanelWidget,
+        MulticolumnWidget,
+        NotebookWidget,
+        ProgressWidget,
+        PropertygridWidget,
+        ScopemembersWidget,
+        ScopeWidget,
+        ServicecardWidget,
+        ServiceWidget,
+        SignatureWidget,
+        SupergridWidget,
+        TasknavigationbarWidget,
+        TasksWidget,
+        ThirdpartyWidget,
+        UndefinedWidget,
+        WeatherWidget,
+    )
+    from .widgets_manager import WidgetsManager  # noqa: F401
 
 __all__ = (
     "Widget",
@@ -52,3 +61,25 @@ __all__ = (
     "ThirdpartyWidget",
     "WidgetsManager",
 )
+
+
+def _module_of(name: str) -> str:
+    if name == "Widget":
+        return ".widget"
+    if name == "WidgetsManager":
+        return ".widgets_manager"
+    return ".widget_models"
+
+
+def __getattr__(name: str):
+    """Import the widget class (or manager) upon first access."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_module_of(name), __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of this module including the lazily imported ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,14 +2,13 @@ import datetime
 import os
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import pytz
 import requests
-from jsonschema import validate
 
 from pykechain.defaults import API_EXTRA_PARAMS
 from pykechain.enums import Category, WidgetTitleValue, WidgetTypes
 from pykechain.exceptions import APIError, IllegalArgumentError, NotFoundError
 from pykechain.models import BaseInScope
+from pykechain.models.input_checks import validate_json
 from pykechain.models.widgets.enums import AssociatedObjectId, MetaWidget
 from pykechain.models.widgets.helpers import TITLE_TYPING, _set_title
 from pykechain.models.widgets.widget_schemas import widget_meta_schema
@@ -50,7 +49,10 @@ class Widget(BaseInScope):
         if self._client:
             self.schema = self._client.widget_schema(self.widget_type)
 
-        self.meta = self.validate_meta(json.get("meta"))
+        if self._client and not self._client.validate_widget_meta:
+            self.meta = json.get("meta")
+        else:
+            self.meta = self.validate_meta(json.get("meta"))
         self.order = json.get("order")
         self._activity_id = json.get("activity_id")
         self._parent_id = json.get("parent_id")
@@ -155,7 +157,13 @@ class Widget(BaseInScope):
         :return meta: if the meta is validated correctly
         :raise: `ValidationError`
         """
-        return validate(meta, self.schema) is None and meta
+        if self._client:
+            validate_json(
+                meta, validator=self._client.widget_validator(self.widget_type)
+            )
+        else:
+            validate_json(meta, self.schema)
+        return meta
 
     @classmethod
     def create(cls, json: Dict, **kwargs) -> "Widget":
@@ -543,6 +551,8 @@ class Widget(BaseInScope):
         )
 
         if user:
+            import pytz
+
             now_utc = datetime.datetime.now(tz=pytz.utc)
             now_local = user.now_in_my_timezone()
 
@@ -50,7 +50,7 @@ from pykechain.models.widgets.helpers import (
     _set_link,
     _set_title,
 )
-from pykechain.utils import find, is_url, is_uuid, snakecase
+from pykechain.utils import IndexedList, is_url, is_uuid, snakecase
 
 
 class WidgetsManager(Iterable):
@@ -77,7 +77,7 @@ class WidgetsManager(Iterable):
         :returns: None
         :raises IllegalArgumentError: if not provided one of :class:`Activity` or activity uuid and a `Client`
         """
-        self._widgets: List[Widget] = list(widgets)
+        self._widgets: List[Widget] = IndexedList(widgets)
         for widget in self._widgets:
             widget.manager = self
 
@@ -116,10 +116,14 @@ class WidgetsManager(Iterable):
             found = key
         elif isinstance(key, int):
             found = self._widgets[key]
-        elif is_uuid(key):
-            found = find(self._widgets, lambda p: key == p.id)
         elif isinstance(key, str):
-            found = find(self._widgets, lambda p: key == p.title or key == p.ref)
+            attributes = ("id",) if is_uuid(key) else ("title", "ref")
+            matches = self._widgets.lookup(key, attributes=attributes)
+            if not matches:
+                # a widget may have been retitled since the index was built
+                self._widgets.reindex()
+                matches = self._widgets.lookup(key, attributes=attributes)
+            found = matches[0] if matches else None
 
         if found is not None:
             return found
@@ -2445,7 +2449,7 @@ class WidgetsManager(Iterable):
 
         widgets = [dict(id=w.id, order=index) for index, w in enumerate(self._widgets)]
 
-        self._widgets = self._client.update_widgets(widgets=widgets)
+        self._widgets = IndexedList(self._client.update_widgets(widgets=widgets))
 
     def delete_widget(self, key: Any) -> bool:
         """
@@ -2470,5 +2474,5 @@ class WidgetsManager(Iterable):
         :raises ApiError: When the deletion of the widgets was not successful
         """
         self._client.delete_widgets(list(self))
-        self._widgets = []
+        self._widgets = IndexedList()
         return None
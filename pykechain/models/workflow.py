@@ -16,7 +16,7 @@ from pykechain.models.input_checks import (
 )
 from pykechain.models.tags import TagsMixin
 from pykechain.typing import ObjectID
-from pykechain.utils import Empty, clean_empty_values, find_obj_in_list
+from pykechain.utils import Empty, IndexedList, clean_empty_values, find_obj_in_list
 
 if TYPE_CHECKING:
     from pykechain.client import Client
@@ -99,15 +99,15 @@ class Workflow(
         self.description: str = json.get("description", "")
         self.ref: str = json.get("ref", "")
         self.derived_from_id: Optional[ObjectID] = json.get("derived_from_id")
-        self._transitions: List[Transition] = [
+        self._transitions: List[Transition] = IndexedList(
             Transition(j, client=self._client) for j in json.get("transitions", [])
-        ]
+        )
         self.category: WorkflowCategory = json.get("category")
         self.options: dict = json.get("options", {})
         self.active: bool = json.get("active")
-        self._statuses: List[Status] = [
+        self._statuses: List[Status] = IndexedList(
             Status(j, client=self._client) for j in json.get("statuses")
-        ]
+        )
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<pyke Workflow '{self.name}' '{self.category}' id {self.id[-8:]}>"
@@ -3,22 +3,25 @@ import re
 import unicodedata
 from contextlib import contextmanager
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Iterable,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )  # noqa: F401
 
-import pytz
-from pytz.exceptions import UnknownTimeZoneError
-
 from pykechain.exceptions import MultipleFoundError, NotFoundError
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pytz
+
 T = TypeVar("T")
 
 UUID_REGEX_PATTERN = (
@@ -230,6 +233,55 @@ def temp_chdir(cwd: Optional[str] = None):
             os.chdir(origin)
 
 
+DATETIME_REGEX = re.compile(
+    r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+    r"[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
+    r"(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?"
+    r"(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$"
+)
+
+
+@lru_cache(maxsize=None)
+def _get_fixed_timezone(offset: int) -> timezone:
+    """Return a tzinfo instance with a fixed offset in minutes from UTC."""
+    sign = "-" if offset < 0 else "+"
+    hhmm = "%02d%02d" % divmod(abs(offset), 60)
+    name = sign + hhmm
+    return timezone(timedelta(minutes=offset), name)
+
+
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    """
+    Convert a datetime string in the ISO format used by KE-chain using `datetime.fromisoformat`.
+
+    Returns None when the value is not in the format `YYYY-MM-DDTHH:MM[:SS[.ffffff]][Z|+HH:MM]`, so the
+    value can be parsed by the regular expression instead.
+    """
+    if (
+        len(value) < 16
+        or value[4] != "-"
+        or value[7] != "-"
+        or value[10] not in "T "
+        or value[13] != ":"
+    ):
+        return None
+    zulu = value[-1] == "Z"
+    try:
+        dt = datetime.fromisoformat(value[:-1] + "+00:00" if zulu else value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return dt
+    if zulu:
+        import pytz
+
+        return dt.replace(tzinfo=pytz.UTC)
+    offset = dt.utcoffset()
+    if offset.seconds % 60 or offset.microseconds:
+        return None
+    return dt.replace(tzinfo=_get_fixed_timezone(int(offset.total_seconds()) // 60))
+
+
 def parse_datetime(value: Optional[str]) -> Optional[datetime]:
     """
     Convert datetime string to datetime object.
@@ -256,29 +308,20 @@ def parse_datetime(value: Optional[str]) -> Optional[datetime]:
         # do not process the value
         return None
 
-    def _get_fixed_timezone(offset):
-        """Return a tzinfo instance with a fixed offset from UTC."""
-        if isinstance(offset, timedelta):
-            offset = offset.total_seconds() // 60
-        sign = "-" if offset < 0 else "+"
-        hhmm = "%02d%02d" % divmod(abs(offset), 60)
-        name = sign + hhmm
-        return timezone(timedelta(minutes=offset), name)
-
-    datetime_re = re.compile(
-        r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
-        r"[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
-        r"(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?"
-        r"(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$"
-    )
+    # fast path for the ISO format as provided by KE-chain
+    dt = _parse_iso_datetime(value)
+    if dt is not None:
+        return dt
 
-    match = datetime_re.match(value)
+    match = DATETIME_REGEX.match(value)
     if match:
         kw = match.groupdict()
         if kw["microsecond"]:
             kw["microsecond"] = kw["microsecond"].ljust(6, "0")
         tzinfo = kw.pop("tzinfo")
         if tzinfo == "Z":
+            import pytz
+
             tzinfo = pytz.UTC
         elif tzinfo is not None:
             offset_mins = int(tzinfo[-2:]) if len(tzinfo) > 3 else 0
@@ -638,6 +681,96 @@ def clean_empty_values(update_dict: Dict, nones: bool = True) -> Dict:
     return cleaned_up_dict
 
 
+def _discarding_index(method: Callable) -> Callable:
+    """Wrap a mutating method of a list to discard the index of the `IndexedList`."""
+
+    def wrapper(self, *args, **kwargs):
+        self._indexes = dict()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class IndexedList(list):
+    """
+    List of objects, indexed on their attributes (eg. id, name and ref) to look these up without scanning the list.
+
+    The index of an attribute is built upon the first lookup on that attribute and discarded whenever the list
+    itself is changed. Objects found in the index of which the attribute has changed since, are not returned.
+    Lookups can thus miss objects of which the attribute was changed to the value looked up: use `reindex()`
+    to rebuild the index in that case.
+
+    .. versionadded:: 4.17
+    """
+
+    def __init__(self, iterable: Iterable = ()):
+        """
+        Create an indexed list of the objects.
+
+        :param iterable: (optional) the objects in the list
+        :type iterable: iterable
+        """
+        super().__init__(iterable)
+        self._indexes: Dict[Tuple[Tuple[str, ...], bool], Dict[Any, List]] = dict()
+
+    append = _discarding_index(list.append)
+    extend = _discarding_index(list.extend)
+    insert = _discarding_index(list.insert)
+    remove = _discarding_index(list.remove)
+    pop = _discarding_index(list.pop)
+    clear = _discarding_index(list.clear)
+    sort = _discarding_index(list.sort)
+    reverse = _discarding_index(list.reverse)
+    __setitem__ = _discarding_index(list.__setitem__)
+    __delitem__ = _discarding_index(list.__delitem__)
+    __iadd__ = _discarding_index(list.__iadd__)
+    __imul__ = _discarding_index(list.__imul__)
+
+    @staticmethod
+    def _keys(obj: Any, attributes: Tuple[str, ...], lower: bool) -> List[Any]:
+        keys = []
+        for attribute in attributes:
+            key = getattr(obj, attribute, None)
+            if lower and isinstance(key, str):
+                key = key.lower()
+            if key is not None and key not in keys:
+                keys.append(key)
+        return keys
+
+    def reindex(self) -> None:
+        """Discard the indexes, such that these are rebuilt upon the next lookup."""
+        self._indexes = dict()
+
+    def lookup(
+        self, value: Any, attributes: Tuple[str, ...] = ("id",), lower: bool = False
+    ) -> List:
+        """
+        Retrieve the objects of which one of the attributes equals the value, in the order of the list.
+
+        :param value: the value to look up
+        :param attributes: (optional) the attributes of the objects to match the value on, defaults to the id
+        :type attributes: tuple of str
+        :param lower: (optional) match the lowercased (string) attributes, defaults to False
+        :type lower: bool
+        :return: list of matching objects
+        """
+        index = self._indexes.get((attributes, lower))
+        if index is None:
+            index = dict()
+            for obj in self:
+                for key in self._keys(obj, attributes, lower):
+                    index.setdefault(key, []).append(obj)
+            self._indexes[(attributes, lower)] = index
+
+        return [
+            obj
+            for obj in index.get(value, [])
+            if value in self._keys(obj, attributes, lower)
+        ]
+
+
 def find_obj_in_list(value: str, iterable: List[Any], attribute: str = None) -> Any:
     """
     Retrieve a Base object belonging to an iterable list on its name, ref or uuid.
@@ -645,6 +778,8 @@ def find_obj_in_list(value: str, iterable: List[Any], attribute: str = None) ->
     You may provide an attribute name of the Base object (such as 'id', 'derived_from', ...) on
     where to match the val on. So it will check equivalence on `Base.get(attribute) == value`.
 
+    When the iterable is an `IndexedList`, the objects are looked up on their uuid, name or ref using its index.
+
     :param value: Base object name, ref or UUID to search for
     :param iterable: List of Base objects to search in.
     :param attribute: the attribute on where to match the comparison on.
@@ -655,6 +790,18 @@ def find_obj_in_list(value: str, iterable: List[Any], attribute: str = None) ->
     matches = []
     if attribute:
         matches = [t for t in iterable if getattr(t, attribute) == value]
+    elif isinstance(iterable, IndexedList):
+        for _ in range(2):
+            if is_uuid(value):
+                matches = iterable.lookup(value)
+            else:
+                matches = iterable.lookup(
+                    value.lower(), attributes=("name",), lower=True
+                ) or iterable.lookup(value, attributes=("ref",))
+            if matches:
+                break
+            # an object may have been renamed since the index was built
+            iterable.reindex()
     elif is_uuid(value):
         matches = [t for t in iterable if t.id == value]
     else:
@@ -682,13 +829,15 @@ def get_offset_from_user_timezone(user: "User") -> int:
     :type user: User object
     :return: number of minutes to the nearest integer
     """
+    import pytz
+
     user_timezone = pytz.timezone(user.timezone.zone)
     user_time = datetime.now(user_timezone)
     offset = -int(user_time.tzinfo.utcoffset(user_time).total_seconds() / 60.0)
     return offset
 
 
-def get_timezone_from_user(user: "User") -> pytz.BaseTzInfo:
+def get_timezone_from_user(user: "User") -> "pytz.BaseTzInfo":
     """
     Get the timezone from the given user.
 
@@ -698,6 +847,9 @@ def get_timezone_from_user(user: "User") -> pytz.BaseTzInfo:
     :param user: The user object.
     :return: The timezone object
     """
+    import pytz
+    from pytz.exceptions import UnknownTimeZoneError
+
     try:
         user_timezone = pytz.timezone(user.timezone.zone)
     except UnknownTimeZoneError:
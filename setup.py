@@ -69,7 +69,7 @@ setup(
     keywords="python api rest sdk KE-chain",
     # You can just specify the packages manually here if your project is
     # simple. Or you can use find_packages().
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=find_packages(exclude=["tests", "tests.*", "benchmarks", "benchmarks.*"]),
     # Project URLs
     project_urls={
         "Documentation": "https://pykechain.readthedocs.io/en/latest",
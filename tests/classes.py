@@ -1,13 +1,22 @@
 import collections
 import datetime
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
 from unittest import TestCase
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import pytz
+import requests
 from betamax import Betamax
+from requests.adapters import BaseAdapter
 
 from pykechain import Client
 from tests.utils import (
+    FAKE_URL,
     TEST_RECORD_CASSETTES,
     TEST_SCOPE_ID,
     TEST_SCOPE_NAME,
@@ -68,6 +77,170 @@ class TestBetamax(TestCase):
         del self.client
 
 
+class FakeKechainAdapter(BaseAdapter):
+    """Transport adapter serving paginated KE-chain list endpoints from memory.
+
+    Mount it on the session of a `Client` to test the client offline. The results are provided per
+    API path (eg. `api/v3/parts.json`) and are paginated using the `limit` and `offset` query params,
+    or the `page_size` of the adapter when no `limit` is requested.
+    Every request sent through the adapter is recorded in `requests`. POST and PUT requests echo the sent
+    json as results, updating the known objects with the same id, unless it contains an object of which the
+    id is in `failing_ids`. DELETE requests succeed without content.
+    """
+
+    def __init__(
+        self, results_by_path: Dict[str, List[Dict]], page_size: Optional[int] = None
+    ):
+        super().__init__()
+        self.results_by_path = results_by_path
+        self.page_size = page_size
+        self.failing_ids = set()
+        self.requests: List[requests.PreparedRequest] = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests.append(request)
+
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/json"
+        if request.method in ("POST", "PUT"):
+            posted = json.loads(request.body or "null")
+            results = posted if isinstance(posted, list) else [posted]
+            if any(r.get("id") in self.failing_ids for r in results):
+                response.status_code = requests.codes.bad_request
+                results = [dict(detail="Invalid value")]
+            else:
+                known = {
+                    r.get("id"): r for rs in self.results_by_path.values() for r in rs
+                }
+                results = [dict(known.get(r.get("id"), {}), **r) for r in results]
+            content = dict(results=results)
+        elif request.method == "DELETE":
+            response.status_code = requests.codes.no_content
+            response._content = b""
+            return response
+        else:
+            content = self.page(request.url)
+        response._content = json.dumps(content).encode()
+        return response
+
+    def page(self, url: str) -> Dict:
+        """Provide the page of results requested by the url, in the KE-chain response format."""
+        parsed_url = urlparse(url)
+        query = {k: v[0] for k, v in parse_qs(parsed_url.query).items()}
+        results = self.results_by_path.get(parsed_url.path.lstrip("/"), [])
+        if "id__in" in query:
+            ids = query["id__in"].split(",")
+            results = [r for r in results if r.get("id") in ids]
+
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit") or self.page_size or len(results) or 1)
+        next_url = None
+        if offset + limit < len(results):
+            next_query = dict(query, offset=offset + limit)
+            next_url = parsed_url._replace(query=urlencode(next_query)).geturl()
+
+        return dict(
+            count=len(results),
+            next=next_url,
+            previous=None,
+            results=results[offset : offset + limit],  # noqa: E203
+        )
+
+    def close(self):
+        pass
+
+
+class FakeKechainTestCase(TestCase):
+    """Test case with a `Client` of a stand-in KE-chain, served from memory by a `FakeKechainAdapter`."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client(url=FAKE_URL)
+        self.adapter = self.mount_fake_kechain(dict())
+
+    def mount_fake_kechain(
+        self, results_by_path: Dict[str, List[Dict]], page_size: Optional[int] = None
+    ) -> FakeKechainAdapter:
+        """Serve the results per API path to the client of the test case."""
+        self.adapter = FakeKechainAdapter(results_by_path, page_size=page_size)
+        self.client.session.mount(FAKE_URL, self.adapter)
+        return self.adapter
+
+    def fake_client(self) -> Client:
+        """Create another client of the stand-in KE-chain, served by the same adapter."""
+        client = Client(url=FAKE_URL)
+        client.session.mount(FAKE_URL, self.adapter)
+        return client
+
+
+class FakeKechainServer:
+    """Local HTTP server serving the KE-chain endpoints of a `FakeKechainAdapter`.
+
+    Use it as a context manager, the `url` of the running server can be used to create a `Client`.
+    GET requests are answered with the paginated results of the adapter, POST requests echo the posted
+    json as results. Every request takes at least `delay` seconds, while the maximum number of requests
+    handled at the same time is recorded in `max_in_flight`.
+    """
+
+    def __init__(self, adapter: FakeKechainAdapter, delay: float = 0.0):
+        self.adapter = adapter
+        self.delay = delay
+        self.paths: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self.url: Optional[str] = None
+
+    def __enter__(self) -> "FakeKechainServer":
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = fake_server.url.rstrip("/") + self.path
+                fake_server._respond(self, lambda: fake_server.adapter.page(url))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                posted = json.loads(self.rfile.read(length) or "null")
+                results = posted if isinstance(posted, list) else [posted]
+                fake_server._respond(self, lambda: dict(results=results))
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _respond(self, handler: BaseHTTPRequestHandler, content) -> None:
+        with self._lock:
+            self.paths.append(handler.path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            body = json.dumps(content()).encode()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        handler.send_response(requests.codes.ok)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
 #
 # This is EnvironmentVarGuard implementation of python 3.
 # see: https://github.com/python/cpython/blob/3.10/Lib/test/support/os_helper.py#L562
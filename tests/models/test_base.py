@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from pykechain import Client
-from pykechain.models.base import Base
+from pykechain.models.base import Base, LazyDatetime
 
 
 class TestBase(TestCase):
@@ -25,3 +25,29 @@ class TestBase(TestCase):
 
         self.assertEqual(obj._client, client)
         self.assertIsInstance(obj._client, Client)
+
+    def test_datetimes(self):
+        obj = Base(dict(self.json, created_at="2020-01-02T12:30:15Z"), None)
+
+        self.assertEqual(2020, obj.created_at.year)
+        self.assertIsNone(obj.updated_at)
+
+    def test_lazy_datetimes(self):
+        client = Client(lazy_datetimes=True)
+
+        obj = Base(dict(self.json, created_at="2020-01-02T12:30:15Z"), client)
+
+        self.assertIs(LazyDatetime.UNPARSED, obj.__dict__["created_at"])
+        self.assertEqual(2020, obj.created_at.year)
+        self.assertEqual(2020, obj.__dict__["created_at"].year)
+        self.assertIsNone(obj.updated_at)
+
+        obj.refresh(json=dict(self.json, created_at="2021-01-02T12:30:15Z"))
+        self.assertEqual(2021, obj.created_at.year)
+
+    def test_delete_datetime(self):
+        obj = Base(self.json, None)
+
+        del obj.created_at
+
+        self.assertFalse(hasattr(obj, "created_at"))
@@ -0,0 +1,89 @@
+from pykechain.defaults import API_PATH
+from pykechain.enums import ActivityType
+from pykechain.models import Activity, Scope
+from tests.classes import FakeKechainTestCase
+from tests.utils import fake_activity, uuid
+
+SCOPE_ID = uuid(0)
+
+
+def tree_activity(i, parent=None, activity_type=ActivityType.TASK):
+    return fake_activity(
+        uuid(i),
+        name=f"Activity {i}",
+        activity_type=activity_type,
+        parent_id=parent["id"] if parent else None,
+        scope_id=SCOPE_ID,
+    )
+
+
+class TestActivityTreeOffline(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        workflow_root = tree_activity(1, activity_type=ActivityType.PROCESS)
+        app_root = tree_activity(2, activity_type=ActivityType.PROCESS)
+        subprocess = tree_activity(3, workflow_root, activity_type=ActivityType.PROCESS)
+        nested = tree_activity(4, subprocess, activity_type=ActivityType.PROCESS)
+        self.activities_json = [
+            workflow_root,
+            app_root,
+            subprocess,
+            nested,
+            tree_activity(5, subprocess),
+            tree_activity(6, nested),
+            tree_activity(7, workflow_root),
+            tree_activity(8, app_root),
+        ]
+        self.adapter = self.mount_fake_kechain(
+            {API_PATH["activities"]: self.activities_json}
+        )
+        self.scope = Scope(
+            dict(
+                id=SCOPE_ID,
+                name="Project",
+                workflow_root_id=workflow_root["id"],
+                app_root_id=app_root["id"],
+                scope_options=dict(),
+            ),
+            client=self.client,
+        )
+
+    def names(self, activities):
+        return [a.name for a in activities]
+
+    def test_activity_tree(self):
+        workflow_root = self.scope.activity_tree(batch=3)
+        number_of_requests = len(self.adapter.requests)
+        self.assertEqual(3, number_of_requests)
+
+        self.assertEqual("Activity 1", workflow_root.name)
+        self.assertIs(workflow_root, self.scope.workflow_root_process)
+        self.assertEqual("Activity 2", self.scope.app_root_process.name)
+        self.assertEqual(
+            ["Activity 3", "Activity 4", "Activity 6", "Activity 5", "Activity 7"],
+            self.names(workflow_root.all_children()),
+        )
+        self.assertEqual(
+            ["Activity 8"], self.names(self.scope.app_root_process.children())
+        )
+
+        nested_task = (
+            workflow_root.child("Activity 3").child("Activity 4").children()[0]
+        )
+        self.assertEqual("Activity 6", nested_task.name)
+        self.assertEqual("Activity 1", nested_task.parent().parent().parent().name)
+        self.assertEqual(number_of_requests, len(self.adapter.requests))
+
+    def test_populate_descendants(self):
+        subprocess = Activity(self.activities_json[2], client=self.client)
+        subprocess.populate_descendants(batch=5)
+        number_of_requests = len(self.adapter.requests)
+        self.assertEqual(2, number_of_requests)
+
+        self.assertEqual(
+            ["Activity 4", "Activity 6", "Activity 5"],
+            self.names(subprocess.all_children()),
+        )
+        nested = subprocess.children()[0]
+        self.assertIs(subprocess, nested.parent())
+        self.assertEqual(number_of_requests, len(self.adapter.requests))
@@ -0,0 +1,97 @@
+import asyncio
+from unittest import TestCase
+
+from pykechain import AsyncClient, Client
+from pykechain.defaults import API_PATH
+from pykechain.models import Part, PartSet
+from tests.classes import FakeKechainAdapter, FakeKechainServer
+from tests.utils import fake_part, fake_property, uuid
+
+
+class TestAsyncClient(TestCase):
+    def setUp(self):
+        self.parts = [
+            fake_part(
+                uuid(i),
+                "INSTANCE",
+                properties=[fake_property(uuid(100 + i), "INSTANCE", uuid(i))],
+            )
+            for i in range(20)
+        ]
+        self.adapter = FakeKechainAdapter({API_PATH["parts"]: self.parts}, page_size=5)
+        self.server = FakeKechainServer(self.adapter, delay=0.05).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    def test_parts(self):
+        async def retrieve():
+            async with AsyncClient(url=self.server.url) as client:
+                return await client.parts(batch=5)
+
+        parts = asyncio.run(retrieve())
+
+        self.assertIsInstance(parts, PartSet)
+        self.assertEqual([p["id"] for p in self.parts], [p.id for p in parts])
+        self.assertEqual(4, len(self.server.paths))
+
+    def test_concurrent_lookups_are_bounded(self):
+        async def retrieve():
+            async with AsyncClient(url=self.server.url, max_concurrency=4) as client:
+                return await asyncio.gather(
+                    *(
+                        client.part(name="Part INSTANCE", id__in=p["id"])
+                        for p in self.parts
+                    )
+                )
+
+        parts = asyncio.run(retrieve())
+
+        self.assertEqual([p["id"] for p in self.parts], [p.id for p in parts])
+        self.assertTrue(all(isinstance(p, Part) for p in parts))
+        self.assertEqual(20, len(self.server.paths))
+        self.assertEqual(4, self.server.max_in_flight)
+
+    def test_update_properties(self):
+        updates = [dict(fake_property(uuid(100), "INSTANCE", uuid(0)), value="new")]
+
+        async def update():
+            async with AsyncClient(client=Client(url=self.server.url)) as client:
+                return await client.update_properties(properties=updates)
+
+        properties = asyncio.run(update())
+
+        self.assertEqual(["new"], [p.value for p in properties])
+
+    def test_run(self):
+        async def children():
+            async with AsyncClient(url=self.server.url) as client:
+                return await client.run(client.client.parts, limit=3)
+
+        self.assertEqual(3, len(asyncio.run(children())))
+
+    def test_worker_threads_have_sessions_of_their_own(self):
+        client = Client(url=self.server.url)
+
+        def send_request():
+            client.parts(limit=1)
+            return client.last_response.connection, client._thread_session
+
+        async def retrieve():
+            async with AsyncClient(client=client, max_concurrency=4) as async_client:
+                return await asyncio.gather(
+                    *(async_client.run(send_request) for _ in range(8))
+                )
+
+        results = asyncio.run(retrieve())
+
+        sessions = {session for _, session in results}
+        self.assertEqual(4, len(sessions))
+        self.assertNotIn(client.session, sessions)
+        # the sessions share the transport adapter of the client
+        self.assertTrue(
+            all(connection is client.session.get_adapter(self.server.url) for connection, _ in results)
+        )
+        self.assertEqual(dict(), client._worker_sessions)
+
+    def test_max_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncClient(url=self.server.url, max_concurrency=0)
@@ -0,0 +1,97 @@
+import io
+import threading
+from unittest import TestCase, mock
+
+import requests
+
+from pykechain import Client
+from pykechain.enums import Category, PropertyType
+from pykechain.extra_utils import transfer_attachments
+from pykechain.models import AttachmentProperty, Property
+from tests.utils import FAKE_URL, fake_property, uuid
+
+
+def fake_attachment(i, value=None):
+    return fake_property(
+        uuid(i),
+        Category.INSTANCE,
+        uuid(100 + i),
+        name=f"Drawing {i}",
+        property_type=PropertyType.ATTACHMENT_VALUE,
+        value=value,
+    )
+
+
+class TestTransferAttachments(TestCase):
+    def setUp(self):
+        self.client = Client(url=FAKE_URL)
+        self.uploads = dict()
+        self.upload_retries = []
+        self.barrier = None
+        self.client.add_hook(before_send=self.fake_kechain)
+
+        self.originals = [
+            Property.create(
+                fake_attachment(i, value=f"attachments/drawing_{i}.pdf"),
+                client=self.client,
+            )
+            for i in range(4)
+        ]
+        self.new = [
+            Property.create(fake_attachment(i), client=self.client)
+            for i in range(10, 14)
+        ]
+
+    def fake_kechain(self, info):
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        property_id = info.url.split("/")[-2]
+        if info.resource == "property_download":
+            if self.barrier is not None:
+                # every download waits for the other downloads, these must be running concurrently
+                self.barrier.wait()
+            self.assertTrue(info.kwargs["stream"])
+            response.headers["Content-Type"] = "application/pdf"
+            response.raw = io.BytesIO(f"content of {property_id}".encode())
+        elif info.resource == "property_upload":
+            self.uploads[property_id] = b"".join(info.kwargs["data"])
+            adapter = self.client._thread_session.get_adapter(info.url)
+            self.upload_retries.append(adapter.max_retries.total)
+        info.response = response
+
+    def test_transfer_streamed(self):
+        with mock.patch("builtins.open") as mocked_open:
+            transfer_attachments(zip(self.originals, self.new), max_workers=None)
+
+        mocked_open.assert_not_called()
+        self.assertIsInstance(self.new[0], AttachmentProperty)
+        body = self.uploads[self.new[0].id]
+        self.assertIn(b'name="part"\r\n\r\n' + self.new[0]._json_data["part_id"].encode(), body)
+        self.assertIn(
+            b'name="attachment"; filename="drawing_0.pdf"\r\nContent-Type: application/pdf\r\n\r\n'
+            + f"content of {self.originals[0].id}".encode(),
+            body,
+        )
+        self.assertEqual(4, len(self.uploads))
+        self.assertEqual("drawing_3.pdf", self.new[3].filename)
+
+    def test_transfer_concurrently(self):
+        self.barrier = threading.Barrier(4, timeout=5)
+
+        transfer_attachments(zip(self.originals, self.new), max_workers=4)
+
+        self.assertEqual({p.id for p in self.new}, set(self.uploads))
+
+    def test_transfer_without_attachment_clears(self):
+        with mock.patch.object(AttachmentProperty, "clear") as mocked_clear:
+            transfer_attachments([(self.new[1], self.new[2])])
+
+        mocked_clear.assert_called_once()
+        self.assertEqual(dict(), self.uploads)
+
+    def test_streamed_upload_is_not_retried(self):
+        transfer_attachments(zip(self.originals[:1], self.new[:1]))
+
+        self.assertEqual([0], self.upload_retries)
+        url = self.client._build_url("property_upload", property_id=self.new[0].id)
+        self.assertGreater(self.client.session.get_adapter(url).max_retries.total, 0)
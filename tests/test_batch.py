@@ -0,0 +1,179 @@
+import json
+import threading
+from copy import deepcopy
+
+from pykechain import Client
+from pykechain.batch import Batch
+from pykechain.defaults import API_PATH
+from pykechain.exceptions import BulkUpdateError
+from pykechain.models import Part, Property
+from tests.classes import FakeKechainTestCase
+from tests.utils import FAKE_URL, fake_part, fake_property, uuid
+
+
+class TestBatchOffline(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.parts_json = [
+            fake_part(
+                uuid(i),
+                "INSTANCE",
+                name=f"Part {i}",
+                description="",
+                properties=[
+                    fake_property(
+                        uuid(100 + 10 * i + j),
+                        "INSTANCE",
+                        uuid(i),
+                        name=f"Property {j}",
+                        value=None,
+                        order=j,
+                    )
+                    for j in range(3)
+                ],
+            )
+            for i in range(4)
+        ]
+        properties_json = [p for part in self.parts_json for p in part["properties"]]
+        self.adapter = self.mount_fake_kechain(
+            {
+                API_PATH["parts"]: self.parts_json,
+                API_PATH["properties"]: properties_json,
+            }
+        )
+        self.parts = [
+            Part(json.loads(json.dumps(p)), client=self.client) for p in self.parts_json
+        ]
+
+    def sent(self, method):
+        return [r for r in self.adapter.requests if r.method == method]
+
+    def test_property_values_are_sent_on_exit(self):
+        with self.client.batch() as batch:
+            self.assertIsInstance(batch, Batch)
+            self.assertIs(batch, self.client.current_batch)
+            for part in self.parts:
+                for prop in part.properties:
+                    prop.value = f"{part.name} {prop.name}"
+
+            self.assertFalse(self.adapter.requests)
+            self.assertEqual(12, len(batch))
+            self.assertEqual("Part 0 Property 0", self.parts[0].properties[0].value)
+
+        self.assertIsNone(self.client.current_batch)
+        posted = self.sent("POST")
+        self.assertEqual(1, len(posted))
+        self.assertEqual(12, len(json.loads(posted[0].body)))
+        self.assertEqual(
+            "Part 3 Property 2", self.parts[3].properties[2]._json_data["value"]
+        )
+        self.assertFalse(Property._USE_BULK_UPDATE)
+
+    def test_properties_are_sent_in_chunks(self):
+        with self.client.batch(chunk_size=5, max_workers=2):
+            for part in self.parts:
+                for prop in part.properties:
+                    prop.value = "value"
+
+        self.assertEqual(3, len(self.sent("POST")))
+
+    def test_part_updates_and_edits_are_merged(self):
+        part = self.parts[0]
+        with self.client.batch():
+            part.edit(description="Edited in a batch")
+            part.update(name="Renamed", update_dict={"Property 1": "new value"})
+
+            self.assertEqual("Renamed", part.name)
+            self.assertEqual("Edited in a batch", part.description)
+            self.assertEqual("new value", part.property("Property 1").value)
+            self.assertFalse(self.adapter.requests)
+
+        put = self.sent("PUT")
+        self.assertEqual(1, len(put))
+        self.assertEqual(
+            dict(id=part.id, name="Renamed", description="Edited in a batch"),
+            json.loads(put[0].body),
+        )
+        posted = self.sent("POST")
+        self.assertEqual(1, len(posted))
+        self.assertEqual("Renamed", part._json_data["name"])
+        self.assertEqual("new value", part.property("Property 1")._json_data["value"])
+
+    def test_flush_parts_only(self):
+        part = self.parts[0]
+        with self.client.batch() as batch:
+            part.edit(name="Renamed")
+            part.properties[0].value = "pending"
+
+            batch.flush(include_properties=False)
+
+            self.assertEqual(1, len(self.sent("PUT")))
+            self.assertFalse(self.sent("POST"))
+            self.assertEqual(1, len(batch))
+
+        self.assertEqual(1, len(self.sent("POST")))
+        self.assertEqual("pending", part.properties[0]._json_data["value"])
+
+    def test_exception_discards_updates(self):
+        with self.assertRaises(ValueError):
+            with self.client.batch():
+                self.parts[0].properties[0].value = "discarded"
+                raise ValueError("Something went wrong")
+
+        self.assertFalse(self.adapter.requests)
+        self.assertIsNone(self.client.current_batch)
+
+    def test_nested_batches_are_joined(self):
+        with self.client.batch() as outer:
+            with self.client.batch() as inner:
+                self.parts[0].properties[0].value = "value"
+            self.assertIs(outer, inner)
+            self.assertFalse(self.adapter.requests)
+
+        self.assertEqual(1, len(self.sent("POST")))
+
+    def test_failed_updates_remain_pending(self):
+        failing_id = self.parts[1].properties[0].id
+        self.adapter.failing_ids.add(failing_id)
+
+        with self.assertRaises(BulkUpdateError) as cm:
+            with self.client.batch(chunk_size=2) as batch:
+                for part in self.parts:
+                    part.properties[0].value = "value"
+
+        # the properties in the same chunk as the failing property failed as well
+        failed_ids = [part.properties[0].id for part in self.parts[:2]]
+        self.assertEqual(failed_ids, list(cm.exception.failed))
+        self.assertIn(failing_id, str(cm.exception))
+        self.assertEqual(failed_ids, list(batch.properties))
+        self.assertEqual("value", self.parts[2].properties[0]._json_data["value"])
+
+        self.adapter.failing_ids.clear()
+        batch.flush()
+        self.assertFalse(batch)
+
+    def test_batch_is_scoped_to_thread_and_client(self):
+        other_client = self.fake_client()
+        in_thread = []
+
+        with self.client.batch():
+            thread = threading.Thread(
+                target=lambda: in_thread.append(self.client.current_batch)
+            )
+            thread.start()
+            thread.join()
+
+            self.assertIsNone(other_client.current_batch)
+            self.assertTrue(self.parts[0].properties[0].use_bulk_update)
+
+        self.assertEqual([None], in_thread)
+        self.assertFalse(self.parts[0].properties[0].use_bulk_update)
+
+    def test_client_can_be_copied(self):
+        # without the fake adapter, which cannot be copied
+        client = Client(url=FAKE_URL)
+        part = Part(json.loads(json.dumps(self.parts_json[0])), client=client)
+        with client.batch():
+            copied_part = deepcopy(part)
+
+        self.assertIsNone(copied_part._client.current_batch)
@@ -0,0 +1,171 @@
+from itertools import count
+from unittest import TestCase, mock
+
+from pykechain import Client
+from pykechain.batch import Batch
+from pykechain.enums import Category, Multiplicity
+from pykechain.extra_utils import (
+    _InstanceCopy,
+    _copy_instances,
+    get_edited_one_many,
+    get_mapping_dictionary,
+)
+from pykechain.models import Part, PartSet
+from tests.utils import FAKE_URL, fake_part, uuid
+
+
+class TestCopyInstancesOffline(TestCase):
+    """Copy an instance tree of a bike with 2 wheels, each with 1 hub and 3 spokes."""
+
+    def setUp(self):
+        self.client = Client(url=FAKE_URL)
+        self.ids = count(1)
+        get_mapping_dictionary(clean=True)
+        get_edited_one_many(clean=True)
+
+        self.bike_model = self.part("Bike", Category.MODEL, Multiplicity.ONE)
+        self.wheel_model = self.part(
+            "Wheel", Category.MODEL, Multiplicity.ZERO_MANY, parent=self.bike_model
+        )
+        self.hub_model = self.part(
+            "Hub", Category.MODEL, Multiplicity.ONE, parent=self.wheel_model
+        )
+        self.spoke_model = self.part(
+            "Spoke", Category.MODEL, Multiplicity.ONE_MANY, parent=self.wheel_model
+        )
+        models = [self.wheel_model, self.hub_model, self.spoke_model]
+        self.bike_model._populate_cached_children(models)
+
+        self.bike = self.part("Bike", Category.INSTANCE, model=self.bike_model)
+        self.descendants = []
+        for w in range(2):
+            wheel = self.part(
+                f"Wheel {w}", Category.INSTANCE, parent=self.bike, model=self.wheel_model
+            )
+            self.descendants.append(wheel)
+            self.descendants.append(
+                self.part(
+                    f"Hub {w}", Category.INSTANCE, parent=wheel, model=self.hub_model
+                )
+            )
+            self.descendants.extend(
+                self.part(
+                    f"Spoke {s}",
+                    Category.INSTANCE,
+                    parent=wheel,
+                    model=self.spoke_model,
+                )
+                for s in range(3)
+            )
+
+        # the copied models, of which the instances with multiplicity ONE or ONE_MANY are created automatically
+        for model in [self.bike_model] + models:
+            get_mapping_dictionary()[model.id] = self.part(
+                model.name, Category.MODEL, model.multiplicity
+            )
+        self.target_parent = self.part("Target", Category.INSTANCE)
+        self.auto_created = list()
+
+    def part(self, name, category, multiplicity=None, parent=None, model=None):
+        return Part(
+            fake_part(
+                uuid(next(self.ids)),
+                category,
+                model_id=model.id if model else None,
+                name=name,
+                multiplicity=multiplicity,
+                parent_id=parent.id if parent else None,
+            ),
+            client=self.client,
+        )
+
+    def fake_parts(self, parent_id__in=None, **kwargs):
+        parent_ids = parent_id__in.split(",")
+        originals = [self.bike] + self.descendants
+        if set(parent_ids) <= {p.id for p in originals}:
+            return PartSet(parts=[p for p in originals if p.parent_id in parent_ids])
+        parts = []
+        for parent_id in parent_ids:
+            for model in (self.bike_model, self.hub_model, self.spoke_model):
+                model_new = get_mapping_dictionary()[model.id]
+                auto_created = self.part(model.name, Category.INSTANCE, model=model_new)
+                auto_created.parent_id = parent_id
+                parts.append(auto_created)
+        self.auto_created.extend(parts)
+        return PartSet(parts=parts)
+
+    def fake_create_parts_bulk(self, parts, **kwargs):
+        return PartSet(
+            parts=[
+                self.part(
+                    p["name"],
+                    Category.INSTANCE,
+                    model=mock.Mock(id=p["model_id"]),
+                )
+                for p in parts
+            ]
+        )
+
+    def test_copy_instances_per_level(self):
+        instances = [
+            _InstanceCopy(
+                instance_original=self.bike,
+                model_original=self.bike_model,
+                target_parent_instance=self.target_parent,
+                name="Bike copy",
+            )
+        ]
+        with mock.patch.object(
+            Client, "parts", side_effect=self.fake_parts
+        ) as parts, mock.patch.object(
+            Client, "_create_parts_bulk", side_effect=self.fake_create_parts_bulk
+        ) as create_parts_bulk, mock.patch.object(
+            Part, "edit"
+        ):
+            (bike_copy,) = _copy_instances(
+                client=self.client, instances=instances, include_children=True
+            )
+
+        # per level 1 request for the children of the originals and 1 for the automatically created instances,
+        # except for the children of the hubs and spokes, of which the models have no children
+        self.assertEqual(4, parts.call_count)
+        self.assertIn(bike_copy, self.auto_created)
+        # both wheels are created in 1 request, as are the 5 spokes that were not created automatically
+        self.assertEqual(2, create_parts_bulk.call_count)
+        wheels, spokes = [c.kwargs["parts"] for c in create_parts_bulk.call_args_list]
+        self.assertEqual(["Wheel 0", "Wheel 1"], [p["name"] for p in wheels])
+        self.assertEqual(5, len(spokes))
+
+        mapping = get_mapping_dictionary()
+        for original in self.descendants:
+            self.assertIn(original.id, mapping)
+        hubs = [mapping[p.id] for p in self.descendants if p.name.startswith("Hub")]
+        self.assertTrue(all(hub in self.auto_created for hub in hubs))
+
+    def test_requests_do_not_depend_on_the_number_of_instances(self):
+        wheels = [p for p in self.descendants if p.name.startswith("Wheel")]
+        instances = [
+            _InstanceCopy(
+                instance_original=wheel,
+                model_original=self.wheel_model,
+                target_parent_instance=self.target_parent,
+                name=wheel.name,
+            )
+            for wheel in wheels
+        ]
+        with mock.patch.object(
+            Client, "parts", side_effect=self.fake_parts
+        ) as parts, mock.patch.object(
+            Client, "_create_parts_bulk", side_effect=self.fake_create_parts_bulk
+        ), mock.patch.object(
+            Batch, "_update_part", return_value=([], None)
+        ) as update_part:
+            _copy_instances(client=self.client, instances=instances, include_children=True)
+
+        # 1 request for the children of both wheels and 1 for the hubs and spokes created automatically
+        self.assertEqual(2, parts.call_count)
+        # the hubs and the first spoke are renamed, in the batch sent once the instances are copied
+        self.assertEqual(
+            ["Hub 0", "Hub 1", "Spoke 0"],
+            sorted(c.args[0][0]["name"] for c in update_part.call_args_list),
+        )
@@ -0,0 +1,100 @@
+import threading
+from unittest import TestCase, mock
+
+from pykechain import Client
+from pykechain.enums import Category
+from pykechain.exceptions import IllegalArgumentError
+from pykechain.extra_utils import (
+    CopySession,
+    _copy_part,
+    current_copy_session,
+    get_mapping_dictionary,
+    get_references,
+)
+from pykechain.models import Part
+from tests.utils import FAKE_URL, fake_part, uuid
+
+
+class TestCopySession(TestCase):
+    def setUp(self):
+        self.client = Client(url=FAKE_URL)
+        self.parts = [
+            Part(
+                fake_part(uuid(i), Category.MODEL, name=f"Template {i}"),
+                client=self.client,
+            )
+            for i in range(4)
+        ]
+
+    def test_session_per_thread(self):
+        sessions = dict()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def copy(key):
+            with CopySession().activate() as session:
+                get_mapping_dictionary()[key] = key
+                barrier.wait()  # both sessions are active at the same time
+                sessions[key] = (session, dict(get_mapping_dictionary()))
+
+        threads = [threading.Thread(target=copy, args=(k,)) for k in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIsNot(sessions["a"][0], sessions["b"][0])
+        self.assertEqual({"a": "a"}, sessions["a"][1])
+        self.assertEqual({"b": "b"}, sessions["b"][1])
+        self.assertNotIn("a", get_mapping_dictionary())
+
+    def test_module_session_outside_copy(self):
+        session = current_copy_session()
+        get_references(clean=True)
+
+        with CopySession().activate() as active:
+            self.assertIs(active, current_copy_session())
+            get_references()["prop"] = ["ref"]
+
+        self.assertIs(session, current_copy_session())
+        self.assertEqual(dict(), get_references())
+
+    def test_copy_part_in_own_session_and_batch(self):
+        def fake_copy(part, batch, **kwargs):
+            self.assertIsNot(session, current_copy_session())
+            self.assertIs(batch, self.client.current_batch)
+            return part
+
+        session = current_copy_session()
+        with mock.patch(
+            "pykechain.extra_utils._copy_part_in_session", side_effect=fake_copy
+        ):
+            copied = _copy_part(part=self.parts[0], target_parent=self.parts[1])
+
+        self.assertIs(self.parts[0], copied)
+        self.assertIsNone(self.client.current_batch)
+
+    def test_copy_parts_concurrently(self):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_copy(part, target_parent, **kwargs):
+            barrier.wait()  # every copy waits for the others, these must be running concurrently
+            return part.name
+
+        with mock.patch.object(
+            Part, "copy", autospec=True, side_effect=fake_copy
+        ) as copy:
+            copies = self.client.copy_parts(
+                self.parts, target_parent=self.parts[0], max_workers=4
+            )
+
+        self.assertEqual([p.name for p in self.parts], copies)
+        copy.assert_called_with(
+            self.parts[3],
+            target_parent=self.parts[0],
+            include_children=True,
+            include_instances=True,
+        )
+
+    def test_copy_parts_requires_parts(self):
+        with self.assertRaises(IllegalArgumentError):
+            self.client.copy_parts(["not a part"], target_parent=self.parts[0])
@@ -0,0 +1,133 @@
+import json
+import threading
+from unittest import TestCase
+
+import requests
+
+from pykechain import Client
+from pykechain.defaults import API_EXTRA_PARAMS
+from pykechain.enums import Category
+from pykechain.models import Part, PartSet
+from tests.utils import FAKE_URL, fake_part, uuid
+
+PARENT_ID = uuid(1000)
+MODEL_ID = uuid(2000)
+
+
+def complete_part(i):
+    """Create the json of a part with all fields that KE-chain returns on retrieval."""
+    part = fake_part(
+        uuid(i),
+        Category.INSTANCE,
+        model_id=MODEL_ID,
+        name=f"Wheel {i}",
+        parent_id=PARENT_ID,
+    )
+    for field in API_EXTRA_PARAMS["parts"]["fields"].split(","):
+        part.setdefault(field, None)
+    return part
+
+
+class TestCreatePartsBulkRetrieval(TestCase):
+    def setUp(self):
+        self.client = Client(url=FAKE_URL)
+        self.parts = [complete_part(i) for i in range(120)]
+        self.created = [p["id"] for p in self.parts]
+        self.retrieved_ids = []
+        self.barrier = None
+        self.client.add_hook(before_send=self.fake_kechain)
+
+    def fake_kechain(self, info):
+        response = requests.Response()
+        if info.resource == "parts_bulk_create":
+            response.status_code = requests.codes.created
+            content = dict(results=[dict(parts_created=self.created)])
+        else:
+            if self.barrier is not None:
+                # every retrieval waits for the others, these must be running concurrently
+                self.barrier.wait()
+            ids = info.kwargs["params"]["id__in"].split(",")
+            self.retrieved_ids.append(ids)
+            response.status_code = requests.codes.ok
+            # `id__in` does not guarantee order
+            content = dict(results=[p for p in reversed(self.parts) if p["id"] in ids])
+        response._content = json.dumps(content).encode()
+        info.response = response
+
+    def create(self, **kwargs):
+        return self.client._create_parts_bulk(
+            parts=[
+                dict(name=p["name"], parent_id=PARENT_ID, model_id=MODEL_ID, properties=[])
+                for p in self.parts
+            ],
+            **kwargs,
+        )
+
+    def test_retrieve_in_concurrent_chunks(self):
+        self.barrier = threading.Barrier(3, timeout=5)
+
+        created = self.create(chunk_size=50, max_workers=3)
+
+        self.assertIsInstance(created, PartSet)
+        self.assertEqual([50, 50, 20], sorted(map(len, self.retrieved_ids), reverse=True))
+        self.assertEqual(self.created, [p.id for p in created])
+
+    def test_retrieve_sequentially(self):
+        created = self.create(chunk_size=100, max_workers=None)
+
+        self.assertEqual([100, 20], [len(ids) for ids in self.retrieved_ids])
+        self.assertEqual(self.created, [p.id for p in created])
+
+    def test_build_from_response(self):
+        self.created = self.parts
+
+        created = self.create()
+
+        self.assertEqual([], self.retrieved_ids)
+        self.assertIsInstance(created[0], Part)
+        self.assertEqual([p["id"] for p in self.parts], [p.id for p in created])
+
+    def test_incomplete_response_is_retrieved(self):
+        self.created = [dict(id=p["id"]) for p in self.parts]
+
+        created = self.create(chunk_size=60)
+
+        self.assertEqual(2, len(self.retrieved_ids))
+        self.assertEqual("Wheel 0", created[0].name)
+
+    def test_without_retrieving_instances(self):
+        self.created = self.parts
+
+        created = self.create(retrieve_instances=False)
+
+        self.assertEqual([p["id"] for p in self.parts], created)
+        self.assertEqual([], self.retrieved_ids)
+
+
+class TestCreateFormsBulkRetrieval(TestCase):
+    def setUp(self):
+        self.client = Client(url=FAKE_URL)
+        self.forms = []
+        for i in range(3):
+            form = {
+                field: None for field in API_EXTRA_PARAMS["forms"]["fields"].split(",")
+            }
+            form.update(id=uuid(i), name=f"Form {i}")
+            self.forms.append(form)
+        self.requested = []
+        self.client.add_hook(before_send=self.fake_kechain)
+
+    def fake_kechain(self, info):
+        self.requested.append(info.resource)
+        response = requests.Response()
+        response.status_code = requests.codes.created
+        response._content = json.dumps(dict(results=self.forms)).encode()
+        info.response = response
+
+    def test_build_from_response(self):
+        created = self.client._create_forms_bulk(
+            forms=[dict(form=f["id"], values=dict(contexts=[])) for f in self.forms]
+        )
+
+        self.assertEqual(["forms_bulk_create_instances"], self.requested)
+        self.assertEqual(["Form 0", "Form 1", "Form 2"], [f.name for f in created])
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+from urllib.parse import urlparse
+
+from pykechain import Client
+from pykechain.client_utils import DiskCache
+from pykechain.defaults import API_PATH
+from pykechain.enums import WidgetTypes
+from tests.classes import FakeKechainTestCase
+from tests.utils import FAKE_URL
+
+APP_VERSIONS = [dict(app="kechain2.core.pim", label="pim", version="3.20.0")]
+WIDGET_SCHEMAS = [dict(widget_type=WidgetTypes.HTML, type="object")]
+
+
+class TestDiskCache(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache = DiskCache(directory=self.temp_dir.name)
+
+    def test_set_and_get(self):
+        self.assertIsNone(self.cache.get(FAKE_URL, "entry"))
+
+        self.cache.set(FAKE_URL, "entry", [1, 2], version="1.0")
+
+        self.assertEqual([1, 2], self.cache.get(FAKE_URL, "entry", version="1.0"))
+        self.assertIsNone(self.cache.get(FAKE_URL, "entry", version="2.0"))
+        self.assertIsNone(self.cache.get("http://other.test/", "entry", version="1.0"))
+
+    def test_expiry(self):
+        self.cache.ttl = 0.01
+        self.cache.set(FAKE_URL, "entry", [1, 2])
+
+        time.sleep(0.02)
+
+        self.assertIsNone(self.cache.get(FAKE_URL, "entry"))
+        self.assertEqual([], os.listdir(self.temp_dir.name))
+
+    def test_invalidate(self):
+        self.cache.set(FAKE_URL, "entry", [1])
+        self.cache.set("http://other.test/", "entry", [2])
+
+        self.cache.invalidate(url=FAKE_URL)
+
+        self.assertIsNone(self.cache.get(FAKE_URL, "entry"))
+        self.assertEqual([2], self.cache.get("http://other.test/", "entry"))
+
+        self.cache.invalidate()
+        self.assertEqual([], os.listdir(self.temp_dir.name))
+
+    def test_corrupt_entry(self):
+        self.cache.set(FAKE_URL, "entry", [1])
+        for filename in os.listdir(self.temp_dir.name):
+            with open(os.path.join(self.temp_dir.name, filename), "w") as f:
+                f.write("{not json")
+
+        self.assertIsNone(self.cache.get(FAKE_URL, "entry"))
+
+
+class TestClientDiskCache(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.adapter = self.mount_fake_kechain(
+            {
+                API_PATH["versions"]: APP_VERSIONS,
+                API_PATH["widgets_schemas"]: WIDGET_SCHEMAS,
+            }
+        )
+
+    def new_client(self) -> Client:
+        client = self.fake_client()
+        client.enable_disk_cache(directory=self.temp_dir.name)
+        return client
+
+    def requested_paths(self):
+        return [urlparse(r.url).path.lstrip("/") for r in self.adapter.requests]
+
+    def test_second_client_uses_cache(self):
+        first = self.new_client()
+        self.assertEqual(WIDGET_SCHEMAS[0], first.widget_schema(WidgetTypes.HTML))
+        self.assertEqual(2, len(self.adapter.requests))
+
+        second = self.new_client()
+
+        self.assertEqual(WIDGET_SCHEMAS[0], second.widget_schema(WidgetTypes.HTML))
+        # only the app versions are retrieved again
+        self.assertEqual([API_PATH["versions"]], self.requested_paths()[2:])
+
+    def test_new_backend_version(self):
+        self.new_client().widget_schemas
+        self.adapter.results_by_path[API_PATH["versions"]] = [
+            dict(APP_VERSIONS[0], version="3.21.0")
+        ]
+
+        self.new_client().widget_schemas
+
+        self.assertEqual(
+            [API_PATH["versions"], API_PATH["widgets_schemas"]],
+            self.requested_paths()[2:],
+        )
+
+    def test_invalidate(self):
+        client = self.new_client()
+        client.widget_schemas
+
+        client.invalidate_disk_cache()
+        client.widget_schemas
+
+        self.assertEqual(4, len(self.adapter.requests))
+        self.new_client().widget_schemas
+        self.assertEqual([API_PATH["versions"]], self.requested_paths()[4:])
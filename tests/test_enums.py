@@ -16,3 +16,20 @@ class TestEnums(TestCase):
         values = SecondEnum.values()
 
         self.assertIn("first slug", values)
+
+    def test_options(self):
+        self.assertEqual(
+            [("first slug", "SLUG_1"), ("second slug", "SLUG_2")], SecondEnum.options()
+        )
+        self.assertEqual([("first slug", "SLUG_1")], FirstEnum.options())
+
+    def test_values_are_copies(self):
+        SecondEnum.values().append("third slug")
+
+        self.assertEqual(["first slug", "second slug"], SecondEnum.values())
+
+    def test_has_value(self):
+        self.assertTrue(SecondEnum.has_value("first slug"))
+        self.assertFalse(FirstEnum.has_value("second slug"))
+        self.assertFalse(FirstEnum.has_value(["first slug"]))
+        self.assertFalse(Enum.has_value("first slug"))
@@ -0,0 +1,198 @@
+import io
+import json
+from unittest import TestCase, mock
+
+import requests
+
+from pykechain import Client
+from pykechain.exceptions import IllegalArgumentError, JobTimeoutError
+from pykechain.jobs import Job, wait_all
+from pykechain.models import Part, Scope
+from tests.utils import FAKE_URL, uuid
+
+SCOPE_ID = uuid(1)
+PART_IDS = [uuid(100 + i) for i in range(3)]
+
+
+def fake_response(status_code, content=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(content or dict()).encode()
+    return response
+
+
+class FakeClock:
+    """Replaces `time.monotonic` and `time.sleep`, recording the intervals slept."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestJob(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.multiple(
+            "pykechain.jobs.time",
+            monotonic=self.clock.monotonic,
+            sleep=self.clock.sleep,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def job_done_after(polls, result=None):
+        checks = iter([False] * (polls - 1) + [True])
+        return Job(description="test", check=lambda: next(checks), result=result)
+
+    def test_wait_with_backoff(self):
+        job = self.job_done_after(5, result=lambda: "done")
+
+        result = job.wait(timeout=60, interval=1, max_interval=3, backoff=2)
+
+        self.assertEqual("done", result)
+        self.assertTrue(job.done)
+        self.assertEqual(5, job.polls)
+        self.assertEqual([1, 2, 3, 3], self.clock.sleeps)
+
+    def test_poll_once_done(self):
+        job = self.job_done_after(1)
+
+        self.assertTrue(job.poll())
+        self.assertTrue(job.poll())
+        self.assertEqual(1, job.polls)
+        self.assertIsNone(job.result)
+
+    def test_timeout(self):
+        job = Job(description="never done", check=lambda: False)
+
+        with self.assertRaises(JobTimeoutError) as error:
+            job.wait(timeout=10, interval=4, backoff=1)
+
+        self.assertEqual([job], error.exception.jobs)
+        self.assertEqual([4, 4, 2], self.clock.sleeps)
+        self.assertFalse(job.done)
+
+    def test_wait_all(self):
+        jobs = [
+            self.job_done_after(polls, result=lambda p=polls: p) for polls in (3, 1, 2)
+        ]
+
+        results = wait_all(jobs, interval=1, backoff=1)
+
+        self.assertEqual([3, 1, 2], results)
+        self.assertEqual([3, 1, 2], [job.polls for job in jobs])
+        # the jobs are checked together, waiting once per round
+        self.assertEqual([1, 1], self.clock.sleeps)
+
+
+class TestAsynchronousOperations(TestCase):
+    def setUp(self):
+        self.client = Client(url=FAKE_URL)
+        self.requests = []
+        self.counts = []
+        self.client.add_hook(before_send=self.fake_kechain)
+
+    def fake_kechain(self, info):
+        self.requests.append((info.method, info.resource))
+        if info.method == "GET":
+            count = self.counts.pop(0)
+            info.response = fake_response(
+                requests.codes.ok, dict(count=count, results=[], next=None)
+            )
+        elif info.resource == "parts_bulk_create":
+            info.response = fake_response(
+                requests.codes.accepted, dict(results=[dict(parts_created=PART_IDS)])
+            )
+        elif info.resource == "scope":
+            info.response = fake_response(requests.codes.no_content)
+        else:
+            info.response = fake_response(requests.codes.accepted)
+
+    def test_delete_scope(self):
+        scope = Scope(
+            dict(id=SCOPE_ID, name="Bike project", scope_options=dict()), client=self.client
+        )
+        self.counts = [1, 0]
+
+        job = self.client.delete_scope(scope, asynchronous=True)
+
+        self.assertIsInstance(job, Job)
+        self.assertEqual([("DELETE", "scope")], self.requests)
+        self.assertFalse(job.poll())
+        self.assertTrue(job.poll())
+        self.assertTrue(job.result)
+
+    def test_delete_parts_bulk(self):
+        self.counts = [0]
+
+        job = self.client._delete_parts_bulk(parts=PART_IDS, asynchronous=True)
+
+        self.assertTrue(job.wait())
+        self.assertEqual(("GET", "parts"), self.requests[-1])
+
+    def test_create_parts_bulk_without_retrieving(self):
+        self.counts = [2, 3]
+
+        job = self.client._create_parts_bulk(
+            parts=[], asynchronous=True, retrieve_instances=False
+        )
+
+        self.assertFalse(job.poll())
+        self.assertTrue(job.poll())
+        self.assertEqual(PART_IDS, job.result)
+
+    def test_clone_scope_without_job(self):
+        source = Scope(
+            dict(id=SCOPE_ID, name="Bike project", scope_options=dict(), tags=["bike"]),
+            client=self.client,
+        )
+        posted = dict()
+
+        def fake_kechain(info):
+            self.requests.append((info.method, info.resource))
+            posted.update(info.kwargs["json"])
+            info.response = fake_response(requests.codes.accepted)
+
+        self.client.remove_hook(self.fake_kechain)
+        self.client.add_hook(before_send=fake_kechain)
+
+        self.assertIsNone(self.client.clone_scope(source, name="Bike", asynchronous=True))
+        # the clone cannot be tracked, so the data of the clone is not altered to do so
+        self.assertEqual(["bike"], posted["tags"])
+        self.assertEqual([("POST", "scopes_clone")], self.requests)
+
+    def test_import_parts(self):
+        model = Part(dict(id=PART_IDS[0], name="Wheel", category="MODEL"), client=self.client)
+        parent = Part(dict(id=PART_IDS[1], name="Bike", category="INSTANCE"), client=self.client)
+        uploaded = []
+
+        def fake_kechain(info):
+            uploaded.append(info.kwargs["files"]["attachment"])
+            info.response = fake_response(requests.codes.accepted)
+
+        self.client.remove_hook(self.fake_kechain)
+        self.client.add_hook(before_send=fake_kechain)
+
+        for file in (io.BytesIO(b"xlsx"), b"xlsx"):
+            with self.subTest(file=file):
+                self.assertIsNone(self.client.import_parts(file, model=model, parent=parent))
+                self.assertIs(file, uploaded[-1])
+
+        with self.assertRaises(IllegalArgumentError):
+            self.client.import_parts(1, model=model, parent=parent)
+
+    def test_synchronous_operations_return_results(self):
+        scope = Scope(
+            dict(id=SCOPE_ID, name="Bike project", scope_options=dict()), client=self.client
+        )
+
+        self.assertIs(True, self.client.delete_scope(scope, asynchronous=False))
+        self.assertEqual([("DELETE", "scope")], self.requests)
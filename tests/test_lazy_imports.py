@@ -0,0 +1,57 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+def imported_modules(statement: str) -> set:
+    """Return the modules imported by the statement in a fresh interpreter."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(' '.join(sys.modules))",
+        ],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return set(process.stdout.split())
+
+
+class TestLazyImports(TestCase):
+    def test_import_pykechain_does_not_import_the_client(self):
+        modules = imported_modules("import pykechain")
+
+        self.assertNotIn("pykechain.client", modules)
+        self.assertNotIn("pykechain.models", modules)
+        self.assertNotIn("requests", modules)
+
+    def test_client_does_not_import_lazy_dependencies(self):
+        modules = imported_modules("from pykechain import Client")
+
+        for module in (
+            "asyncio",
+            "jsonschema",
+            "pytz",
+            "semver",
+            "pykechain.models.widgets.widget_models",
+            "pykechain.models.widgets.widgets_manager",
+        ):
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+    def test_lazy_attributes(self):
+        import pykechain
+        from pykechain.client import Client
+        from pykechain.models import widgets
+        from pykechain.models.widgets.widget_models import PropertygridWidget
+
+        self.assertIs(pykechain.Client, Client)
+        self.assertIn("AsyncClient", dir(pykechain))
+        self.assertIs(widgets.PropertygridWidget, PropertygridWidget)
+        self.assertIn("WidgetsManager", dir(widgets))
+
+        with self.assertRaises(AttributeError):
+            pykechain.NoClient  # noqa: B018
+        with self.assertRaises(AttributeError):
+            widgets.NoWidget  # noqa: B018
@@ -0,0 +1,64 @@
+from pykechain.defaults import API_PATH
+from pykechain.exceptions import NotFoundError
+from pykechain.models import LightPart, LightProperty, Part, Property
+from tests.classes import FakeKechainTestCase
+from tests.utils import fake_part, fake_property, uuid
+
+PART_ID = uuid(1)
+
+
+class TestLightModels(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.part_json = fake_part(
+            PART_ID,
+            "INSTANCE",
+            model_id=uuid(2),
+            properties=[
+                dict(fake_property(uuid(10 + i), "INSTANCE", PART_ID), order=1 - i)
+                for i in range(2)
+            ],
+        )
+        self.part_json["created_at"] = "2025-01-01T12:00:00Z"
+        self.adapter = self.mount_fake_kechain({API_PATH["parts"]: [self.part_json]})
+
+    def test_light_parts(self):
+        parts = self.client.parts(light=True)
+
+        self.assertEqual(1, len(parts))
+        part = parts[0]
+        self.assertIsInstance(part, LightPart)
+        self.assertFalse(hasattr(part, "__dict__"))
+        self.assertEqual(PART_ID, part.id)
+        self.assertEqual("Part INSTANCE", part.name)
+        self.assertEqual(uuid(2), part.model_id)
+        self.assertEqual(2025, part.created_at.year)
+
+    def test_light_properties(self):
+        part = self.client.parts(light=True)[0]
+
+        self.assertEqual([uuid(11), uuid(10)], [p.id for p in part.properties])
+        prop = part.property(uuid(10))
+        self.assertIsInstance(prop, LightProperty)
+        self.assertEqual(PART_ID, prop.part_id)
+        with self.assertRaises(NotFoundError):
+            part.property("Unknown")
+
+    def test_read_only(self):
+        part = self.client.parts(light=True)[0]
+
+        with self.assertRaises(AttributeError):
+            part.name = "Renamed"
+        with self.assertRaises(AttributeError):
+            part.something = "else"
+
+    def test_full(self):
+        light_part = self.client.parts(light=True)[0]
+
+        part = light_part.full()
+        prop = light_part.properties[0].full()
+
+        self.assertIsInstance(part, Part)
+        self.assertEqual(light_part, part)
+        self.assertIsInstance(prop, Property)
+        self.assertEqual(prop, light_part.properties[0])
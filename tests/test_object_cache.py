@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+from pykechain.client_utils import ObjectCache
+from pykechain.defaults import API_PATH
+from pykechain.models import Part, Property, SelectListProperty
+from tests.classes import FakeKechainTestCase
+from tests.utils import fake_part, fake_property, uuid
+
+MODEL_ID = uuid(1)
+INSTANCE_ID = uuid(2)
+PROPERTY_MODEL_ID = uuid(3)
+PROPERTY_INSTANCE_ID = uuid(4)
+
+
+class TestObjectCache(FakeKechainTestCase):
+    def test_identity_class(self):
+        self.assertEqual(ObjectCache.identity_class(SelectListProperty), Property)
+        self.assertEqual(ObjectCache.identity_class(Part), Part)
+
+    def test_cache_disabled_by_default(self):
+        self.assertIsNone(self.client.object_cache)
+        Part(fake_part(MODEL_ID, "MODEL"), client=self.client)
+        self.assertIsNone(self.client._cached_object(Part, MODEL_ID))
+
+    def test_objects_are_added_on_construction(self):
+        cache = self.client.enable_object_cache()
+        part = Part(fake_part(MODEL_ID, "MODEL"), client=self.client)
+
+        self.assertIs(cache.get(Part, MODEL_ID), part)
+        self.assertIsNone(cache.get(Property, MODEL_ID))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_least_recently_used_object_is_evicted(self):
+        cache = self.client.enable_object_cache(max_size=2)
+        first = Part(fake_part(MODEL_ID, "MODEL"), client=self.client)
+        Part(fake_part(INSTANCE_ID, "INSTANCE"), client=self.client)
+
+        cache.get(Part, MODEL_ID)
+        Part(fake_part(PROPERTY_MODEL_ID, "MODEL"), client=self.client)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(Part, MODEL_ID), first)
+        self.assertIsNone(cache.get(Part, INSTANCE_ID))
+
+    def test_objects_expire(self):
+        cache = self.client.enable_object_cache(ttl=10)
+        with patch("pykechain.client_utils.time.monotonic", return_value=100.0):
+            Part(fake_part(MODEL_ID, "MODEL"), client=self.client)
+        with patch("pykechain.client_utils.time.monotonic", return_value=105.0):
+            self.assertIsNotNone(cache.get(Part, MODEL_ID))
+        with patch("pykechain.client_utils.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get(Part, MODEL_ID))
+        self.assertEqual(len(cache), 0)
+
+
+class TestObjectCacheAccessors(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.adapter = self.mount_fake_kechain(
+            {
+                API_PATH["parts"]: [
+                    fake_part(
+                        MODEL_ID,
+                        "MODEL",
+                        properties=[
+                            fake_property(PROPERTY_MODEL_ID, "MODEL", MODEL_ID)
+                        ],
+                    ),
+                    fake_part(
+                        INSTANCE_ID,
+                        "INSTANCE",
+                        model_id=MODEL_ID,
+                        properties=[
+                            fake_property(
+                                PROPERTY_INSTANCE_ID,
+                                "INSTANCE",
+                                INSTANCE_ID,
+                                model_id=PROPERTY_MODEL_ID,
+                            )
+                        ],
+                    ),
+                ]
+            }
+        )
+        self.client.enable_object_cache()
+
+    def test_lazy_accessors_use_the_cache(self):
+        model, instance = self.client.parts(category=None)
+        self.assertEqual(len(self.adapter.requests), 1)
+
+        prop = instance.property("Property INSTANCE")
+        self.assertIs(instance.model(), model)
+        self.assertIs(prop.model(), model.properties[0])
+        self.assertIs(prop.part, instance)
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_refreshed_object_remains_cached(self):
+        self.adapter.results_by_path[API_PATH["part"].format(part_id=MODEL_ID)] = [
+            fake_part(MODEL_ID, "MODEL", name="Renamed")
+        ]
+        model, _ = self.client.parts(category=None)
+
+        model.refresh()
+
+        self.assertEqual("Renamed", model.name)
+        self.assertIs(self.client.object_cache.get(Part, MODEL_ID), model)
+
+    def test_deleted_objects_are_removed(self):
+        model, instance = self.client.parts(category=None)
+        prop = instance.properties[0]
+
+        prop.delete()
+        self.assertIsNone(self.client.object_cache.get(Property, PROPERTY_INSTANCE_ID))
+
+        model.delete()
+        self.assertIsNone(self.client.object_cache.get(Part, MODEL_ID))
+        self.assertIsNone(self.client.object_cache.get(Property, PROPERTY_MODEL_ID))
+        self.assertIs(self.client.object_cache.get(Part, INSTANCE_ID), instance)
+
+    def test_disable_cache(self):
+        self.adapter.results_by_path[
+            API_PATH["property"].format(property_id=PROPERTY_MODEL_ID)
+        ] = [fake_property(PROPERTY_MODEL_ID, "MODEL", MODEL_ID)]
+        self.client.disable_object_cache()
+        model, instance = self.client.parts(category=None)
+
+        instance.property("Property INSTANCE").model()
+        self.assertEqual(len(self.adapter.requests), 2)
@@ -0,0 +1,159 @@
+import time
+
+from requests.adapters import DEFAULT_POOLSIZE
+
+from pykechain.defaults import API_PATH
+from pykechain.exceptions import MultipleFoundError
+from pykechain.models import Activity, PartSet, Property
+from pykechain.models.context import Context
+from tests.classes import FakeKechainTestCase
+from tests.utils import fake_part, uuid
+
+
+def fake_parts(number_of_parts):
+    return [
+        fake_part(uuid(i), "INSTANCE", name=f"Part {i}")
+        for i in range(number_of_parts)
+    ]
+
+
+def fake_objects(number_of_objects, **kwargs):
+    return [
+        dict(id=uuid(i), name=f"Object {i}", **kwargs)
+        for i in range(number_of_objects)
+    ]
+
+
+class TestPaginationOffline(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.parts = fake_parts(250)
+        self.activities = fake_objects(120)
+        self.properties = fake_objects(120, property_type="CHAR_VALUE")
+        self.adapter = self.mount_fake_kechain(
+            {
+                API_PATH["parts"]: self.parts,
+                API_PATH["activities"]: self.activities,
+                API_PATH["properties"]: self.properties,
+            }
+        )
+
+    def test_parts_follows_next_links(self):
+        parts = self.client.parts(batch=100)
+
+        self.assertIsInstance(parts, PartSet)
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.parts])
+
+    def test_parts_with_concurrent_pages(self):
+        parts = self.client.parts(batch=30, max_workers=4)
+
+        self.assertIsInstance(parts, PartSet)
+        self.assertEqual(len(self.adapter.requests), 9)
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.parts])
+
+    def test_parts_with_concurrent_pages_respects_limit(self):
+        parts = self.client.parts(limit=120, batch=50, max_workers=4)
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual([p.id for p in parts], [p["id"] for p in self.parts[:120]])
+
+    def test_concurrent_pages_grow_the_connection_pool(self):
+        http_adapter = self.client.session.get_adapter("https://kechain.test/")
+        self.assertEqual(DEFAULT_POOLSIZE, http_adapter._pool_maxsize)
+
+        self.client.parts(batch=10, max_workers=DEFAULT_POOLSIZE + 5)
+
+        self.assertEqual(DEFAULT_POOLSIZE + 5, http_adapter._pool_maxsize)
+
+    def test_parts_single_page(self):
+        parts = self.client.parts(batch=300, max_workers=4)
+
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertEqual(len(parts), 250)
+
+    def test_iter_parts_retrieves_batches_lazily(self):
+        parts = self.client.iter_parts(batch=100)
+
+        self.assertEqual(len(self.adapter.requests), 0)
+        first_part = next(parts)
+        self.assertEqual(first_part.id, self.parts[0]["id"])
+        self.assertEqual(len(self.adapter.requests), 1)
+
+        remaining_parts = list(parts)
+        self.assertEqual(len(remaining_parts), 249)
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_iter_parts_with_concurrent_pages_retrieves_pages_ahead(self):
+        parts = self.client.iter_parts(batch=10, max_workers=3)
+
+        for _ in range(11):
+            next(parts)
+        time.sleep(0.1)
+
+        # the first two pages and at most 3 pages ahead of these, instead of all 25 pages
+        self.assertLessEqual(len(self.adapter.requests), 2 + 3)
+        self.assertEqual(239, len(list(parts)))
+        self.assertEqual(25, len(self.adapter.requests))
+
+    def test_iter_activities(self):
+        activities = list(self.client.iter_activities(batch=50))
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertTrue(all(isinstance(a, Activity) for a in activities))
+        self.assertEqual([a.id for a in activities], [a["id"] for a in self.activities])
+
+    def test_iter_properties(self):
+        properties = list(self.client.iter_properties(batch=50, limit=60))
+
+        self.assertEqual(len(self.adapter.requests), 2)
+        self.assertTrue(all(isinstance(p, Property) for p in properties))
+        self.assertEqual(len(properties), 60)
+
+
+class TestPaginationOfListEndpointsOffline(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = [
+            dict(pk=i, username=f"user_{i}", name=f"User {i}") for i in range(45)
+        ]
+        self.contexts = fake_objects(45, context_type="STATIC_LOCATION")
+        self.adapter = self.mount_fake_kechain(
+            {
+                API_PATH["users"]: self.users,
+                API_PATH["contexts"]: self.contexts,
+                API_PATH["activities"]: fake_objects(45),
+            },
+            page_size=20,
+        )
+
+    def test_users_follows_next_links(self):
+        users = self.client.users()
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual([u.id for u in users], [u["pk"] for u in self.users])
+
+    def test_users_with_batch_and_limit(self):
+        users = self.client.users(batch=10, limit=25)
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual([u.id for u in users], [u["pk"] for u in self.users[:25]])
+
+    def test_activities_with_concurrent_pages(self):
+        activities = self.client.activities(max_workers=3)
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual(len(activities), 45)
+
+    def test_crud_list_follows_next_links(self):
+        contexts = Context.list(client=self.client)
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual([c.id for c in contexts], [c["id"] for c in self.contexts])
+
+    def test_retrieve_singular_limits_request(self):
+        with self.assertRaises(MultipleFoundError):
+            self.client.user()
+
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertIn("limit=2", self.adapter.requests[0].url)
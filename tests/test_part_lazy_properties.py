@@ -0,0 +1,71 @@
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from pykechain.defaults import API_PATH
+from pykechain.models import Part, Property
+from tests.classes import FakeKechainTestCase
+from tests.utils import fake_part, fake_property, uuid
+
+PART_ID = uuid(1)
+
+
+class TestPartLazyProperties(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.properties = [
+            dict(fake_property(uuid(10 + i), "INSTANCE", PART_ID), order=3 - i)
+            for i in range(3)
+        ]
+        self.part_json = fake_part(PART_ID, "INSTANCE", properties=self.properties)
+        self.adapter = self.mount_fake_kechain(
+            {
+                API_PATH["parts"]: [self.part_json],
+                API_PATH["part"].format(part_id=PART_ID): [self.part_json],
+            }
+        )
+
+    def test_properties_created_on_first_access(self):
+        with patch.object(Property, "create", wraps=Property.create) as create:
+            part = Part(self.part_json, client=self.client)
+            self.assertEqual(0, create.call_count)
+
+            properties = part.properties
+            self.assertEqual(3, create.call_count)
+
+            part.property(uuid(11))
+            self.assertEqual(3, create.call_count)
+
+        self.assertIs(properties, part.properties)
+        self.assertEqual(
+            [uuid(12), uuid(11), uuid(10)], [p.id for p in part.properties]
+        )
+
+    def test_refresh_keeps_property_objects(self):
+        part = Part(self.part_json, client=self.client)
+        prop = part.properties[0]
+
+        part.refresh(json=self.part_json)
+
+        self.assertIs(prop, part.properties[0])
+
+    def test_parts_without_properties(self):
+        self.adapter.results_by_path[API_PATH["parts"]] = [
+            {k: v for k, v in self.part_json.items() if k != "properties"}
+        ]
+
+        part = self.client.parts(include_properties=False)[0]
+
+        query = parse_qs(urlparse(self.adapter.requests[0].url).query)
+        self.assertNotIn("properties", query["fields"][0].split(","))
+        self.assertEqual(1, len(self.adapter.requests))
+
+        # the properties are retrieved when they are needed
+        self.assertEqual(3, len(part.properties))
+        self.assertEqual(2, len(self.adapter.requests))
+        self.assertEqual(PART_ID, part.id)
+
+    def test_parts_with_properties(self):
+        self.client.parts()
+
+        query = parse_qs(urlparse(self.adapter.requests[0].url).query)
+        self.assertIn("properties", query["fields"][0].split(","))
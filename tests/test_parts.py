@@ -113,10 +113,14 @@ class TestParts(TestBetamax):
     def test_part_set_get_item_invalid(self):
         part_set = self.project.parts()
 
-        with self.assertRaises(NotImplementedError):
+        with self.assertRaises(NotFoundError):
             # noinspection PyStatementEffect
             part_set["testing"]
 
+        with self.assertRaises(NotImplementedError):
+            # noinspection PyStatementEffect
+            part_set[1.5]
+
     def test_wrongly_create_model(self):
         # setUp
         bike_model = self.project.model(name="Bike")
@@ -0,0 +1,118 @@
+import gc
+import json
+import weakref
+from copy import deepcopy
+
+from pykechain import Client
+from pykechain.defaults import API_PATH
+from pykechain.exceptions import APIError, BulkUpdateError
+from pykechain.models import Property
+from tests.classes import FakeKechainTestCase
+from tests.utils import FAKE_URL, fake_property, uuid
+
+
+class TestPropertiesBulkUpdateOffline(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.properties_json = [
+            fake_property(uuid(i), "INSTANCE", None, name=f"Property {i}", value=None)
+            for i in range(25)
+        ]
+        self.adapter = self.mount_fake_kechain(
+            {API_PATH["properties"]: self.properties_json}
+        )
+        self.properties = [
+            Property.create(json=dict(js), client=self.client)
+            for js in self.properties_json
+        ]
+        Property.set_bulk_update(True)
+        for i, prop in enumerate(self.properties):
+            prop.value = f"value {i}"
+
+    def tearDown(self):
+        Property.set_bulk_update(False)
+
+    def test_update_values_in_chunks(self):
+        Property.update_values(client=self.client, chunk_size=10)
+
+        self.assertEqual(3, len(self.adapter.requests))
+        self.assertIsNone(self.client._update_batch)
+        self.assertFalse(Property._USE_BULK_UPDATE)
+
+    def test_update_values_concurrently(self):
+        Property.update_values(client=self.client, chunk_size=5, max_workers=3)
+
+        self.assertEqual(5, len(self.adapter.requests))
+        self.assertIsNone(self.client._update_batch)
+
+    def test_update_values_merges_updated_properties(self):
+        self.properties_json[3]["description"] = "Updated in KE-chain"
+
+        Property.update_values(client=self.client, chunk_size=10)
+
+        prop = self.properties[3]
+        self.assertEqual("value 3", prop.value)
+        self.assertEqual("value 3", prop._json_data["value"])
+        self.assertEqual("Updated in KE-chain", prop.description)
+
+    def test_update_values_reports_failed_chunks(self):
+        failing_id = self.properties[12].id
+        self.adapter.failing_ids.add(failing_id)
+
+        with self.assertRaises(BulkUpdateError) as cm:
+            Property.update_values(client=self.client, chunk_size=10)
+
+        self.assertIsInstance(cm.exception, APIError)
+        failed_ids = [p.id for p in self.properties[10:20]]
+        self.assertEqual(failed_ids, list(cm.exception.failed))
+        self.assertIn(failing_id, str(cm.exception))
+        # the failed values remain pending, the others are merged
+        self.assertEqual(set(failed_ids), set(self.client._update_batch.properties))
+        self.assertEqual("value 0", self.properties[0]._json_data["value"])
+        self.assertIsNone(self.properties[12]._json_data["value"])
+        self.assertTrue(Property._USE_BULK_UPDATE)
+
+        # the failed values can be sent again
+        self.adapter.failing_ids.clear()
+        Property.update_values(client=self.client)
+
+        self.assertIsNone(self.client._update_batch)
+        self.assertEqual("value 12", self.properties[12]._json_data["value"])
+
+    def test_values_are_stored_per_client(self):
+        other_client = self.fake_client()
+        other_property = Property.create(
+            json=dict(self.properties_json[0]), client=other_client
+        )
+        other_property.value = "other value"
+
+        Property.update_values(client=self.client, use_bulk_update=True)
+
+        self.assertEqual(1, len(self.adapter.requests))
+        self.assertEqual(25, len(json.loads(self.adapter.requests[0].body)))
+        self.assertEqual(1, len(other_client._update_batch))
+
+        Property.update_values(client=other_client)
+
+        self.assertIsNone(other_client._update_batch)
+        self.assertEqual("other value", other_property._json_data["value"])
+
+    def test_client_is_not_kept_alive(self):
+        other_client = self.fake_client()
+        prop = Property.create(json=dict(self.properties_json[0]), client=other_client)
+        prop.value = "other value"
+        reference = weakref.ref(other_client)
+
+        del other_client, prop
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_client_with_stored_values_can_be_copied(self):
+        # without the fake adapter, which cannot be copied
+        client = Client(url=FAKE_URL)
+        Property.create(json=dict(self.properties_json[0]), client=client).value = "copied"
+
+        copied_client = deepcopy(client)
+
+        self.assertEqual(1, len(copied_client._update_batch))
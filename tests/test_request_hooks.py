@@ -0,0 +1,120 @@
+from unittest import TestCase, mock
+
+import requests
+
+from pykechain.client_utils import RequestInfo, api_resource
+from pykechain.defaults import API_PATH
+from pykechain.exceptions import NotFoundError
+from tests.classes import FakeKechainTestCase
+from tests.utils import FAKE_URL, uuid
+
+
+class TestApiResource(TestCase):
+    def test_resources(self):
+        for url, resource in (
+            (f"{FAKE_URL}api/v3/parts.json?limit=10", "parts"),
+            (f"{FAKE_URL}api/activities/some-id.json", "activity"),
+            (f"{FAKE_URL}api/activities/some-id/export", "activity_export"),
+            (f"{FAKE_URL}api/activities/bulk_clone", "activities_bulk_clone"),
+            (
+                f"{FAKE_URL}api/v3/parts/bulk_create_part_instances",
+                "parts_bulk_create",
+            ),
+            (f"{FAKE_URL}api/unknown", None),
+            ("http://other.kechain.test/prefix/api/v3/parts.json", None),
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(resource, api_resource(FAKE_URL, url))
+
+    def test_resource_with_path_in_api_root(self):
+        self.assertEqual(
+            "parts",
+            api_resource(
+                "http://fake.kechain.test/prefix/",
+                "http://fake.kechain.test/prefix/api/v3/parts.json",
+            ),
+        )
+
+
+class TestRequestHooks(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.parts = [dict(id=uuid(i), name=f"Part {i}") for i in range(25)]
+        self.adapter = self.mount_fake_kechain({API_PATH["parts"]: self.parts})
+
+    def test_no_hooks(self):
+        self.client.parts(batch=10)
+
+        self.assertEqual(3, len(self.adapter.requests))
+        self.assertIsNotNone(self.client.last_response)
+
+    def test_hooks_receive_request_info(self):
+        before, after = [], []
+        self.client.add_hook(before_send=before.append, after_receive=after.append)
+
+        self.client.parts(batch=10)
+
+        self.assertEqual(3, len(before))
+        self.assertEqual(3, len(after))
+        info = after[0]
+        self.assertIsInstance(info, RequestInfo)
+        self.assertIs(info, before[0])
+        self.assertEqual("GET", info.method)
+        self.assertEqual("parts", info.resource)
+        self.assertEqual(requests.codes.ok, info.status_code)
+        self.assertGreaterEqual(info.duration, 0)
+        self.assertEqual(0, info.request_size)
+        self.assertEqual(len(info.response.content), info.response_size)
+        self.assertIsNone(info.exception)
+
+    def test_before_send_alters_request(self):
+        def tag(info):
+            info.headers["X-Request-Tag"] = "test"
+
+        self.client.add_hook(before_send=tag)
+
+        self.client.parts()
+
+        self.assertEqual("test", self.adapter.requests[0].headers["X-Request-Tag"])
+        self.assertNotIn("X-Request-Tag", self.client.headers)
+
+    def test_before_send_provides_response(self):
+        cached = dict()
+
+        def from_cache(info):
+            info.response = cached.get(info.url)
+
+        def to_cache(info):
+            cached[info.url] = info.response
+
+        self.client.add_hook(before_send=from_cache, after_receive=to_cache)
+
+        first = self.client.parts()
+        second = self.client.parts()
+
+        self.assertEqual(1, len(self.adapter.requests))
+        self.assertEqual([p.id for p in first], [p.id for p in second])
+
+    def test_after_receive_on_failure(self):
+        after = []
+        self.client.add_hook(after_receive=after.append)
+        self.adapter.send = mock.Mock(side_effect=requests.ConnectionError)
+
+        with self.assertRaises(requests.RequestException):
+            self.client.parts()
+
+        self.assertEqual(1, len(after))
+        self.assertIsNone(after[0].response)
+        self.assertIsNone(after[0].status_code)
+        self.assertIsInstance(after[0].exception, requests.RequestException)
+
+    def test_remove_hook(self):
+        after = []
+        self.client.add_hook(after_receive=after.append)
+        self.client.remove_hook(after.append)
+
+        self.client.parts()
+
+        self.assertFalse(after)
+        with self.assertRaises(NotFoundError):
+            self.client.remove_hook(after.append)
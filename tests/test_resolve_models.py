@@ -0,0 +1,71 @@
+from pykechain.defaults import API_PATH
+from pykechain.exceptions import IllegalArgumentError
+from pykechain.models import Part, Property
+from tests.classes import FakeKechainTestCase
+from tests.utils import fake_part, fake_property, uuid
+
+
+class TestResolveModels(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.models = [
+            fake_part(
+                uuid(i),
+                "MODEL",
+                properties=[fake_property(uuid(100 + i), "MODEL", uuid(i))],
+            )
+            for i in range(3)
+        ]
+        self.loose_property_model = fake_property(uuid(200), "MODEL", uuid(201))
+        self.adapter = self.mount_fake_kechain(
+            {
+                API_PATH["parts"]: self.models,
+                API_PATH["properties"]: [self.loose_property_model],
+            }
+        )
+
+        self.instances = [
+            Part(
+                fake_part(
+                    uuid(10 + i),
+                    "INSTANCE",
+                    model_id=uuid(i % 3),
+                    properties=[
+                        fake_property(
+                            uuid(20 + i), "INSTANCE", uuid(10 + i), uuid(100 + i % 3)
+                        )
+                    ],
+                ),
+                client=self.client,
+            )
+            for i in range(6)
+        ]
+        self.loose_property = Property.create(
+            fake_property(uuid(300), "INSTANCE", uuid(301), uuid(200)),
+            client=self.client,
+        )
+
+    def test_resolve_models(self):
+        properties = [p for part in self.instances for p in part.properties]
+
+        self.client.resolve_models(
+            self.instances + properties + [self.loose_property], chunk_size=2
+        )
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        for i, part in enumerate(self.instances):
+            self.assertEqual(part.model().id, uuid(i % 3))
+            self.assertEqual(part.properties[0].model().id, uuid(100 + i % 3))
+            self.assertIs(part.properties[0].model(), part.model().properties[0])
+        self.assertEqual(self.loose_property.model().id, uuid(200))
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_resolve_models_skips_models_and_resolved_instances(self):
+        self.client.resolve_models(self.instances)
+        self.client.resolve_models(self.instances)
+
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_resolve_models_wrong_input(self):
+        with self.assertRaises(IllegalArgumentError):
+            self.client.resolve_models(["not a part"])
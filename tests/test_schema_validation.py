@@ -0,0 +1,83 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from jsonschema import SchemaError, ValidationError
+
+from pykechain import Client
+from pykechain.defaults import SCHEMA_VALIDATORS_CACHE_SIZE
+from pykechain.enums import WidgetTypes
+from pykechain.models.input_checks import (
+    _schema_validators,
+    schema_validator,
+    validate_json,
+)
+from pykechain.models.widgets import Widget
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}},
+    "required": ["title"],
+}
+
+
+class TestSchemaValidator(TestCase):
+    def test_validator_is_cached(self):
+        self.assertIs(schema_validator(SCHEMA), schema_validator(SCHEMA))
+        self.assertIsNot(schema_validator(SCHEMA), schema_validator(dict(SCHEMA)))
+
+    def test_validator_cache_is_bounded(self):
+        schemas = [dict(SCHEMA) for _ in range(SCHEMA_VALIDATORS_CACHE_SIZE + 10)]
+        for schema in schemas:
+            schema_validator(schema)
+
+        self.assertEqual(SCHEMA_VALIDATORS_CACHE_SIZE, len(_schema_validators))
+        self.assertIs(schemas[-1], _schema_validators[id(schemas[-1])][0])
+
+    def test_validate_json(self):
+        self.assertIsNone(validate_json(dict(title="Title"), SCHEMA))
+
+        with self.assertRaises(ValidationError):
+            validate_json(dict(title=1), SCHEMA)
+        with self.assertRaises(ValidationError):
+            validate_json(dict(), validator=schema_validator(SCHEMA))
+
+    def test_invalid_schema(self):
+        with self.assertRaises(SchemaError):
+            validate_json(dict(), {"type": 12})
+
+
+class TestWidgetValidator(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.client._app_versions = [
+            dict(app="kechain2.core.pim", label="pim", version="3.20.0")
+        ]
+        self.client._widget_schemas = [dict(SCHEMA, widget_type=WidgetTypes.HTML)]
+        self.widget_json = dict(
+            id="00000000-0000-0000-0000-000000000001",
+            widget_type=WidgetTypes.HTML,
+            meta=dict(title="Title"),
+        )
+
+    def test_widget_validator_cached_per_type(self):
+        validator = self.client.widget_validator(WidgetTypes.HTML)
+
+        self.assertIs(validator, self.client.widget_validator(WidgetTypes.HTML))
+
+    def test_widget_meta_is_validated(self):
+        widget = Widget.create(self.widget_json, client=self.client)
+        self.assertEqual(dict(title="Title"), widget.meta)
+
+        with self.assertRaises(ValidationError):
+            Widget.create(dict(self.widget_json, meta=dict()), client=self.client)
+
+    def test_skip_widget_meta_validation(self):
+        self.client.validate_widget_meta = False
+
+        with patch.object(Widget, "validate_meta") as validate_meta:
+            widget = Widget.create(
+                dict(self.widget_json, meta=dict()), client=self.client
+            )
+
+        validate_meta.assert_not_called()
+        self.assertEqual(dict(), widget.meta)
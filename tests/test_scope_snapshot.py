@@ -0,0 +1,112 @@
+from pykechain.defaults import API_PATH
+from pykechain.enums import Category
+from pykechain.exceptions import MultipleFoundError, NotFoundError
+from pykechain.models import Scope, ScopeSnapshot
+from tests.classes import FakeKechainTestCase
+from tests.utils import fake_part, fake_property, uuid
+
+SCOPE_ID = uuid(0)
+
+
+def snapshot_part(i, name, category, parent=None, model=None, properties=()):
+    return fake_part(
+        uuid(i),
+        category,
+        model_id=model["id"] if model else None,
+        properties=[
+            fake_property(
+                uuid(100 + 10 * i + j),
+                category,
+                uuid(i),
+                model_id=uuid(100 + 10 * model_index + j) if model_index else None,
+                name=prop_name,
+                value=None,
+                order=j,
+            )
+            for j, (prop_name, model_index) in enumerate(properties)
+        ],
+        name=name,
+        ref=name.lower(),
+        parent_id=parent["id"] if parent else None,
+        scope_id=SCOPE_ID,
+    )
+
+
+class TestScopeSnapshotOffline(FakeKechainTestCase):
+    def setUp(self):
+        super().setUp()
+        bike_model = snapshot_part(1, "Bike", Category.MODEL)
+        wheel_model = snapshot_part(
+            2, "Wheel", Category.MODEL, bike_model, properties=[("Diameter", None)]
+        )
+        bike = snapshot_part(3, "Bike", Category.INSTANCE, model=bike_model)
+        wheels = [
+            snapshot_part(
+                i,
+                "Wheel",
+                Category.INSTANCE,
+                bike,
+                wheel_model,
+                properties=[("Diameter", 2)],
+            )
+            for i in (4, 5)
+        ]
+        self.adapter = self.mount_fake_kechain(
+            {API_PATH["parts"]: [bike_model, wheel_model, bike] + wheels}
+        )
+        scope = Scope(
+            dict(id=SCOPE_ID, name="Project", scope_options=dict()), client=self.client
+        )
+
+        self.snapshot = scope.snapshot()
+        self.number_of_requests = len(self.adapter.requests)
+
+    def tearDown(self):
+        self.assertEqual(self.number_of_requests, len(self.adapter.requests))
+
+    def test_snapshot(self):
+        self.assertIsInstance(self.snapshot, ScopeSnapshot)
+        self.assertEqual(1, self.number_of_requests)
+        self.assertEqual(5, len(self.snapshot))
+
+    def test_lookup_parts(self):
+        bike = self.snapshot.part("Bike")
+        self.assertEqual(Category.INSTANCE, bike.category)
+        self.assertIs(bike, self.snapshot.part(pk=bike.id))
+        self.assertIs(bike, self.snapshot.part(ref="bike"))
+        self.assertIn(bike, self.snapshot)
+
+        bike_model = self.snapshot.model("Bike")
+        self.assertEqual(Category.MODEL, bike_model.category)
+        self.assertEqual(2, len(self.snapshot.parts(name="Bike", category=None)))
+
+        with self.assertRaises(MultipleFoundError):
+            self.snapshot.part("Wheel")
+        with self.assertRaises(NotFoundError):
+            self.snapshot.part("Frame")
+        with self.assertRaises(NotFoundError):
+            self.snapshot.model(pk=bike.id)
+
+    def test_graph(self):
+        bike = self.snapshot.part("Bike")
+        wheel_model = self.snapshot.model("Wheel")
+        wheels = self.snapshot.children(bike)
+
+        self.assertEqual(2, len(wheels))
+        self.assertEqual(wheels, self.snapshot.instances(wheel_model))
+        self.assertEqual(wheels, bike.children())
+        self.assertIs(bike, wheels[0].parent())
+        self.assertIs(wheel_model, wheels[0].model())
+        self.assertEqual(
+            [wheel_model], self.snapshot.children(self.snapshot.model("Bike"))
+        )
+
+    def test_properties(self):
+        diameter_model = self.snapshot.model("Wheel").property("Diameter")
+        diameters = self.snapshot.property_instances(diameter_model)
+
+        self.assertEqual(2, len(diameters))
+        self.assertIs(diameters[0], self.snapshot.property(diameters[0].id))
+        self.assertIs(diameter_model, diameters[0].model())
+        with self.assertRaises(NotFoundError):
+            self.snapshot.property(SCOPE_ID)
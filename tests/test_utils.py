@@ -1,14 +1,25 @@
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest import TestCase
 
+import pytz
+
+from pykechain.exceptions import MultipleFoundError, NotFoundError
+from pykechain.models import Part, PartSet
 from pykechain.utils import (
     Empty,
+    IndexedList,
+    find_obj_in_list,
     get_in_chunks,
     get_offset_from_user_timezone,
     get_timezone_from_user,
     is_url,
-    is_valid_email
+    is_valid_email,
+    parse_datetime,
 )
 from tests.classes import TestBetamax
+from tests.utils import uuid
 
 
 class TestIsURL(TestCase):
@@ -193,6 +204,115 @@ class TestChunks(TestCase):
         self.assertEqual(9, len(chunks_list))
 
 
+class TestIndexedList(TestCase):
+    def setUp(self):
+        self.objects = [
+            SimpleNamespace(id=uuid(i), name=name, ref=name.lower())
+            for i, name in enumerate(["Wheel", "Frame", "wheel"])
+        ]
+        self.indexed = IndexedList(self.objects)
+
+    def test_lookup(self):
+        self.assertEqual(self.objects, self.indexed)
+        self.assertEqual([self.objects[1]], self.indexed.lookup(self.objects[1].id))
+        self.assertEqual(
+            [self.objects[0], self.objects[2]],
+            self.indexed.lookup("wheel", attributes=("name",), lower=True),
+        )
+        self.assertEqual(
+            [self.objects[0], self.objects[2]],
+            self.indexed.lookup("wheel", attributes=("name", "ref")),
+        )
+        self.assertEqual([self.objects[0]], self.indexed.lookup("Wheel", ("name",)))
+        self.assertEqual([], self.indexed.lookup("Fork", attributes=("name",)))
+
+    def test_mutations_discard_index(self):
+        self.indexed.lookup("Frame", attributes=("name",))
+        fork = SimpleNamespace(id=None, name="Fork", ref="fork")
+
+        self.indexed.append(fork)
+        self.assertEqual([fork], self.indexed.lookup("Fork", attributes=("name",)))
+        self.indexed.remove(fork)
+        self.assertEqual([], self.indexed.lookup("Fork", attributes=("name",)))
+        self.indexed[0] = fork
+        self.assertEqual([fork], self.indexed.lookup("Fork", attributes=("name",)))
+        del self.indexed[0]
+        self.assertEqual([], self.indexed.lookup("Fork", attributes=("name",)))
+        self.indexed += [fork]
+        self.assertIsInstance(self.indexed, IndexedList)
+        self.assertEqual([fork], self.indexed.lookup("Fork", attributes=("name",)))
+
+    def test_renamed_objects(self):
+        self.indexed.lookup("Frame", attributes=("name",))
+        self.objects[1].name = "Fork"
+
+        self.assertEqual([], self.indexed.lookup("Frame", attributes=("name",)))
+        self.assertIs(self.objects[1], find_obj_in_list("Fork", self.indexed))
+
+    def test_copy(self):
+        self.indexed.lookup("Frame", attributes=("name",))
+        copied = deepcopy(self.indexed)
+
+        self.assertIsInstance(copied, IndexedList)
+        self.assertIsNot(self.objects[1], copied.lookup("Frame", ("name",))[0])
+
+    def test_find_obj_in_list(self):
+        for objects in (self.objects, self.indexed):
+            with self.subTest(type(objects)):
+                self.assertIs(objects[1], find_obj_in_list("frame", objects))
+                self.assertIs(objects[1], find_obj_in_list(objects[1].id, objects))
+                with self.assertRaises(MultipleFoundError):
+                    find_obj_in_list("WHEEL", objects)
+                with self.assertRaises(NotFoundError):
+                    find_obj_in_list("Fork", objects)
+
+    def test_partset(self):
+        parts = PartSet(
+            Part(dict(id=o.id, name=o.name, ref=o.ref), client=None)
+            for o in self.objects[:2]
+        )
+
+        self.assertEqual("Frame", parts[1].name)
+        self.assertEqual("Frame", parts["Frame"].name)
+        self.assertEqual("Frame", parts["frame"].name)
+        self.assertEqual("Frame", parts[self.objects[1].id].name)
+        with self.assertRaises(NotFoundError):
+            parts["Fork"]
+
+
+class TestParseDatetime(TestCase):
+    def test_zulu(self):
+        dt = parse_datetime("2020-01-02T12:30:15.123Z")
+
+        self.assertEqual(datetime(2020, 1, 2, 12, 30, 15, 123000, tzinfo=pytz.UTC), dt)
+        self.assertIs(pytz.UTC, dt.tzinfo)
+
+    def test_offset(self):
+        for value, minutes in [
+            ("2020-01-02T12:30:15+05:30", 330),
+            ("2020-01-02T12:30:15-0130", -90),
+            ("2020-01-02T12:30+02", 120),
+        ]:
+            with self.subTest(value):
+                dt = parse_datetime(value)
+
+                self.assertEqual(timedelta(minutes=minutes), dt.utcoffset())
+                self.assertIsInstance(dt.tzinfo, timezone)
+        self.assertIs(
+            parse_datetime("2020-01-02T12:30+05:30").tzinfo,
+            parse_datetime("2021-01-02T12:30+05:30").tzinfo,
+        )
+
+    def test_naive_and_short(self):
+        self.assertEqual(datetime(2020, 1, 2, 3, 4), parse_datetime("2020-01-02 03:04"))
+        self.assertEqual(datetime(2020, 1, 2, 3, 4, 5), parse_datetime("2020-1-2T3:4:5"))
+
+    def test_invalid(self):
+        for value in [None, "2020-01-02", "garbage", "2020-01-02T12:30:15Zx"]:
+            with self.subTest(value):
+                self.assertIsNone(parse_datetime(value))
+
+
 class TestTimezoneHelperFunctions(TestBetamax):
     def setUp(self):
         super().setUp()
@@ -1,8 +1,11 @@
 from io import BytesIO
+from typing import Dict, List, Optional
 
 from PIL import Image
 from envparse import Env
 
+from pykechain.enums import ActivityClassification, ActivityType, PropertyType
+
 # reads a local .env file with the TEST_TOKEN=<user token>
 # ensure that this file is not commited to github (never ever)
 env = Env()
@@ -15,6 +18,9 @@ TEST_SCOPE_ID = env("TEST_SCOPE_ID", default="bd5dceaa-a35e-47b0-9fc5-875410f4a5
 TEST_SCOPE_NAME = env("TEST_SCOPE_NAME", default="Bike Project")
 TEST_RECORD_CASSETTES = env.bool("TEST_RECORD_CASSETTES", default=True)
 
+# url of the stand-in KE-chain of the offline tests, see `FakeKechainTestCase`
+FAKE_URL = "http://fake.kechain.test/"
+
 
 def create_test_image_file() -> BytesIO:
     """Create an Image file in memory for testing handling upload of Images."""
@@ -22,3 +28,58 @@ def create_test_image_file() -> BytesIO:
     Image.new("RGB", (50, 50), color="red").save(image_io, format="jpeg")
     image_io.seek(0)
     return image_io
+
+
+def uuid(number: int) -> str:
+    """Create a predictable uuid from a number, for offline testing."""
+    return f"00000000-0000-0000-0000-{number:012d}"
+
+
+def fake_part(
+    pk: str,
+    category: str,
+    model_id: Optional[str] = None,
+    properties: Optional[List[Dict]] = None,
+    **kwargs,
+) -> Dict:
+    """Create the json of a part, as provided by KE-chain, for offline testing."""
+    return dict(
+        dict(
+            id=pk,
+            name=f"Part {category}",
+            category=category,
+            model_id=model_id,
+            properties=properties or [],
+        ),
+        **kwargs,
+    )
+
+
+def fake_property(
+    pk: str, category: str, part_id: str, model_id: Optional[str] = None, **kwargs
+) -> Dict:
+    """Create the json of a property, as provided by KE-chain, for offline testing."""
+    return dict(
+        dict(
+            id=pk,
+            name=f"Property {category}",
+            category=category,
+            part_id=part_id,
+            model_id=model_id,
+            property_type=PropertyType.CHAR_VALUE,
+        ),
+        **kwargs,
+    )
+
+
+def fake_activity(pk: str, **kwargs) -> Dict:
+    """Create the json of an activity, as provided by KE-chain, for offline testing."""
+    return dict(
+        dict(
+            id=pk,
+            name="Activity",
+            activity_type=ActivityType.TASK,
+            classification=ActivityClassification.WORKFLOW,
+        ),
+        **kwargs,
+    )